@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
+import copy
 import os
 import json
 import re
 import socket
+import selectors
 import subprocess
 import shutil
+import tempfile
 import shlex
-import multiprocessing
-from concurrent.futures import ThreadPoolExecutor
+import fcntl
+import struct
+import functools
+import itertools
+import gzip
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as futures_wait, TimeoutError as FutureTimeoutError
+import http.client
 import urllib.request
 import urllib.error
 from pathlib import Path
@@ -16,6 +24,11 @@ import uuid
 from datetime import datetime
 import threading
 
+try:
+    import orjson  # optional (python3-orjson): schnelleres JSON für Cache-/State-Dateien
+except ImportError:
+    orjson = None
+
 from flask import (
     Flask,
     request,
@@ -29,11 +42,30 @@ from flask import (
     flash,
     Response,
     stream_with_context,
-    has_request_context,)
+    has_request_context,
+    g,
+    make_response,)
 
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('AUTODARTS_WEB_SECRET', 'autodarts-web-admin')
+# Kompilierte Templates behalten (kein mtime-Check je render_template); Änderungen greifen nach Neustart
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+# Kompilat zusätzlich als Bytecode ablegen: nach einem Dienst-Neustart (z.B. "Webpanel aktualisieren")
+# entfällt so das Parsen/Kompilieren, solange sich das Template nicht ändert.
+# Bevorzugt unter /var/cache (übersteht Reboot/PrivateTmp), sonst Jinja-Standard $TMPDIR/_jinja2-cache-<uid>
+JINJA_CACHE_DIR = os.environ.get("AUTODARTS_WEB_JINJA_CACHE", "/var/cache/autodarts-webpanel/jinja")
+try:
+    from jinja2 import FileSystemBytecodeCache
+    try:
+        os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+        if not os.access(JINJA_CACHE_DIR, os.W_OK):
+            raise PermissionError(JINJA_CACHE_DIR)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR, "%s.cache")
+    except Exception:
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+except Exception:
+    pass
 
 # === KONFIGURATION ===
 
@@ -41,7 +73,6 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 AUTODARTS_DATA_DIR = os.environ.get("AUTODARTS_DATA_DIR", "/home/peter/autodarts-data")
 DATA_DIR = Path(AUTODARTS_DATA_DIR).resolve()
-DATA_DIR.mkdir(parents=True, exist_ok=True)
 HELP_PDF_FILENAME = "Autodarts_install_manual.pdf"
 
 LANG_JSON_DIR = Path(BASE_DIR) / "static" / "lang"
@@ -53,16 +84,20 @@ CAMERA_MODE_SESSION = uuid.uuid4().hex
 # Streams a limited set of systemd units to the browser (admin-only).
 # We redact obvious secrets (password/token) before sending.
 ALLOWED_JOURNAL_UNITS = {"darts-caller.service", "darts-wled.service"}
+_RE_JOURNAL_SECRETS = (
+    # Hide CLI secrets we commonly pass to darts-caller (e.g. -P password, -U email)
+    re.compile(r"(?i)(\s-[Pp]\s+)(\S+)"),
+    re.compile(r"(?i)(\s-[Uu]\s+)(\S+)"),
+    # Generic patterns
+    re.compile(r"(?i)(\bpassword\b\s*[:=]\s*)(\S+)"),
+    re.compile(r"(?i)(\btoken\b\s*[:=]\s*)(\S+)"),
+)
 
 def redact_journal_line(line: str) -> str:
     if not line:
         return line
-    # Hide CLI secrets we commonly pass to darts-caller (e.g. -P password, -U email)
-    line = re.sub(r"(?i)(\s-[Pp]\s+)(\S+)", r"\1***", line)
-    line = re.sub(r"(?i)(\s-[Uu]\s+)(\S+)", r"\1***", line)
-    # Generic patterns
-    line = re.sub(r"(?i)(\bpassword\b\s*[:=]\s*)(\S+)", r"\1***", line)
-    line = re.sub(r"(?i)(\btoken\b\s*[:=]\s*)(\S+)", r"\1***", line)
+    for rx in _RE_JOURNAL_SECRETS:
+        line = rx.sub(r"\1***", line)
     return line
 
 
@@ -129,6 +164,37 @@ AUTODARTS_LAST_VERSION_FILE = "/var/lib/autodarts/autodarts-last-version.json"
 _AUTODARTS_LATEST_CACHE = {"ts": 0.0, "ver": None}
 _SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(?:-(?:beta|alpha)\.\d+)?$")
 
+# Einmal kompilierte Muster für die Status-Helper (ip route / iw / ufw / v4l2-ctl)
+_RE_ROUTE_DEV = re.compile(r"\bdev\s+(\S+)")
+_RE_ROUTE_GW = re.compile(r"default\s+via\s+(\d+\.\d+\.\d+\.\d+)")
+_RE_ROUTE_VIA = re.compile(r"\bvia\s+(\d+\.\d+\.\d+\.\d+)")
+_RE_IW_SIGNAL = re.compile(r"signal:\s*(-?\d+)\s*dBm")
+_RE_UFW_STATUS = re.compile(r"Status:\s*(\w+)", re.IGNORECASE)
+_RE_V4L2_FMT = re.compile(r"(?:Pixel\s+Format:\s+\'([A-Z0-9]+)\'|\[\d+\]:\s+\'([A-Z0-9]+)\')")
+_RE_V4L2_SIZE = re.compile(r"Size:\s+Discrete\s+(\d+)x(\d+)")
+# Kamera-Heuristik (Teilstring-Suche auf lower-case Namen, je eine Regex statt any(... in ...))
+_RE_CAM_BAD = re.compile(r"codec|isp|rpivid|v4l2loopback|loopback|virtual|m2m|mem2mem|decoder|encoder")
+_RE_CAM_GOOD = re.compile(r"camera|webcam|uvc|unicam|csi|ov|imx|ar|gc|s5k")
+_RE_CAM_GROUP_USB = re.compile(r"usb|uvc|webcam|camera")
+_RE_CAM_SENSOR = re.compile(r"ov|imx|ar|gc|s5k|unicam|csi")
+_RE_V4L2_DINFO = re.compile(r"^\s*(Driver name|Card type|Bus info)\s*:\s*(.+?)\s*$", re.M | re.I)
+_RE_WEPS_LINE = re.compile(rb"^([ \t]*)-WEPS\b([^\n]*)$", re.M)
+_RE_EXECSTART_PATH = re.compile(r"/[^\s;]+")
+_RE_AD_VERSION = re.compile(r"(\d+\.\d+\.\d+(?:-[A-Za-z0-9.]+)?)")
+# Sanitizer für Kamera-Keys, Sprachcodes, Flaggen und Unit-Namen
+_RE_CAM_KEY_BAD = re.compile(r"[^a-z0-9._-]+")
+_RE_UNDERSCORES = re.compile(r"_+")
+_RE_LANG_CODE_BAD = re.compile(r"[^a-z0-9_]")
+_RE_FLAG_BAD = re.compile(r"[^a-z0-9_-]")
+_RE_UNIT_SUFFIX_BAD = re.compile(r"[^a-zA-Z0-9_.-]+")
+# WLED-Presets in start-custom.sh (Textzeilen, siehe _wled_presets_*)
+_RE_WEPS_START = re.compile(r"^\s*-WEPS\b")
+_RE_WEPS_VALUE = re.compile(r"^-WEPS\s+(.*)$")
+_RE_WLED_ARG = re.compile(r"^-[A-Za-z0-9]+\b")
+_RE_WLED_PRESET_RANGE = re.compile(r'^(-A\d+)\s+(\d+)-(\d+)\s+"ps\|(\d+)(?:\|([^\"]+))?"$')
+_RE_WLED_PRESET_SCORE = re.compile(r'^(-S(\d+))\s+"ps\|(\d+)(?:\|([^\"]+))?"$')
+_RE_WLED_PRESET_FIXED = re.compile(r'^(-[A-Z0-9]+)\s+"ps\|(\d+)(?:\|([^\"]+))?"$')
+
 def _menu_token(raw: str) -> str:
     s = (raw or "").strip()
     low = s.lower()
@@ -343,7 +409,7 @@ def load_settings() -> dict:
             return "Beta"
         if low in ("latest", "aktuellste", "neueste", "neuste"):
             return "Aktuellste"
-        if re.match(r"^\d+\.\d+\.\d+(?:-(?:beta|alpha)\.\d+)?$", v):
+        if _SEMVER_RE.match(v):
             return v
         return ""
 
@@ -365,10 +431,24 @@ def load_settings() -> dict:
     return merged
 
 
+# --- Bootstrap (Verzeichnisse anlegen) ---
+# mkdir(exist_ok=True) ist idempotent und billig: bei jedem Start prüfen, auch nach geändertem
+# AUTODARTS_DATA_DIR oder gelöschtem Datenordner.
+def _bootstrap() -> None:
+    for d in (DATA_DIR, Path(STATE_DIR), Path(SETTINGS_PATH).parent):
+        try:
+            d.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+
+_bootstrap()
+
+
 # --- Settings (werden automatisch neu geladen, wenn sich webpanel-settings.json ändert) ---
 SETTINGS = load_settings()
 ADMIN_PASSWORD = SETTINGS.get("admin_password", "admin")
 AP_SSID_CHOICES = SETTINGS.get("ap_ssid_choices", [])
+AP_SSID_CHOICES_SET = frozenset(AP_SSID_CHOICES)  # nur für Membership-Checks, Liste bleibt für das Dropdown
 
 _SETTINGS_MTIME = None
 
@@ -379,12 +459,13 @@ def _settings_mtime():
         return None
 
 def refresh_settings_if_needed(force: bool = False) -> None:
-    global SETTINGS, ADMIN_PASSWORD, AP_SSID_CHOICES, _SETTINGS_MTIME
+    global SETTINGS, ADMIN_PASSWORD, AP_SSID_CHOICES, AP_SSID_CHOICES_SET, _SETTINGS_MTIME
     mt = _settings_mtime()
     if force or (mt != _SETTINGS_MTIME):
         SETTINGS = load_settings()
         ADMIN_PASSWORD = SETTINGS.get("admin_password", ADMIN_PASSWORD)
         AP_SSID_CHOICES = SETTINGS.get("ap_ssid_choices", AP_SSID_CHOICES)
+        AP_SSID_CHOICES_SET = frozenset(AP_SSID_CHOICES)
         _SETTINGS_MTIME = mt
 
 def get_autodarts_versions_choices() -> list[dict]:
@@ -400,16 +481,187 @@ def get_autodarts_versions_choices() -> list[dict]:
 def _autoload_settings():
     refresh_settings_if_needed()
 
-AUTODARTS_VERSION_CACHE = {"ts": 0.0, "v": None}
+
+# --- gzip für HTML/CSS/JSON (langsames 2.4GHz-WLAN zum Handy: Übertragung dominiert) ---
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+GZIP_MIMETYPES = ("text/html", "text/css", "text/javascript", "application/javascript", "application/json")
+
+@app.after_request
+def _gzip_response(resp):
+    try:
+        if resp.direct_passthrough or resp.is_streamed:
+            return resp  # send_file / SSE nicht anfassen
+        if resp.status_code < 200 or resp.status_code >= 300 or "Content-Encoding" in resp.headers:
+            return resp
+        if resp.mimetype not in GZIP_MIMETYPES:
+            return resp
+        if "gzip" not in (request.headers.get("Accept-Encoding") or "").lower():
+            return resp
+        data = resp.get_data()
+        if len(data) < GZIP_MIN_BYTES:
+            return resp
+        resp.set_data(gzip.compress(data, GZIP_LEVEL))
+        resp.headers["Content-Encoding"] = "gzip"
+        resp.vary.add("Accept-Encoding")
+    except Exception:
+        pass
+    return resp
+
+# --- statische Dateien: url_for('static') hängt ?v=<mtime> an, solche URLs darf der Browser 1 Jahr cachen ---
+# (Webpanel-Update tauscht die Dateien -> neue mtime -> neue URL). Ohne v (z.B. url() im CSS): Flask-Default.
+STATIC_VERSIONED_MAX_AGE = 31536000
+
+
+@functools.lru_cache(maxsize=256)
+def _static_file_version(filename: str) -> str | None:
+    try:
+        return str(int(os.stat(os.path.join(app.static_folder, filename)).st_mtime))
+    except Exception:
+        return None
+
+
+@app.url_defaults
+def _static_cache_bust(endpoint, values):
+    if endpoint == "static" and "v" not in values:
+        v = _static_file_version(str(values.get("filename") or ""))
+        if v:
+            values["v"] = v
+
+
+@app.after_request
+def _static_cache_headers(resp):
+    if request.endpoint == "static" and request.args.get("v") and resp.status_code in (200, 304):
+        resp.cache_control.no_cache = None  # Flask-Default (SEND_FILE_MAX_AGE_DEFAULT=None) ersetzen
+        resp.cache_control.public = True
+        resp.cache_control.max_age = STATIC_VERSIONED_MAX_AGE
+    return resp
+
+AUTODARTS_VERSION_CACHE = {"ts": 0.0, "v": None, "path": None, "mtime": None}
 AUTODARTS_VERSION_CACHE_TTL_SEC = 10.0
 
 # === leichte Caches für Statusdaten (reduziert subprocess-Last) ===
-INDEX_STATS_CACHE = {'ts': 0.0, 'data': None}
+INDEX_STATS_CACHE = {'ts': 0.0, 'data': None, 'res': {}}
 INDEX_STATS_TTL_SEC = 2.0  # Startseite: Statuswerte max. alle 2s neu holen
+INDEX_STATS_RESULT_TIMEOUT_SEC = 2.0
+_STATS_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="stats")
+# Netzwerk-Checks (WLED-Erreichbarkeit): ein Pool statt Threads je Aufruf (Ping-Tests: eigener _PING_POOL)
+_NET_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="net")
 
 WIFI_SIGNAL_CACHE = {'ts': 0.0, 'v': None}
 WIFI_SIGNAL_CACHE_TTL_SEC = 5.0  # Signalstärke nur auf Knopfdruck, kurz cachen
 
+# Mehrere Worker-Threads (waitress): ts/Wert immer gemeinsam lesen/schreiben
+_STATUS_CACHE_LOCK = threading.Lock()
+
+# Kurzer TTL-Cache für einzelne Status-Helper (nmcli/systemctl/ip), damit parallel
+# gerenderte Seiten/APIs nicht jeweils eigene Subprozesse starten.
+# Name -> TTL in Sekunden (Name ist auch der Schlüssel für _invalidate()).
+CACHE_TTLS = {
+    "wifi_status": 2.0,
+    "wifi_active_conn": 2.0,
+    "wifi_dongle_present": 5.0,
+    "ap_ssid": 10.0,
+    "autodarts_active": 2.0,
+    "system_stats": 1.5,
+    "default_route": 5.0,
+    "autodarts_paths": 60.0,
+    "webpanel_version": 30.0,
+    "service_files": 10.0,
+    "index_files": 30.0,
+}
+_TTL_CACHE: dict[tuple, tuple[float, object]] = {}
+_TTL_CACHE_LOCK = threading.Lock()
+
+def _ttl_cache(name: str):
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args):
+            key = (name, fn.__name__, args)
+            now = time.monotonic()
+            with _TTL_CACHE_LOCK:
+                hit = _TTL_CACHE.get(key)
+            if hit is not None and (now - hit[0]) < CACHE_TTLS.get(name, 0.0):
+                return hit[1]
+            val = fn(*args)
+            with _TTL_CACHE_LOCK:
+                _TTL_CACHE[key] = (now, val)
+            return val
+        return wrapper
+    return deco
+
+def _invalidate(*names: str) -> None:
+    """Cache-Einträge nach Änderungen (nmcli/systemctl) verwerfen – inkl. Fehler-Backoff."""
+    with _TTL_CACHE_LOCK:
+        for key in [k for k in _TTL_CACHE if k[0] in names]:
+            _TTL_CACHE.pop(key, None)
+    _backoff_clear()
+
+
+# Fehler-Backoff: hängt nmcli/ufw (Dienst down, sudo will Passwort, ...), nicht bei jedem Request
+# erneut den vollen Timeout abwarten. Schlüssel = (Programm, erstes Sub-Kommando), z.B. ("nmcli", "device").
+FAIL_BACKOFF_SECONDS = 30.0
+_FAIL_BACKOFF: dict[tuple[str, str], tuple[float, str]] = {}
+_FAIL_BACKOFF_LOCK = threading.Lock()
+
+
+# Globale Optionen mit Wert (nmcli -f FIELDS, -g, -w 10, ...): der Wert ist kein Sub-Kommando
+_BACKOFF_OPTS_WITH_VALUE = frozenset((
+    "-f", "--fields", "-g", "--get-values", "-e", "--escape",
+    "-c", "--colors", "-m", "--mode", "-w", "--wait",
+))
+
+
+def _backoff_key(cmd: list[str]) -> tuple[str, str]:
+    args = list(cmd)
+    if args[:2] == ["sudo", "-n"]:
+        args = args[2:]
+    tool = os.path.basename(args[0]) if args else ""
+    sub = ""
+    it = iter(args[1:])
+    for a in it:
+        if a in _BACKOFF_OPTS_WITH_VALUE:
+            next(it, None)
+        elif not a.startswith("-"):
+            sub = a
+            break
+    return tool, sub
+
+
+def _backoff_active(cmd: list[str]) -> bool:
+    with _FAIL_BACKOFF_LOCK:
+        hit = _FAIL_BACKOFF.get(_backoff_key(cmd))
+    return hit is not None and (time.monotonic() - hit[0]) < FAIL_BACKOFF_SECONDS
+
+
+def _backoff_record(cmd: list[str], error: str | None) -> None:
+    """error=None: Kommando lief (egal mit welchem rc) -> Backoff aufheben."""
+    key = _backoff_key(cmd)
+    with _FAIL_BACKOFF_LOCK:
+        if error is None:
+            _FAIL_BACKOFF.pop(key, None)
+        else:
+            _FAIL_BACKOFF[key] = (time.monotonic(), error)
+
+
+def _backoff_clear(tool: str | None = None) -> None:
+    with _FAIL_BACKOFF_LOCK:
+        for key in [k for k in _FAIL_BACKOFF if tool is None or k[0] == tool]:
+            _FAIL_BACKOFF.pop(key, None)
+
+
+def _run_status_cmd(cmd: list[str], timeout: float) -> subprocess.CompletedProcess | None:
+    """subprocess.run für Status-Abfragen; None bei Timeout/fehlendem Programm oder aktivem Backoff."""
+    if _backoff_active(cmd):
+        return None
+    try:
+        r = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        _backoff_record(cmd, str(e))
+        return None
+    _backoff_record(cmd, None)
+    return r
+
 
 PI_MONITOR_SCRIPT = "/usr/local/bin/pi_monitor_test.sh"
 PI_MONITOR_CSV = "/var/log/pi_monitor_test.csv"
@@ -425,8 +677,358 @@ USR_LOCAL_BIN_DIR = "/usr/local/bin"
 # =====================
 
 
+# ---------------- JSON-Dateien ----------------
+
+def _json_read_file(path: str):
+    """JSON-Datei lesen (orjson wenn vorhanden). Wirft wie json.load (FileNotFoundError / JSONDecodeError)."""
+    # os.open/os.read statt open(): spart den io-Buffer-Layer, State-Files sind winzig
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            b = os.read(fd, 65536)
+            if not b:
+                break
+            chunks.append(b)
+    finally:
+        os.close(fd)
+    data = b"".join(chunks)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _jsonify_fast(obj):
+    """Wie jsonify(obj), aber mit orjson (C) für die oft gepollten Status-Endpunkte; ohne orjson: jsonify."""
+    if orjson is not None:
+        try:
+            return app.response_class(orjson.dumps(obj), mimetype="application/json")
+        except TypeError:
+            pass  # z.B. nicht-str Keys -> jsonify kann mehr
+    return jsonify(obj)
+
+
+def _json_write_file(path: str, obj) -> None:
+    """Atomar schreiben (tmp + os.replace): parallele Leser sehen nie eine halb geschriebene Datei."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# Geparste JSON-Dateien je Pfad, gültig solange (inode, mtime, size) gleich bleiben
+_JSON_FILE_CACHE: dict[str, tuple[tuple, object]] = {}
+_JSON_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _json_read_file_cached(path: str):
+    """Wie _json_read_file, parst aber nur neu, wenn sich die Datei geändert hat (ein stat() pro Aufruf).
+
+    Liefert eine Kopie – Aufrufer dürfen das Ergebnis verändern.
+    """
+    st = os.stat(path)
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    with _JSON_FILE_CACHE_LOCK:
+        hit = _JSON_FILE_CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        return copy.deepcopy(hit[1])
+    obj = _json_read_file(path)
+    with _JSON_FILE_CACHE_LOCK:
+        _JSON_FILE_CACHE[path] = (key, obj)
+    return copy.deepcopy(obj)
+
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    """Datei atomar ersetzen (tmp im selben Verzeichnis + os.replace); Rechte/Besitzer bleiben erhalten."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, (st.st_mode & 0o7777) if st is not None else 0o644)  # mkstemp legt 0600 an
+        if st is not None:
+            try:
+                os.chown(tmp, st.st_uid, st.st_gid)
+            except OSError:
+                pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _state_read(path: str) -> dict:
+    """State-/Cache-Datei lesen; {} wenn sie fehlt oder kaputt ist. Neu geparst wird nur eine geänderte Datei."""
+    try:
+        return _json_read_file_cached(path) or {}
+    except Exception:
+        return {}
+
+
+def _state_write(path: str, data: dict) -> None:
+    """State-/Cache-Datei schreiben (best effort, Fehler werden ignoriert)."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _json_write_file(path, data)
+    except Exception:
+        pass
+
+
+# ---------------- Subprozesse (async) ----------------
+
+@functools.cache
+def _asyncio():
+    """asyncio erst beim ersten nmcli-Fallback laden (ohne NM-Client wird es nie gebraucht)."""
+    import asyncio
+    return asyncio
+
+
+async def _arun(cmd: list[str], timeout: float) -> subprocess.CompletedProcess | None:
+    """Wie subprocess.run(capture_output=True, text=True), aber ohne einen Thread zu blockieren."""
+    if _backoff_active(cmd):
+        return None
+    asyncio = _asyncio()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except (FileNotFoundError, PermissionError) as e:
+        _backoff_record(cmd, str(e))
+        return None
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        _backoff_record(cmd, "timeout")
+        try:
+            proc.kill()
+            await proc.wait()
+        except Exception:
+            pass
+        return None
+    _backoff_record(cmd, None)
+    return subprocess.CompletedProcess(
+        cmd,
+        proc.returncode,
+        out.decode("utf-8", errors="replace"),
+        err.decode("utf-8", errors="replace"),
+    )
+
+
+def run_concurrently(cmds: list[list[str]], timeout: float = 1.5) -> list[subprocess.CompletedProcess | None]:
+    """Mehrere unabhängige Kommandos gleichzeitig starten (Gesamtdauer = langsamstes statt Summe).
+
+    None für Kommandos, die fehlen, fehlschlagen zu starten oder in den Timeout laufen.
+    """
+    asyncio = _asyncio()
+
+    async def _gather():
+        return await asyncio.gather(*(_arun(c, timeout) for c in cmds))
+    try:
+        return list(asyncio.run(_gather()))
+    except Exception:
+        return [None] * len(cmds)
+
+
 # ---------------- WLAN / AP ----------------
 
+# NetworkManager direkt über D-Bus (python3-gi + gir1.2-nm-1.0). Spart pro Statusabfrage
+# einen nmcli fork/exec. Fehlt gi (oder NM läuft nicht), bleibt alles beim nmcli-Weg.
+try:
+    import gi
+    gi.require_version("NM", "1.0")
+    from gi.repository import NM, GLib
+except Exception:
+    NM = None
+    GLib = None
+
+_NM_CLIENT = None
+_NM_LOCK = threading.Lock()  # NM.Client ist nicht thread-safe
+_NM_MUTATE_LOCK = threading.Lock()  # ändernde nmcli-Aufrufe (connect/modify/delete) nie parallel aus mehreren Tabs
+_NM_UNAVAILABLE = object()
+
+
+def _nm_client():
+    """Persistenter NM.Client mit abgearbeiteten D-Bus-Events (aktueller Stand) oder None."""
+    global _NM_CLIENT
+    if NM is None:
+        return None
+    if _NM_CLIENT is None:
+        _NM_CLIENT = NM.Client.new(None)
+    # Ohne laufende Mainloop: anstehende PropertiesChanged-Signale einmal abarbeiten
+    ctx = GLib.MainContext.default()
+    while ctx.pending():
+        ctx.iteration(False)
+    return _NM_CLIENT
+
+
+def _nm_query(fn):
+    """fn(client) ausführen; _NM_UNAVAILABLE, wenn D-Bus nicht nutzbar ist (-> nmcli Fallback)."""
+    if NM is None:
+        return _NM_UNAVAILABLE
+    with _NM_LOCK:
+        try:
+            client = _nm_client()
+            if client is None or not client.get_nm_running():
+                return _NM_UNAVAILABLE
+            return fn(client)
+        except Exception:
+            return _NM_UNAVAILABLE
+
+
+def _nm_bytes_to_str(b) -> str | None:
+    if b is None:
+        return None
+    try:
+        val = bytes(b.get_data()).decode("utf-8", errors="replace").strip()
+    except Exception:
+        return None
+    return val or None
+
+
+def _nm_device(client, iface: str):
+    for dev in client.get_devices() or []:
+        if dev.get_iface() == iface:
+            return dev
+    return None
+
+
+def _nm_wifi_status(client) -> tuple[str | None, str | None]:
+    dev = _nm_device(client, WIFI_INTERFACE)
+    if dev is None or dev.get_state() != NM.DeviceState.ACTIVATED:
+        return None, None
+    ssid = None
+    ap = dev.get_active_access_point() if hasattr(dev, "get_active_access_point") else None
+    if ap is not None:
+        ssid = _nm_bytes_to_str(ap.get_ssid())
+    ip = None
+    ip4 = dev.get_ip4_config()
+    if ip4 is not None:
+        addrs = ip4.get_addresses() or []
+        if addrs:
+            ip = addrs[0].get_address() or None
+    return ssid, ip
+
+
+def _nm_connection_ssid(client, conn_name: str) -> str | None:
+    conn = client.get_connection_by_id(conn_name)
+    if conn is None:
+        return None
+    s_wifi = conn.get_setting_wireless()
+    return _nm_bytes_to_str(s_wifi.get_ssid()) if s_wifi is not None else None
+
+
+def _nm_active_connection_name(client, iface: str) -> str | None:
+    dev = _nm_device(client, iface)
+    if dev is None:
+        return None
+    ac = dev.get_active_connection()
+    return (ac.get_id() or None) if ac is not None else None
+
+
+# --- NM-Signale spiegeln (statt Polling) ---
+# Ein Hintergrund-Thread mit eigener GLib-Mainloop hält WLAN-Status/SSID/IP/Signal des
+# WIFI_INTERFACE aktuell; die Getter lesen nur noch dieses Dict.
+_WIFI_STATE: dict = {}
+_WIFI_STATE_LOCK = threading.Lock()
+_NM_MONITOR_THREAD: threading.Thread | None = None
+_NM_MONITOR_START_LOCK = threading.Lock()
+
+
+def _wifi_state_from_device(dev) -> dict:
+    connected = dev.get_state() == NM.DeviceState.ACTIVATED
+    ap = dev.get_active_access_point() if connected else None
+    ssid = _nm_bytes_to_str(ap.get_ssid()) if ap is not None else None
+    signal = int(ap.get_strength()) if ap is not None else None
+    ip = None
+    ip4 = dev.get_ip4_config() if connected else None
+    if ip4 is not None:
+        addrs = ip4.get_addresses() or []
+        if addrs:
+            ip = addrs[0].get_address() or None
+    return {"ready": True, "connected": connected, "ssid": ssid, "ip": ip, "signal": signal}
+
+
+def _nm_monitor_main() -> None:
+    ctx = GLib.MainContext.new()
+    ctx.push_thread_default()
+    try:
+        client = NM.Client.new(None)
+    except Exception:
+        return
+
+    watch = {"dev": None, "ap": None}
+
+    def _refresh(*_args):
+        dev = watch["dev"]
+        if not client.get_nm_running():
+            new = {"ready": False}  # NM weg -> Getter fallen auf nmcli zurück
+        elif dev is None:
+            new = {"ready": True, "connected": False, "ssid": None, "ip": None, "signal": None}
+        else:
+            ap = dev.get_active_access_point()
+            if ap is not None and ap is not watch["ap"]:
+                ap.connect("notify::strength", _refresh)
+            watch["ap"] = ap
+            new = _wifi_state_from_device(dev)
+        with _WIFI_STATE_LOCK:
+            _WIFI_STATE.clear()
+            _WIFI_STATE.update(new)
+
+    def _bind(*_args):
+        dev = _nm_device(client, WIFI_INTERFACE)
+        if dev is not None and dev is not watch["dev"]:
+            for sig in ("state-changed", "notify::active-access-point", "notify::ip4-config"):
+                dev.connect(sig, _refresh)
+        watch["dev"] = dev
+        _refresh()
+
+    client.connect("device-added", _bind)
+    client.connect("device-removed", _bind)
+    client.connect("notify::nm-running", _bind)
+    _bind()
+    GLib.MainLoop(ctx).run()
+
+
+def _ensure_nm_monitor() -> None:
+    global _NM_MONITOR_THREAD
+    if NM is None or _NM_MONITOR_THREAD is not None:
+        return
+    with _NM_MONITOR_START_LOCK:
+        if _NM_MONITOR_THREAD is None:
+            _NM_MONITOR_THREAD = threading.Thread(target=_nm_monitor_main, name="nm-monitor", daemon=True)
+            _NM_MONITOR_THREAD.start()
+
+
+def _wifi_state_snapshot() -> dict | None:
+    """Gespiegelter WLAN-Status oder None (Monitor nicht verfügbar/noch nicht bereit)."""
+    _ensure_nm_monitor()
+    with _WIFI_STATE_LOCK:
+        return dict(_WIFI_STATE) if _WIFI_STATE.get("ready") else None
+
+
+@_ttl_cache("wifi_status")
 def get_wifi_status():
     """
     Liefert (ssid, ip) für den WLAN-Dongle (WIFI_INTERFACE) oder (None, None),
@@ -434,69 +1036,48 @@ def get_wifi_status():
 
     ssid = echte WLAN-SSID (Name des Routers), nicht nur der Verbindungsname.
     """
+    snap = _wifi_state_snapshot()
+    if snap is not None:
+        return (snap["ssid"], snap["ip"]) if snap["connected"] else (None, None)
+
+    res = _nm_query(_nm_wifi_status)
+    if res is not _NM_UNAVAILABLE:
+        return res
+
     ssid = None
     ip = None
     dev = WIFI_INTERFACE
-    conn_name = None
+    connected = False
 
-    # 1) herausfinden, ob das Interface verbunden ist und wie die Connection heißt
-    try:
-        result = subprocess.run(
-            ["nmcli", "-t", "-f", "DEVICE,STATE,CONNECTION", "device"],
-            capture_output=True,
-            text=True,
-            timeout=1.5,
-        )
-        if result.returncode == 0:
-            for line in result.stdout.splitlines():
-                parts = line.strip().split(":", 2)
-                if len(parts) >= 3 and parts[0] == dev:
-                    state = parts[1]
-                    conn_name = parts[2] or None
-                    if state != "connected":
-                        conn_name = None
-                    break
-    except Exception:
-        conn_name = None
-
-    if not conn_name:
+    # Status/Connection/IPv4 und SSID (Scan-Cache, --rescan no) gleichzeitig abfragen
+    dev_r, ssid_r = run_concurrently([
+        ["nmcli", "-t", "-f", "GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS", "device", "show", dev],
+        ["nmcli", "-t", "-f", "ACTIVE,SSID", "device", "wifi", "list", "ifname", dev, "--rescan", "no"],
+    ])
+    if dev_r is None or dev_r.returncode != 0:
         return None, None
 
-    # 2) SSID aus der Connection auslesen
-    try:
-        result = subprocess.run(
-            ["nmcli", "-t", "-f", "802-11-wireless.ssid", "connection", "show", conn_name],
-            capture_output=True,
-            text=True,
-            timeout=1.5,
-        )
-        if result.returncode == 0:
-            for line in result.stdout.splitlines():
-                if line.startswith("802-11-wireless.ssid:"):
-                    val = line.split(":", 1)[1].strip()
-                    if val:
-                        ssid = val
-                    break
-    except Exception:
-        pass
+    conn_name = None
+    for line in dev_r.stdout.splitlines():
+        key, _, val = line.partition(":")
+        val = val.strip()
+        if key == "GENERAL.STATE":
+            # z.B. "100 (connected)"
+            connected = val.startswith("100") or "(connected)" in val
+        elif key == "GENERAL.CONNECTION":
+            conn_name = val if val and val != "--" else None
+        elif key.startswith("IP4.ADDRESS") and val and ip is None:
+            ip = val.split("/", 1)[0]
+
+    if not connected or not conn_name:
+        return None, None
 
-    # 3) IPv4-Adresse auslesen
-    try:
-        result = subprocess.run(
-            ["nmcli", "-t", "-f", "IP4.ADDRESS", "device", "show", dev],
-            capture_output=True,
-            text=True,
-            timeout=1.5,
-        )
-        if result.returncode == 0:
-            for line in result.stdout.splitlines():
-                if line.startswith("IP4.ADDRESS"):
-                    ip_addr = line.split(":", 1)[1].strip()
-                    if ip_addr:
-                        ip = ip_addr.split("/", 1)[0]
-                    break
-    except Exception:
-        pass
+    if ssid_r is not None and ssid_r.returncode == 0:
+        for line in ssid_r.stdout.splitlines():
+            parts = _nmcli_terse_split(line)
+            if len(parts) >= 2 and parts[0].strip().lower() == "yes":
+                ssid = parts[1].strip() or None
+                break
 
     return ssid, ip
 
@@ -507,50 +1088,38 @@ def get_lan_status():
     """
     ip = None
 
-    try:
-        result = subprocess.run(
-            ["nmcli", "-t", "-f", "DEVICE,STATE", "device"],
-            capture_output=True,
-            text=True,
-            timeout=1.5,
-        )
-        if result.returncode != 0:
-            return None
+    # Status + IPv4 gleichzeitig abfragen (die IP wird nur genutzt, wenn eth0 verbunden ist)
+    state_r, ip_r = run_concurrently([
+        ["nmcli", "-t", "-f", "DEVICE,STATE", "device"],
+        ["nmcli", "-t", "-f", "IP4.ADDRESS", "device", "show", "eth0"],
+    ])
+    if state_r is None or state_r.returncode != 0:
+        return None
 
-        eth_connected = False
-        for line in result.stdout.splitlines():
-            parts = line.strip().split(":", 1)
-            if len(parts) >= 2 and parts[0] == "eth0":
-                if parts[1] == "connected":
-                    eth_connected = True
-                break
+    eth_connected = False
+    for line in state_r.stdout.splitlines():
+        parts = line.strip().split(":", 1)
+        if len(parts) >= 2 and parts[0] == "eth0":
+            if parts[1] == "connected":
+                eth_connected = True
+            break
 
-        if not eth_connected:
-            return None
-    except Exception:
+    if not eth_connected:
         return None
 
-    try:
-        result = subprocess.run(
-            ["nmcli", "-t", "-f", "IP4.ADDRESS", "device", "show", "eth0"],
-            capture_output=True,
-            text=True,
-            timeout=1.5,
-        )
-        if result.returncode == 0:
-            for line in result.stdout.splitlines():
-                if line.startswith("IP4.ADDRESS"):
-                    ip_addr = line.split(":", 1)[1].strip()
-                    if ip_addr:
-                        ip = ip_addr.split("/", 1)[0]
-                    break
-    except Exception:
-        pass
+    if ip_r is not None and ip_r.returncode == 0:
+        for line in ip_r.stdout.splitlines():
+            if line.startswith("IP4.ADDRESS"):
+                ip_addr = line.split(":", 1)[1].strip()
+                if ip_addr:
+                    ip = ip_addr.split("/", 1)[0]
+                break
 
     return ip
 
-def _get_default_route_interface() -> str | None:
-    """Return interface used for the default route (best proxy for "home network" interface)."""
+@_ttl_cache("default_route")
+def _get_default_route_info() -> tuple[str | None, str | None]:
+    """(Interface, Gateway) der Default-Route aus einem einzigen `ip route get` – gemeinsam gecacht."""
     try:
         r = subprocess.run(
             ["ip", "route", "get", "1.1.1.1"],
@@ -559,50 +1128,50 @@ def _get_default_route_interface() -> str | None:
             timeout=1.2,
         )
         if r.returncode != 0:
-            return None
+            return None, None
         # example: "1.1.1.1 via 192.168.1.1 dev wlan0 src 192.168.1.50 uid 1000"
-        m = re.search(r"\bdev\s+(\S+)", r.stdout or "")
-        if not m:
-            return None
-        dev = m.group(1).strip()
-        if dev == AP_INTERFACE:
-            return None
-        return dev
+        out = r.stdout or ""
+        m_dev = _RE_ROUTE_DEV.search(out)
+        m_gw = _RE_ROUTE_VIA.search(out)
+        return (m_dev.group(1).strip() if m_dev else None), (m_gw.group(1) if m_gw else None)
     except Exception:
+        return None, None
+
+
+def _get_default_route_interface() -> str | None:
+    """Return interface used for the default route (best proxy for "home network" interface)."""
+    dev = _get_default_route_info()[0]
+    if not dev or dev == AP_INTERFACE:
         return None
+    return dev
 
 
 def _get_connected_wifi_interface(prefer: str | None = None) -> str | None:
     """
-    Best-effort: return a connected WiFi interface (via nmcli), excluding the AP interface/profile.
+    Best-effort: return a connected WiFi interface (via NetworkManager D-Bus or nmcli), excluding the AP interface/profile.
     Preference order:
       1) 'prefer' if connected
       2) interface connected to WIFI_CONNECTION_NAME (e.g. Autodarts-Net)
       3) first connected WiFi excluding AP
     """
+    def _nm_connected(client) -> list[tuple[str, str]]:
+        out = []
+        for d in client.get_devices() or []:
+            if d.get_device_type() != NM.DeviceType.WIFI or d.get_state() != NM.DeviceState.ACTIVATED:
+                continue
+            ac = d.get_active_connection()
+            out.append((d.get_iface(), (ac.get_id() if ac is not None else "") or ""))
+        return out
+
     try:
-        r = subprocess.run(
-            ["nmcli", "-t", "-f", "DEVICE,TYPE,STATE,CONNECTION", "device"],
-            capture_output=True,
-            text=True,
-            timeout=1.5,
-        )
-        if r.returncode != 0:
+        connected = _nm_query(_nm_connected)
+        if connected is _NM_UNAVAILABLE:
+            connected = _nmcli_connected_wifi()
+        if connected is None:
             return None
 
-        connected: list[tuple[str, str]] = []
-        for line in (r.stdout or "").splitlines():
-            parts = line.split(":", 3)
-            if len(parts) != 4:
-                continue
-            dev, typ, state, conn = [p.strip() for p in parts]
-            if typ != "wifi" or state != "connected":
-                continue
-            # exclude AP interface / AP connection profile
-            if dev == AP_INTERFACE or conn == AP_CONNECTION_NAME:
-                continue
-            connected.append((dev, conn))
-
+        # exclude AP interface / AP connection profile
+        connected = [(dev, conn) for dev, conn in connected if dev != AP_INTERFACE and conn != AP_CONNECTION_NAME]
         if not connected:
             return None
 
@@ -619,35 +1188,59 @@ def _get_connected_wifi_interface(prefer: str | None = None) -> str | None:
     except Exception:
         return None
 
+
+def _nmcli_connected_wifi() -> list[tuple[str, str]] | None:
+    """(device, connection) aller verbundenen WiFi-Devices via nmcli, None bei Fehler."""
+    try:
+        r = _run_status_cmd(["nmcli", "-t", "-f", "DEVICE,TYPE,STATE,CONNECTION", "device"], timeout=1.5)
+        if r is None or r.returncode != 0:
+            return None
+
+        connected: list[tuple[str, str]] = []
+        for line in (r.stdout or "").splitlines():
+            parts = line.split(":", 3)
+            if len(parts) != 4:
+                continue
+            dev, typ, state, conn = [p.strip() for p in parts]
+            if typ != "wifi" or state != "connected":
+                continue
+            connected.append((dev, conn))
+        return connected
+    except Exception:
+        return None
+
+# Vorberechnete Umrechnung in Prozent (keine Float-Rundung pro Messung):
+# dBm -128..127 -> -90..-30 dBm linear auf 0..100 %, Link-Quality 0..70 -> 0..100 %
+_DBM_TO_PCT = tuple(max(0, min(100, round((dbm + 90) * 100 / 60))) for dbm in range(-128, 128))
+_LQ_TO_PCT = tuple(round(q * 100 / 70) for q in range(0, 71))
+
+
 def _wifi_signal_from_proc(iface: str) -> int | None:
     """
     Very lightweight signal read via /proc/net/wireless.
     Returns percent (0..100) or None if iface not present / not wireless.
     """
+    prefix = iface.encode() + b":"
     try:
-        with open("/proc/net/wireless", "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.read().splitlines()
-        for line in lines:
-            line = line.strip()
-            if not line.startswith(iface + ":"):
-                continue
-            # Example columns: iface: status link level noise ...
-            # link quality is usually 0..70 in column 2
-            parts = line.split()
-            if len(parts) < 3:
-                return None
-            # parts[1] is status, parts[2] is link quality (e.g. "70.")
-            q_str = parts[2].strip().rstrip(".")
-            q = float(q_str)
-            # Convert 0..70 to 0..100
-            pct = int(round((q / 70.0) * 100.0))
-            if pct < 0:
-                pct = 0
-            if pct > 100:
-                pct = 100
-            return pct
+        with open("/proc/net/wireless", "rb") as f:
+            # 2 Kopfzeilen überspringen, dann zeilenweise bis zum Interface
+            next(f, None)
+            next(f, None)
+            for line in f:
+                line = line.lstrip()
+                if not line.startswith(prefix):
+                    continue
+                # Example columns: iface: status link level noise ...
+                # link quality is usually 0..70 in column 2
+                parts = line.split()
+                if len(parts) < 3:
+                    return None
+                # parts[1] is status, parts[2] is link quality (e.g. "70.")
+                q = int(parts[2].split(b".", 1)[0] or 0)
+                return _LQ_TO_PCT[max(0, min(70, q))]
     except Exception:
         return None
+    return None
 
 
 def _wifi_signal_from_iw(iface: str) -> int | None:
@@ -664,17 +1257,12 @@ def _wifi_signal_from_iw(iface: str) -> int | None:
         out = (r.stdout or "").strip()
         if not out or "Not connected" in out:
             return None
-        m = re.search(r"signal:\s*(-?\d+)\s*dBm", out)
+        m = _RE_IW_SIGNAL.search(out)
         if not m:
             return None
         dbm = int(m.group(1))
         # Map -90..-30 dBm roughly to 0..100%
-        pct = int(round((dbm + 90) * 100 / 60))
-        if pct < 0:
-            pct = 0
-        if pct > 100:
-            pct = 100
-        return pct
+        return _DBM_TO_PCT[max(-128, min(127, dbm)) + 128]
     except FileNotFoundError:
         return None
     except Exception:
@@ -684,13 +1272,11 @@ def _wifi_signal_from_iw(iface: str) -> int | None:
 def _wifi_signal_from_nmcli(iface: str) -> int | None:
     """Fallback: nmcli scan-less signal strength (0..100)."""
     try:
-        r = subprocess.run(
+        r = _run_status_cmd(
             ["nmcli", "-t", "--rescan", "no", "-f", "IN-USE,SIGNAL,SSID", "device", "wifi", "list", "ifname", iface],
-            capture_output=True,
-            text=True,
             timeout=1.5,
         )
-        if r.returncode != 0:
+        if r is None or r.returncode != 0:
             return None
         for line in (r.stdout or "").splitlines():
             # Format usually: *:70:MyWifi
@@ -714,6 +1300,11 @@ def get_wifi_signal_percent() -> int | None:
       2) iw dev <iface> link (kein Scan)
       3) nmcli --rescan no (Fallback)
     """
+    # Über NM-Signale gespiegelt -> kein Subprozess nötig
+    snap = _wifi_state_snapshot() if WIFI_INTERFACE and WIFI_INTERFACE != AP_INTERFACE else None
+    if snap is not None and snap["connected"] and snap["signal"] is not None:
+        return snap["signal"]
+
     # Ziel: Heimnetz-Interface finden (wlan0), AP (wlan_ap) ignorieren
     home_iface = None
 
@@ -759,16 +1350,20 @@ def get_wifi_signal_percent() -> int | None:
     return None
 
 
+@_ttl_cache("wifi_dongle_present")
 def wifi_dongle_present() -> bool:
     """Prüft, ob der WLAN-USB-Dongle (WIFI_INTERFACE) als WiFi-Device beim NetworkManager sichtbar ist."""
+    def _nm_present(client) -> bool:
+        dev = _nm_device(client, WIFI_INTERFACE)
+        return dev is not None and dev.get_device_type() == NM.DeviceType.WIFI
+
+    res = _nm_query(_nm_present)
+    if res is not _NM_UNAVAILABLE:
+        return res
+
     try:
-        result = subprocess.run(
-            ["nmcli", "-t", "-f", "DEVICE,TYPE", "device"],
-            capture_output=True,
-            text=True,
-            timeout=1.5,
-        )
-        if result.returncode != 0:
+        result = _run_status_cmd(["nmcli", "-t", "-f", "DEVICE,TYPE", "device"], timeout=1.5)
+        if result is None or result.returncode != 0:
             return False
 
         for line in result.stdout.splitlines():
@@ -782,6 +1377,18 @@ def wifi_dongle_present() -> bool:
         return False
 
 
+# nmcli-Fehler, bei denen ein Dongle-Reset + zweiter Versuch sinnvoll ist (ein Durchlauf statt vieler "in"-Scans)
+_NMCLI_DEVICE_ERROR_RE = re.compile(
+    r"no suitable device"
+    r"|no wifi device"
+    r"|no device"
+    r"|device not available because profile is not compatible"
+    r"|profile is not compatible with device"
+    r"|mismatching interface name",
+    re.IGNORECASE,
+)
+
+
 def interpret_nmcli_error(stdout: str, stderr: str):
     """
     Macht aus der nmcli-Ausgabe eine verständliche Meldung + kurzen Debug-Hinweis.
@@ -809,33 +1416,72 @@ def interpret_nmcli_error(stdout: str, stderr: str):
     return user_msg + debug_msg
 
 
+SOFT_RESET_TIMEOUT = 3.0
+
+
+def _nm_disconnect_and_wait(client, iface: str, timeout: float) -> bool:
+    """Device trennen und auf DISCONNECTED warten (statt fester Pause). False, wenn das Device fehlt."""
+    dev = _nm_device(client, iface)
+    if dev is None:
+        return False
+    done = (NM.DeviceState.DISCONNECTED, NM.DeviceState.UNAVAILABLE, NM.DeviceState.UNMANAGED)
+    if dev.get_state() in done:
+        return True
+
+    ctx = GLib.MainContext.default()
+    expired = []
+    src = GLib.timeout_add(int(timeout * 1000), lambda: expired.append(True))  # None -> einmalig
+    dev.disconnect_async(None, None, None)
+    # Zwischenzustände (DEACTIVATING, ...) abwarten; der Timeout-Source weckt iteration() spätestens am Deadline
+    while dev.get_state() not in done and not expired:
+        ctx.iteration(True)
+    if not expired:
+        GLib.source_remove(src)
+    return True
+
+
+def is_wifi_busy() -> bool:
+    """True, solange eine eigene WLAN-Änderung (nmcli connect/modify/delete) läuft.
+
+    NM-Zwischenzustände (NEED_AUTH nach falschem Passwort, Autoconnect-Wiederholungen) zählen
+    bewusst nicht: genau dann muss der User neue Zugangsdaten absenden können (Soft-Reset davor).
+    """
+    return _NM_MUTATE_LOCK.locked()
+
+
 def soft_reset_wifi_dongle():
     """
     Resetet nur den WLAN-Client (USB-Dongle, WIFI_INTERFACE),
     ohne den Access-Point (AP_INTERFACE) zu beeinflussen.
     """
-    try:
-        subprocess.run(
-            ["nmcli", "device", "disconnect", WIFI_INTERFACE],
-            capture_output=True,
-            text=True,
-        )
-    except Exception:
-        pass
-
-    time.sleep(3)
+    res = _nm_query(lambda client: _nm_disconnect_and_wait(client, WIFI_INTERFACE, SOFT_RESET_TIMEOUT))
+    if res is _NM_UNAVAILABLE or res is False:
+        try:
+            # --wait: nmcli kehrt zurück, sobald das Device getrennt ist (max. SOFT_RESET_TIMEOUT)
+            subprocess.run(
+                ["nmcli", "--wait", str(int(SOFT_RESET_TIMEOUT)), "device", "disconnect", WIFI_INTERFACE],
+                capture_output=True,
+                text=True,
+                timeout=SOFT_RESET_TIMEOUT + 2.0,
+            )
+        except Exception:
+            pass
+    _invalidate("wifi_status", "wifi_active_conn", "default_route")
 
 
+@_ttl_cache("ap_ssid")
 def get_ap_ssid():
     """Liefert die aktuelle SSID des Access-Points (AP_CONNECTION_NAME) oder None."""
+    res = _nm_query(lambda client: _nm_connection_ssid(client, AP_CONNECTION_NAME))
+    if res is not _NM_UNAVAILABLE:
+        return res
+
     try:
-        result = subprocess.run(
+        result = _run_status_cmd(
             ["nmcli", "-t", "-f", "802-11-wireless.ssid", "connection", "show", AP_CONNECTION_NAME],
-            capture_output=True,
-            text=True,
             timeout=1.5,
         )
-        if result.returncode != 0:
+        if result is None or result.returncode != 0:
             return None
 
         for line in result.stdout.splitlines():
@@ -850,21 +1496,99 @@ def get_ap_ssid():
 
 # ---------------- System / Stats ----------------
 
+@_ttl_cache("autodarts_active")
 def is_autodarts_active() -> bool:
+    return _systemd_active_state(AUTODARTS_SERVICE, timeout=1.0) == "active"
+
+
+def _available_cpu_count() -> int:
+    # CPUs, die dieser Prozess wirklich nutzen darf (Affinity/cgroup-cpuset), nicht die der Maschine
     try:
-        r = subprocess.run(
-            ["systemctl", "is-active", AUTODARTS_SERVICE],
-            capture_output=True,
-            text=True,
-            timeout=1.0,
-        )
-        return r.stdout.strip() == "active"
+        return len(os.sched_getaffinity(0)) or 1
     except Exception:
-        return False
+        return os.cpu_count() or 1
+
+
+_CPU_COUNT = _available_cpu_count()
+_MEM_TOTAL_KB: int | None = None  # ändert sich zur Laufzeit nicht -> einmal lesen
+
+
+def _read_meminfo_kb() -> tuple[int | None, int | None]:
+    """(MemTotal, MemAvailable) in kB; liest /proc/meminfo nur bis zum benötigten Feld."""
+    global _MEM_TOTAL_KB
+    total = _MEM_TOTAL_KB
+    avail = None
+    with open("/proc/meminfo", "r") as f:
+        for line in f:
+            if total is None and line.startswith("MemTotal:"):
+                total = int(line.split()[1])
+            elif line.startswith("MemAvailable:"):
+                avail = int(line.split()[1])
+            if total is not None and avail is not None:
+                break
+    if total is not None:
+        _MEM_TOTAL_KB = total
+    return total, avail
+
+
+# psutil (python3-psutil) ist optional: echte CPU-Auslastung + kein vcgencmd-Fork
+try:
+    import psutil
+    psutil.cpu_percent(interval=None)  # Referenzwert setzen, sonst liefert der erste Aufruf 0.0
+except Exception:
+    psutil = None
 
 
+def _system_stats_psutil():
+    """(cpu_pct, mem_used, mem_total, temp_c) via psutil oder None."""
+    if psutil is None:
+        return None
+    try:
+        cpu_pct = round(float(psutil.cpu_percent(interval=None)), 1)
+        vm = psutil.virtual_memory()
+        mem_total = round(vm.total / 1024 / 1024 / 1024, 2)
+        mem_used = round((vm.total - vm.available) / 1024 / 1024 / 1024, 2)
+    except Exception:
+        return None
+
+    temp_c = None
+    try:
+        temps = psutil.sensors_temperatures() or {}
+        for name in ("cpu_thermal", "cpu-thermal", "soc_thermal", "coretemp"):
+            if temps.get(name):
+                temp_c = float(temps[name][0].current)
+                break
+        if temp_c is None:
+            for entries in temps.values():
+                if entries:
+                    temp_c = float(entries[0].current)
+                    break
+    except Exception:
+        temp_c = None
+    if temp_c is None:
+        temp_c = _read_thermal_zone_temp()
+    return cpu_pct, mem_used, mem_total, temp_c
+
+
+THERMAL_ZONE_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
+
+def _read_thermal_zone_temp() -> float | None:
+    """SoC-Temperatur aus sysfs (milli-°C) – auf dem Pi derselbe Wert wie vcgencmd, aber ohne fork."""
+    try:
+        with open(THERMAL_ZONE_PATH, "rb") as f:
+            return int(f.read().strip()) / 1000.0
+    except Exception:
+        return None
+
+
+@_ttl_cache("system_stats")
 def get_system_stats():
     """CPU-Last (grob), RAM und Temperatur."""
+    stats = _system_stats_psutil()
+    if stats is not None:
+        return stats
+
     cpu_pct = None
     mem_used = None
     mem_total = None
@@ -874,24 +1598,13 @@ def get_system_stats():
     try:
         with open("/proc/loadavg", "r") as f:
             load1 = float(f.read().split()[0])
-        cores = multiprocessing.cpu_count()
-        cpu_pct = round(min(100.0, (load1 / cores) * 100.0), 1)
+        cpu_pct = round(min(100.0, (load1 / _CPU_COUNT) * 100.0), 1)
     except Exception:
         pass
 
     # RAM
     try:
-        with open("/proc/meminfo", "r") as f:
-            data = f.read().splitlines()
-        kv = {}
-        for line in data:
-            parts = line.split(":")
-            if len(parts) == 2:
-                key = parts[0].strip()
-                val = parts[1].strip().split()[0]
-                kv[key] = int(val)
-        mem_total_kb = kv.get("MemTotal")
-        mem_avail_kb = kv.get("MemAvailable")
+        mem_total_kb, mem_avail_kb = _read_meminfo_kb()
         if mem_total_kb and mem_avail_kb:
             mem_used_kb = mem_total_kb - mem_avail_kb
             mem_total = round(mem_total_kb / 1024 / 1024, 2)
@@ -899,28 +1612,23 @@ def get_system_stats():
     except Exception:
         pass
 
-    # Temperatur
-    try:
-        out = subprocess.run(
-            ["vcgencmd", "measure_temp"],
-            capture_output=True,
-            text=True,
-            timeout=1.0,
-        )
-        if out.returncode == 0:
-            s = out.stdout.strip()
-            if "temp=" in s and "'C" in s:
-                val = s.split("temp=")[1].split("'C")[0]
-                temp_c = float(val)
-    except FileNotFoundError:
-        pass
-    except Exception:
-        pass
-
+    # Temperatur: erst sysfs, vcgencmd (fork + Firmware-Mailbox) nur als Fallback
+    temp_c = _read_thermal_zone_temp()
     if temp_c is None:
         try:
-            with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                temp_c = int(f.read().strip()) / 1000.0
+            out = subprocess.run(
+                ["vcgencmd", "measure_temp"],
+                capture_output=True,
+                text=True,
+                timeout=1.0,
+            )
+            if out.returncode == 0:
+                s = out.stdout.strip()
+                if "temp=" in s and "'C" in s:
+                    val = s.split("temp=")[1].split("'C")[0]
+                    temp_c = float(val)
+        except FileNotFoundError:
+            pass
         except Exception:
             pass
 
@@ -933,19 +1641,42 @@ def get_index_stats_cached():
     """
     now = time.time()
     try:
-        if INDEX_STATS_CACHE.get('data') and (now - float(INDEX_STATS_CACHE.get('ts', 0.0))) < INDEX_STATS_TTL_SEC:
-            return INDEX_STATS_CACHE['data']
+        with _STATUS_CACHE_LOCK:
+            if INDEX_STATS_CACHE.get('data') and (now - float(INDEX_STATS_CACHE.get('ts', 0.0))) < INDEX_STATS_TTL_SEC:
+                return INDEX_STATS_CACHE['data']
     except Exception:
         pass
 
-    ssid, ip = get_wifi_status()
-    lan_ip = get_lan_status()
+    # Die Helper sind voneinander unabhängig und warten fast nur auf Subprozesse -> parallel starten
+    jobs = {
+        "wifi": (get_wifi_status, (None, None)),
+        "lan": (get_lan_status, None),
+        "ad_active": (is_autodarts_active, False),
+        "ad_version": (get_autodarts_version, None),
+        "ap_ssid": (get_ap_ssid, None),
+        "uplink": (get_ping_uplink_interface, None),
+    }
+    futures = {k: _STATS_POOL.submit(fn) for k, (fn, _default) in jobs.items()}
+    # Ein gemeinsames Zeitbudget für alle Jobs (nicht je Job nacheinander)
+    futures_wait(futures.values(), timeout=INDEX_STATS_RESULT_TIMEOUT_SEC)
+    last = INDEX_STATS_CACHE.get('res') or {}
+    res = {}
+    for k, fut in futures.items():
+        try:
+            if not fut.done():
+                raise FutureTimeoutError()
+            res[k] = fut.result()
+        except Exception:
+            # zu langsam/Fehler: letzter bekannter Wert, sonst Default
+            res[k] = last.get(k, jobs[k][1])
 
-    autodarts_active = is_autodarts_active()
-    autodarts_version = get_autodarts_version()
-    cpu_pct, mem_used, mem_total, temp_c = get_system_stats()
-    current_ap_ssid = get_ap_ssid()
-    ping_uplink_iface = get_ping_uplink_interface()
+    ssid, ip = res["wifi"]
+    lan_ip = res["lan"]
+
+    autodarts_active = res["ad_active"]
+    autodarts_version = res["ad_version"]
+    current_ap_ssid = res["ap_ssid"]
+    ping_uplink_iface = res["uplink"]
     net_ok = bool(ping_uplink_iface)
     ping_uplink_label = ping_iface_label(ping_uplink_iface) if ping_uplink_iface else ""
 
@@ -958,14 +1689,15 @@ def get_index_stats_cached():
     data = (
         ssid, ip, lan_ip,
         autodarts_active, autodarts_version,
-        cpu_pct, mem_used, mem_total, temp_c,
         wifi_ok, lan_ok, dongle_ok,
         net_ok, ping_uplink_label,
         current_ap_ssid,
     )
     try:
-        INDEX_STATS_CACHE['ts'] = now
-        INDEX_STATS_CACHE['data'] = data
+        with _STATUS_CACHE_LOCK:
+            INDEX_STATS_CACHE['ts'] = now
+            INDEX_STATS_CACHE['data'] = data
+            INDEX_STATS_CACHE['res'] = res
     except Exception:
         pass
     return data
@@ -977,16 +1709,14 @@ def get_index_stats_cached():
 
 def load_cam_config():
     try:
-        with open(CAM_CONFIG_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _json_read_file(CAM_CONFIG_PATH)
     except (FileNotFoundError, json.JSONDecodeError):
         return {}
 
 
 def save_cam_config(config: dict):
     os.makedirs(os.path.dirname(CAM_CONFIG_PATH), exist_ok=True)
-    with open(CAM_CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    _json_write_file(CAM_CONFIG_PATH, config)
 
 
 
@@ -1014,11 +1744,16 @@ def _set_camera_mode_state(cfg: dict, enabled: bool):
 # --- V4L2 Probe Helpers (robustere Kamera-Auswahl & bessere Fehlermeldungen) ---
 V4L2CTL_TIMEOUT = 1.5
 
+_V4L2CTL_PATH = shutil.which("v4l2-ctl")  # einmal auflösen; fehlt es, gar nicht erst forken
+
+
 def _v4l2ctl(args: list[str], timeout: float = V4L2CTL_TIMEOUT):
     """Run v4l2-ctl with timeout; returns CompletedProcess or None."""
+    if not _V4L2CTL_PATH:
+        return None
     try:
         return subprocess.run(
-            ["v4l2-ctl", *args],
+            [_V4L2CTL_PATH, *args],
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -1026,6 +1761,110 @@ def _v4l2ctl(args: list[str], timeout: float = V4L2CTL_TIMEOUT):
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return None
 
+# V4L2 UAPI (linux/videodev2.h): direkt per ioctl statt v4l2-ctl zu forken.
+# _IOR/_IOWR('V', nr, struct) mit den Struct-Größen 104 / 64 / 44 Bytes.
+VIDIOC_QUERYCAP = 0x80685600
+VIDIOC_ENUM_FMT = 0xC0405602
+VIDIOC_ENUM_FRAMESIZES = 0xC02C564A
+V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
+V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+V4L2_CAP_DEVICE_CAPS = 0x80000000
+V4L2_FRMSIZE_TYPE_DISCRETE = 1
+_V4L2_CAPABILITY = struct.Struct("=16s32s32sIII12x")
+_V4L2_FMTDESC = struct.Struct("=III32sII12x")
+_V4L2_FRMSIZEENUM = struct.Struct("=IIIII16x8x")  # discrete: width, height (Rest der Union + reserved)
+V4L2_ENUM_MAX = 64  # Schutz gegen Treiber, die nie EINVAL liefern
+
+_V4L2_QUERY_CACHE: dict[tuple, dict] = {}
+_V4L2_QUERY_CACHE_LOCK = threading.Lock()
+
+
+def _v4l2_cstr(b: bytes) -> str:
+    return b.split(b"\0", 1)[0].decode("utf-8", errors="replace").strip()
+
+
+def _v4l2_query_uncached(dev: str) -> dict | None:
+    try:
+        fd = os.open(dev, os.O_RDWR | os.O_NONBLOCK)
+    except OSError as e:
+        return {"ok": False, "error": e.strerror or str(e)}
+    try:
+        buf = bytearray(_V4L2_CAPABILITY.size)
+        try:
+            fcntl.ioctl(fd, VIDIOC_QUERYCAP, buf, True)
+        except OSError as e:
+            return {"ok": False, "error": e.strerror or str(e)}
+        driver, card, bus, _version, caps, device_caps = _V4L2_CAPABILITY.unpack(buf)
+        # "capabilities" gilt für das ganze Gerät – der UVC-Metadaten-Node daneben meldet dort auch
+        # VIDEO_CAPTURE. Maßgeblich ist device_caps (falls der Treiber es liefert).
+        node_caps = device_caps if (caps & V4L2_CAP_DEVICE_CAPS) else caps
+        capture = bool(node_caps & V4L2_CAP_VIDEO_CAPTURE)
+
+        formats: set[str] = set()
+        resolutions: dict[str, list[tuple[int, int]]] = {}
+        for i in range(V4L2_ENUM_MAX if capture else 0):
+            fbuf = bytearray(_V4L2_FMTDESC.size)
+            _V4L2_FMTDESC.pack_into(fbuf, 0, i, V4L2_BUF_TYPE_VIDEO_CAPTURE, 0, b"", 0, 0)
+            try:
+                fcntl.ioctl(fd, VIDIOC_ENUM_FMT, fbuf, True)
+            except OSError:
+                break  # EINVAL = Ende der Liste (oder kein Capture-Device)
+            pixfmt = _V4L2_FMTDESC.unpack(fbuf)[4]
+            fmt = pixfmt.to_bytes(4, "little").decode("ascii", errors="replace").strip()
+            formats.add(fmt)
+            sizes = resolutions.setdefault(fmt, [])
+            for j in range(V4L2_ENUM_MAX):
+                sbuf = bytearray(_V4L2_FRMSIZEENUM.size)
+                _V4L2_FRMSIZEENUM.pack_into(sbuf, 0, j, pixfmt, 0, 0, 0)
+                try:
+                    fcntl.ioctl(fd, VIDIOC_ENUM_FRAMESIZES, sbuf, True)
+                except OSError:
+                    break
+                _, _, typ, w, h = _V4L2_FRMSIZEENUM.unpack(sbuf)
+                if typ != V4L2_FRMSIZE_TYPE_DISCRETE:
+                    break  # wie v4l2-ctl-Parser: nur diskrete Größen
+                if (w, h) not in sizes:
+                    sizes.append((w, h))
+        return {
+            "ok": True,
+            "error": None,
+            "driver": _v4l2_cstr(driver),
+            "card": _v4l2_cstr(card),
+            "bus": _v4l2_cstr(bus),
+            "capabilities": caps,
+            "device_caps": device_caps,
+            "capture": capture,
+            "formats": formats,
+            "resolutions": resolutions,
+        }
+    except Exception:
+        return None  # ioctl-Weg unbrauchbar -> v4l2-ctl
+    finally:
+        os.close(fd)
+
+
+def _v4l2_query(dev: str) -> dict | None:
+    """Capabilities + Formate/Auflösungen mit EINEM open() per ioctl.
+
+    Gecacht je (Node, rdev, mtime) – ein neu eingestecktes Gerät bekommt einen neuen Node.
+    None, wenn der ioctl-Weg nicht nutzbar ist (Aufrufer fallen dann auf v4l2-ctl zurück).
+    """
+    try:
+        st = os.stat(dev)
+    except OSError as e:
+        return {"ok": False, "error": e.strerror or str(e)}
+    key = (dev, st.st_rdev, st.st_mtime_ns)
+    with _V4L2_QUERY_CACHE_LOCK:
+        hit = _V4L2_QUERY_CACHE.get(key)
+    if hit is not None:
+        return hit
+    res = _v4l2_query_uncached(dev)
+    if res is not None and res.get("ok"):
+        with _V4L2_QUERY_CACHE_LOCK:
+            _V4L2_QUERY_CACHE[key] = res
+    return res
+
+
 def probe_v4l2_device(dev: str) -> dict:
     """Probe device for pixel formats and discrete resolutions.
 
@@ -1038,6 +1877,15 @@ def probe_v4l2_device(dev: str) -> dict:
         raw: str
       }
     """
+    q = _v4l2_query(dev)
+    if q is not None:
+        if not q.get("ok"):
+            return {"ok": False, "formats": set(), "resolutions": {}, "error": q.get("error"), "raw": ""}
+        if not q.get("capture"):
+            # z.B. UVC-Metadaten-Node: gar nicht erst als Kamera in Betracht ziehen
+            return {"ok": False, "formats": set(), "resolutions": {}, "error": "Kein Video-Capture-Device.", "raw": ""}
+        return {"ok": True, "formats": q["formats"], "resolutions": q["resolutions"], "error": None, "raw": ""}
+
     r = _v4l2ctl(["-d", dev, "--list-formats-ext"])
     if not r:
         return {"ok": False, "formats": set(), "resolutions": {}, "error": "v4l2-ctl nicht verfügbar oder Timeout.", "raw": ""}
@@ -1052,16 +1900,14 @@ def probe_v4l2_device(dev: str) -> dict:
     formats: set[str] = set()
     resolutions: dict[str, list[tuple[int, int]]] = {}
 
-    re_fmt = re.compile(r"(?:Pixel\s+Format:\s+\'([A-Z0-9]+)\'|\[\d+\]:\s+\'([A-Z0-9]+)\')")
-    re_size = re.compile(r"Size:\s+Discrete\s+(\d+)x(\d+)")
     for line in (r.stdout or "").splitlines():
-        m = re_fmt.search(line)
+        m = _RE_V4L2_FMT.search(line)
         if m:
             fmt = m.group(1) or m.group(2)
             formats.add(fmt)
             resolutions.setdefault(fmt, [])
             continue
-        m = re_size.search(line)
+        m = _RE_V4L2_SIZE.search(line)
         if m and fmt:
             w, h = int(m.group(1)), int(m.group(2))
             if (w, h) not in resolutions[fmt]:
@@ -1086,14 +1932,21 @@ def _best_resolution_for_formats(resolutions: dict[str, list[tuple[int,int]]], p
     return None, None
 
 def _pick_best_video_device(video_devs: list[str]) -> str | None:
-    """Pick best /dev/videoX from a physical camera group.
+    """Pick best /dev/videoX from a physical camera group (siehe _pick_best_video_device_probe)."""
+    return _pick_best_video_device_probe(video_devs)[0]
+
+def _pick_best_video_device_probe(video_devs: list[str]) -> tuple[str | None, dict | None]:
+    """Pick best /dev/videoX from a physical camera group, plus its probe result.
 
     Preference:
       - device that supports MJPG (best for mjpg_streamer)
       - else device that supports YUYV
       - else first device that at least responds to v4l2-ctl
+
+    Bei Gleichstand gewinnt der erste Node – der erste MJPG-Node kann also sofort zurückgegeben werden.
     """
     best = None
+    best_probe = None
     best_score = -1
     for dev in video_devs:
         p = probe_v4l2_device(dev)
@@ -1110,40 +1963,43 @@ def _pick_best_video_device(video_devs: list[str]) -> str | None:
                 score = 1
             else:
                 score = 0
+        if score == 3:
+            return dev, p  # Höchstwert, restliche Nodes (meist Metadaten) nicht mehr prüfen
         if score > best_score:
             best_score = score
             best = dev
-    return best
+            best_probe = p
+    return best, best_probe
 
 def _v4l2_device_info(dev: str) -> dict:
-    """Return basic v4l2 device info using 'v4l2-ctl -D'."""
+    """Return basic v4l2 device info (VIDIOC_QUERYCAP, Fallback 'v4l2-ctl -D')."""
+    q = _v4l2_query(dev)
+    if q is not None:
+        if not q.get("ok"):
+            return {}
+        return {"driver name": q["driver"], "card type": q["card"], "bus info": q["bus"]}
+
     r = _v4l2ctl(["-d", dev, "-D"], timeout=0.9)
     if not r or r.returncode != 0:
         return {}
-    info = {}
-    for line in (r.stdout or "").splitlines():
-        if ":" not in line:
-            continue
-        k, v = line.split(":", 1)
-        k = k.strip().lower()
-        v = v.strip()
-        if k in ("driver name", "card type", "bus info"):
-            info[k] = v
-    return info
+    return {k.lower(): v for k, v in _RE_V4L2_DINFO.findall(r.stdout or "")}
 
 
-def _is_probably_camera_device(dev: str) -> bool:
-    """Heuristic to avoid false positives like codec/ISP/decoder nodes."""
-    info = _v4l2_device_info(dev)
+def _is_probably_camera_device(dev: str, info: dict | None = None, probe: dict | None = None) -> bool:
+    """Heuristic to avoid false positives like codec/ISP/decoder nodes.
+
+    info/probe: bereits geholte Ergebnisse von _v4l2_device_info/probe_v4l2_device (kein zweiter Probe).
+    """
+    if info is None:
+        info = _v4l2_device_info(dev)
     card = (info.get("card type") or "").lower()
     bus = (info.get("bus info") or "").lower()
 
-    bad = ["codec", "isp", "rpivid", "v4l2loopback", "loopback", "virtual", "m2m", "mem2mem", "decoder", "encoder"]
-    if any(b in card for b in bad) or any(b in bus for b in bad):
+    if _RE_CAM_BAD.search(card) or _RE_CAM_BAD.search(bus):
         return False
 
     # Must have at least one format we can stream
-    p = probe_v4l2_device(dev)
+    p = probe if probe is not None else probe_v4l2_device(dev)
     if not p.get("ok"):
         return False
     fmts = p.get("formats", set()) or set()
@@ -1155,8 +2011,7 @@ def _is_probably_camera_device(dev: str) -> bool:
         return True
 
     # CSI / sensor-style names
-    good = ["camera", "webcam", "uvc", "unicam", "csi", "ov", "imx", "ar", "gc", "s5k"]
-    if any(g in card for g in good) or any(g in bus for g in good):
+    if _RE_CAM_GOOD.search(card) or _RE_CAM_GOOD.search(bus):
         return True
 
     # Unknown: be conservative to prevent ghost-devices when no camera is attached
@@ -1164,99 +2019,78 @@ def _is_probably_camera_device(dev: str) -> bool:
 
 
 
-def detect_cameras(desired_count: int):
-    """
-    Erkennt Kameras möglichst zuverlässig.
+CAMERA_PROBE_WORKERS = 8
 
-    1) Wenn verfügbar, nutzt es 'v4l2-ctl --list-devices', um physische USB-Kameras zu gruppieren
-       und pro Kamera genau EIN /dev/videoX zu wählen (verhindert Doppel-/Meta-Devices).
-    2) Fallback: einfache /dev/video0..N Suche.
-    """
-    # 1) Versuch: v4l2-ctl verwenden
-    try:
-        result = subprocess.run(
-            ["v4l2-ctl", "--list-devices"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            lines = result.stdout.splitlines()
 
-            groups = []  # Liste von (name, [video-devices])
-            current_name = None
-            current_videos = []
+def _pick_camera_group(group: tuple[str, list[str]]) -> tuple[str, list[str], str, dict] | None:
+    """Bevorzugten Node einer Gruppe wählen und prüfen -> (name, videos, dev, info) oder None."""
+    name, videos = group
+    videos_sorted = sorted(videos)
+    # Einige Kameras liefern mehrere /dev/videoX Nodes (Meta/H264/etc.).
+    # Wir wählen nach Möglichkeit den Node, der MJPG (oder YUYV) anbietet.
+    dev, probe = _pick_best_video_device_probe(videos_sorted)
+    if dev is None:
+        dev, probe = videos_sorted[0], None
+    info = _v4l2_device_info(dev)
+    if not _is_probably_camera_device(dev, info=info, probe=probe):
+        return None
+    return name, videos_sorted, dev, info
 
-            for line in lines:
-                if line.strip() == "":
-                    continue
 
-                if not line.startswith("	") and not line.startswith(" "):
-                    # Neue Gerätegruppe beginnt
-                    if current_name and current_videos:
-                        groups.append((current_name, current_videos))
-                    current_name = line.strip().rstrip(":")
-                    current_videos = []
-                else:
-                    # Eingrückte Zeile -> Device
-                    path = line.strip()
-                    if path.startswith("/dev/video"):
-                        current_videos.append(path)
+def _pick_camera_groups(groups: list[tuple[str, list[str]]], limit: int = 0) -> list[tuple[str, list[str], str, dict]]:
+    """_pick_camera_group für alle Gruppen parallel (je Gruppe ggf. mehrere v4l2-ctl-Aufrufe).
 
-            # letzte Gruppe übernehmen
-            if current_name and current_videos:
-                groups.append((current_name, current_videos))
+    Reihenfolge bleibt erhalten ("erste Kamera zuerst"); limit > 0 kürzt das Ergebnis.
+    """
+    if not groups:
+        return []
+    with ThreadPoolExecutor(max_workers=min(CAMERA_PROBE_WORKERS, len(groups))) as ex:
+        picked = [p for p in ex.map(_pick_camera_group, groups) if p is not None]
+    return picked[:limit] if limit else picked
 
-            # Gruppen filtern: echte Kameras bevorzugen, System/Meta-Geräte eher raus
-            def _looks_like_camera(name: str) -> bool:
-                n = (name or "").lower()
 
-                # harte Ausschlüsse: typische System/Codec/ISP/Decoder-Geräte
-                bad = ["codec", "isp", "rpivid", "v4l2loopback", "loopback", "virtual", "m2m", "mem2mem", "decoder", "encoder"]
-                if any(b in n for b in bad):
-                    return False
+def _filter_camera_devices(devs: list[str], limit: int = 0) -> list[str]:
+    """_is_probably_camera_device für mehrere Nodes parallel (IO-bound: v4l2-ctl wartet auf den Kernel).
 
-                # USB-Kameras erkennt man meist direkt
-                if "usb" in n or "uvc" in n or "webcam" in n or "camera" in n:
-                    return True
+    Reihenfolge bleibt erhalten; limit > 0 kürzt das Ergebnis.
+    """
+    devs = [d for d in devs if os.path.exists(d)]
+    if not devs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(CAMERA_PROBE_WORKERS, len(devs))) as ex:
+        flags = list(ex.map(_is_probably_camera_device, devs))
+    found = [d for d, ok in zip(devs, flags) if ok]
+    return found[:limit] if limit else found
 
-                # CSI/Sensoren (ov9732, imx219, ...)
-                sensor = ["ov", "imx", "ar", "gc", "s5k", "unicam", "csi"]
-                if any(s in n for s in sensor):
-                    return True
 
-                # Default: konservativ, sonst findet man ohne Kamera gerne 'Geistergeräte'
-                return False
+def detect_cameras(desired_count: int):
+    """Wie _detect_cameras_uncached, aber gegen den /dev/video* Fingerabdruck gecacht."""
+    return _cam_detect_cached(("devices", desired_count), lambda: _detect_cameras_uncached(desired_count))
 
-            cam_groups = [g for g in groups if _looks_like_camera(g[0])]
 
-            devices = []
-            for name, videos in cam_groups:
-                videos_sorted = sorted(videos)
-                # Einige Kameras liefern mehrere /dev/videoX Nodes (Meta/H264/etc.).
-                # Wir wählen nach Möglichkeit den Node, der MJPG (oder YUYV) anbietet.
-                dev = _pick_best_video_device(videos_sorted) or videos_sorted[0]
-                if _is_probably_camera_device(dev):
-                    devices.append(dev)
-                if len(devices) >= desired_count:
-                    break
+def _detect_cameras_uncached(desired_count: int):
+    """
+    Erkennt Kameras möglichst zuverlässig.
+
+    1) Gruppiert die Nodes nach physischem Gerät (VIDIOC_QUERYCAP, sonst 'v4l2-ctl --list-devices')
+       und wählt pro Kamera genau EIN /dev/videoX (verhindert Doppel-/Meta-Devices).
+    2) Fallback: alle vorhandenen /dev/videoN einzeln prüfen.
+    """
+    # 1) Versuch: Nodes nach physischem Gerät gruppieren (ioctl, sonst v4l2-ctl)
+    try:
+        groups = _v4l2_list_device_groups()  # Liste von (name, [video-devices])
+        if groups is not None:
+            # Gruppen filtern: echte Kameras bevorzugen, System/Meta-Geräte eher raus
+            cam_groups = [g for g in groups if _looks_like_camera_group(g[0])]
+            devices = [dev for _, _, dev, _ in _pick_camera_groups(cam_groups, limit=max(1, desired_count))]
 
             if devices:
                 return devices
-    except FileNotFoundError:
-        # v4l2-ctl nicht vorhanden -> Fallback
-        pass
     except Exception as e:
-        print(f"[autodarts-web] Warnung detect_cameras mit v4l2-ctl: {e}")
-
-    # 2) Fallback: einfache /dev/video0..N-Suche
-    found = []
-    for idx in range(MAX_VIDEO_INDEX):
-        dev = f"/dev/video{idx}"
-        if os.path.exists(dev) and _is_probably_camera_device(dev):
-            found.append(dev)
-            if len(found) >= desired_count:
-                break
-    return found
+        print(f"[autodarts-web] Warnung detect_cameras (Gruppierung): {e}")
+
+    # 2) Fallback: alle vorhandenen /dev/videoN (Probes parallel)
+    return _filter_camera_devices(_video_nodes(), limit=desired_count)
 
 
 def _camera_symlink_map() -> dict[str, dict[str, list[str]]]:
@@ -1288,8 +2122,8 @@ def _camera_aliases_for_device(dev: str, symlink_map: dict[str, dict[str, list[s
 
 def _sanitize_camera_key(raw: str) -> str:
     s = (raw or "").strip().lower()
-    s = re.sub(r"[^a-z0-9._-]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _RE_CAM_KEY_BAD.sub("_", s)
+    s = _RE_UNDERSCORES.sub("_", s).strip("_")
     return s or "camera"
 
 
@@ -1328,57 +2162,132 @@ def _camera_label(group_name: str, dev: str, symlink_map: dict[str, dict[str, li
     return base
 
 
-def _looks_like_camera_group(name: str) -> bool:
-    n = (name or "").lower()
-    bad = ["codec", "isp", "rpivid", "v4l2loopback", "loopback", "virtual", "m2m", "mem2mem", "decoder", "encoder"]
-    if any(b in n for b in bad):
-        return False
-    if "usb" in n or "uvc" in n or "webcam" in n or "camera" in n:
-        return True
-    sensor = ["ov", "imx", "ar", "gc", "s5k", "unicam", "csi"]
-    if any(s in n for s in sensor):
-        return True
-    return False
+def _parse_v4l2_list_devices(text: str) -> list[tuple[str, list[str]]]:
+    """Ausgabe von 'v4l2-ctl --list-devices' -> [(Gruppenname, [/dev/videoX, ...]), ...]."""
+    groups: list[tuple[str, list[str]]] = []
+    current_name = None
+    current_videos: list[str] = []
+
+    for line in (text or "").splitlines():
+        if line.strip() == "":
+            continue
+        if not line.startswith("\t") and not line.startswith(" "):
+            # Neue Gerätegruppe beginnt
+            if current_name and current_videos:
+                groups.append((current_name, current_videos))
+            current_name = line.strip().rstrip(":")
+            current_videos = []
+        else:
+            # Eingrückte Zeile -> Device
+            path = line.strip()
+            if path.startswith("/dev/video"):
+                current_videos.append(path)
+
+    # letzte Gruppe übernehmen
+    if current_name and current_videos:
+        groups.append((current_name, current_videos))
+    return groups
+
+
+def _v4l2_list_device_groups() -> list[tuple[str, list[str]]] | None:
+    """Video-Nodes nach physischem Gerät gruppiert, wie 'v4l2-ctl --list-devices'.
+
+    Primär per VIDIOC_QUERYCAP auf alle /dev/video* (gruppiert nach Bus-Info, Name "Card (Bus)" –
+    genau so baut v4l2-ctl seine Gruppen), ohne Prozess-Start. Sonst v4l2-ctl mit Timeout: ein
+    hängender Treiber darf den Web-Worker nicht blockieren.
+    None: weder ioctl noch v4l2-ctl nutzbar.
+    """
+    by_bus: dict[str, tuple[str, list[str]]] = {}
+    for name, _rdev, _mtime in _video_nodes_fingerprint():
+        dev = f"/dev/{name}"
+        q = _v4l2_query(dev)
+        if q is None:
+            by_bus = None
+            break
+        if not q.get("ok"):
+            continue
+        bus = q.get("bus") or dev
+        if bus not in by_bus:
+            by_bus[bus] = (f"{q.get('card') or dev} ({bus})", [])
+        by_bus[bus][1].append(dev)
+    if by_bus is not None:
+        return [by_bus[bus] for bus in sorted(by_bus)]
+
+    r = _v4l2ctl(["--list-devices"], timeout=V4L2CTL_TIMEOUT)
+    if not r or r.returncode != 0:
+        return None
+    return _parse_v4l2_list_devices(r.stdout)
+
+
+def _looks_like_camera_group(name: str) -> bool:
+    """Gruppenname aus 'v4l2-ctl --list-devices': USB-Kameras/CSI-Sensoren ja, Codec/ISP/Loopback nein."""
+    n = (name or "").lower()
+    if _RE_CAM_BAD.search(n):
+        return False
+    if _RE_CAM_GROUP_USB.search(n) or _RE_CAM_SENSOR.search(n):
+        return True
+    return False
+
+
+# Erkennung gegen einen Fingerabdruck der /dev/video* Nodes memoisieren: ohne Umstecken
+# (kein neuer/entfernter Node, gleiche rdev/mtime) ist das Ergebnis dasselbe.
+_CAM_DETECT_CACHE: dict = {"fp": None, "key": None, "result": None}
+_CAM_DETECT_CACHE_LOCK = threading.Lock()
+
+
+def _video_nodes_fingerprint() -> tuple:
+    out = []
+    try:
+        with os.scandir("/dev") as it:
+            for e in it:
+                if not (e.name.startswith("video") and e.name[5:].isdigit()):
+                    continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                out.append((e.name, st.st_rdev, st.st_mtime_ns))
+    except OSError:
+        return ()
+    return tuple(sorted(out))
+
+
+def _video_nodes() -> list[str]:
+    """Vorhandene /dev/videoN (N < MAX_VIDEO_INDEX), numerisch sortiert – ein scandir statt stat() je Index."""
+    idx = sorted(int(name[5:]) for name, _rdev, _mtime in _video_nodes_fingerprint())
+    return [f"/dev/video{i}" for i in idx if i < MAX_VIDEO_INDEX]
+
 
+def _cam_detect_cached(key, compute, fresh: bool = False):
+    """compute() nur, wenn sich die Video-Nodes seit dem letzten Aufruf (mit gleichem key) geändert haben."""
+    fp = _video_nodes_fingerprint()
+    if not fresh:
+        with _CAM_DETECT_CACHE_LOCK:
+            if _CAM_DETECT_CACHE["fp"] == fp and _CAM_DETECT_CACHE["key"] == key:
+                return copy.deepcopy(_CAM_DETECT_CACHE["result"])
+    result = compute()
+    with _CAM_DETECT_CACHE_LOCK:
+        _CAM_DETECT_CACHE.update(fp=fp, key=key, result=copy.deepcopy(result))
+    return result
 
-def detect_camera_inventory(limit: int = MAX_CAMERAS) -> list[dict]:
+
+def detect_camera_inventory(limit: int = MAX_CAMERAS, fresh: bool = False) -> list[dict]:
+    """Kamera-Inventar (gruppiert, je Kamera ein bevorzugter Node); fresh=True umgeht den Cache."""
     limit = max(0, min(MAX_CAMERAS, int(limit)))
+    return _cam_detect_cached(("inventory", limit), lambda: _detect_camera_inventory_uncached(limit), fresh=fresh)
+
+
+def _detect_camera_inventory_uncached(limit: int) -> list[dict]:
     symlink_map = _camera_symlink_map()
     cameras: list[dict] = []
 
     try:
-        result = subprocess.run(["v4l2-ctl", "--list-devices"], capture_output=True, text=True)
-        if result.returncode == 0:
-            lines = result.stdout.splitlines()
-            groups: list[tuple[str, list[str]]] = []
-            current_name = None
-            current_videos: list[str] = []
-
-            for line in lines:
-                if line.strip() == "":
-                    continue
-                if not line.startswith("	") and not line.startswith(" "):
-                    if current_name and current_videos:
-                        groups.append((current_name, current_videos))
-                    current_name = line.strip().rstrip(":")
-                    current_videos = []
-                else:
-                    dev_path = line.strip()
-                    if dev_path.startswith("/dev/video"):
-                        current_videos.append(dev_path)
-
-            if current_name and current_videos:
-                groups.append((current_name, current_videos))
+        groups = _v4l2_list_device_groups()
+        if groups is not None:
+            groups = [g for g in groups if _looks_like_camera_group(g[0])]
 
-            for name, videos in groups:
-                if not _looks_like_camera_group(name):
-                    continue
-                videos_sorted = sorted(videos)
-                preferred_dev = _pick_best_video_device(videos_sorted) or videos_sorted[0]
-                if not _is_probably_camera_device(preferred_dev):
-                    continue
+            for name, videos_sorted, preferred_dev, info in _pick_camera_groups(groups, limit=limit):
                 by_id, by_path = _camera_aliases_for_device(preferred_dev, symlink_map)
-                info = _v4l2_device_info(preferred_dev)
                 cameras.append({
                     "id": _camera_stable_id(name, preferred_dev, symlink_map),
                     "label": _camera_label(name, preferred_dev, symlink_map),
@@ -1390,19 +2299,12 @@ def detect_camera_inventory(limit: int = MAX_CAMERAS) -> list[dict]:
                     "by_id": by_id[0] if by_id else "",
                     "by_path": by_path[0] if by_path else "",
                 })
-                if limit and len(cameras) >= limit:
-                    break
             if cameras:
                 return cameras
-    except FileNotFoundError:
-        pass
     except Exception as e:
-        print(f"[autodarts-web] Warnung detect_camera_inventory mit v4l2-ctl: {e}")
+        print(f"[autodarts-web] Warnung detect_camera_inventory (Gruppierung): {e}")
 
-    for idx in range(MAX_VIDEO_INDEX):
-        dev = f"/dev/video{idx}"
-        if not os.path.exists(dev) or not _is_probably_camera_device(dev):
-            continue
+    for dev in _filter_camera_devices(_video_nodes(), limit=limit):
         by_id, by_path = _camera_aliases_for_device(dev, symlink_map)
         info = _v4l2_device_info(dev)
         name = info.get("card type") or dev
@@ -1494,13 +2396,38 @@ def _devices_for_slots(camera_inventory: list[dict], camera_slots: list[dict]) -
 
 # ---------------- systemd helpers ----------------
 
-def service_exists(service_name: str) -> bool:
-    candidates = [
+def _first_existing(paths) -> str | None:
+    """Erster existierender Pfad (Reihenfolge bleibt Priorität).
+
+    Doppelte Kandidaten werden nur einmal geprüft, fehlt ein Verzeichnis, werden alle
+    weiteren Kandidaten darin ohne stat() übersprungen.
+    """
+    missing_dirs = set()
+    for p in dict.fromkeys(p for p in paths if p):
+        d = os.path.dirname(p)
+        if d in missing_dirs:
+            continue
+        if os.path.exists(p):
+            return p
+        if not os.path.isdir(d):
+            missing_dirs.add(d)
+    return None
+
+
+@_ttl_cache("service_files")
+def _service_unit_file_exists(service_name: str) -> bool:
+    return _first_existing([
         f"/etc/systemd/system/{service_name}",
         f"/lib/systemd/system/{service_name}",
         f"/usr/lib/systemd/system/{service_name}",
-    ]
-    return any(os.path.exists(p) for p in candidates)
+    ]) is not None
+
+
+def service_exists(service_name: str) -> bool:
+    st = _systemd_states_memo().get(service_name)
+    if st and st.get("LoadState"):
+        return st["LoadState"] != "not-found"
+    return _service_unit_file_exists(service_name)
 
 
 # systemctl helper (verhindert Hänger durch blockierende systemctl-Aufrufe)
@@ -1513,12 +2440,159 @@ def _run_systemctl(args: list[str], timeout: float):
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return None
 
+
+# Status-Abfragen direkt über den systemd D-Bus (Gio aus python3-gi, wie beim NM-Client) statt
+# je Abfrage einen systemctl-Prozess zu starten. Ohne gi/System-Bus: systemctl-Fallback.
+# Gio/Variant werden erst beim ersten Bus-Zugriff geladen (_gio_loaded), alle Nutzer gehen über _systemd_bus().
+Gio = Variant = VariantType = None
+
+
+@functools.cache
+def _gio_loaded() -> bool:
+    global Gio, Variant, VariantType
+    try:
+        from gi.repository import Gio as _Gio
+        from gi.repository.GLib import Variant as _Variant, VariantType as _VariantType
+    except Exception:
+        return False
+    Gio, Variant, VariantType = _Gio, _Variant, _VariantType
+    return True
+
+_SYSTEMD_BUS = None
+_SYSTEMD_BUS_LOCK = threading.Lock()
+_DBUS_UNAVAILABLE = object()
+
+
+def _systemd_bus():
+    global _SYSTEMD_BUS
+    if not _gio_loaded():
+        return None
+    with _SYSTEMD_BUS_LOCK:
+        if _SYSTEMD_BUS is None:
+            try:
+                _SYSTEMD_BUS = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            except Exception:
+                return None
+        return _SYSTEMD_BUS
+
+
+def _systemd_unit_property(unit: str, prop: str, iface: str = "org.freedesktop.systemd1.Unit", timeout: float = SYSTEMCTL_CHECK_TIMEOUT):
+    """Property einer Unit (z.B. ActiveState); _DBUS_UNAVAILABLE, wenn D-Bus nicht nutzbar ist."""
+    bus = _systemd_bus()
+    if bus is None:
+        return _DBUS_UNAVAILABLE
+    if "." not in unit:
+        unit += ".service"  # wie systemctl
+    ms = int(timeout * 1000)
+    try:
+        path = bus.call_sync(
+            "org.freedesktop.systemd1", "/org/freedesktop/systemd1", "org.freedesktop.systemd1.Manager",
+            "LoadUnit", Variant("(s)", (unit,)), VariantType.new("(o)"), Gio.DBusCallFlags.NONE, ms, None,
+        ).unpack()[0]
+        return bus.call_sync(
+            "org.freedesktop.systemd1", path, "org.freedesktop.DBus.Properties",
+            "Get", Variant("(ss)", (iface, prop)), VariantType.new("(v)"), Gio.DBusCallFlags.NONE, ms, None,
+        ).unpack()[0]
+    except Exception:
+        return _DBUS_UNAVAILABLE
+
+
+def _systemd_active_state(unit: str, timeout: float = SYSTEMCTL_CHECK_TIMEOUT) -> str | None:
+    """ActiveState ("active", "inactive", "failed", ...) oder None bei Fehler."""
+    state = _systemd_unit_property(unit, "ActiveState", timeout=timeout)
+    if state is not _DBUS_UNAVAILABLE:
+        return str(state)
+    r = _run_systemctl(["is-active", unit], timeout=timeout)
+    return r.stdout.strip() if r else None
+
+
 def service_is_active(service_name: str) -> bool:
-    r = _run_systemctl(["is-active", service_name], timeout=SYSTEMCTL_CHECK_TIMEOUT)
-    return bool(r and r.stdout.strip() == "active")
+    st = _systemd_states_memo().get(service_name)
+    if st and st.get("ActiveState"):
+        return st["ActiveState"] == "active"
+    return _systemd_active_state(service_name) == "active"
+
+
+SYSTEMD_STATE_PROPS = ("LoadState", "ActiveState", "SubState", "UnitFileState")
+
+
+def systemctl_show_many(units: list[str]) -> dict[str, dict]:
+    """Zustand mehrerer Units auf einmal: {unit: {"LoadState": ..., "UnitFileState": ..., ...}}.
+
+    Über D-Bus (kein Prozess), sonst EIN 'systemctl show' für alle Units statt je Unit
+    is-enabled/is-active. Units ohne Antwort fehlen im Ergebnis.
+    """
+    units = list(dict.fromkeys(u for u in units if u))
+    if not units:
+        return {}
+    out: dict[str, dict] = {}
+    if _systemd_bus() is not None:
+        for unit in units:
+            st = {}
+            for prop in SYSTEMD_STATE_PROPS:
+                v = _systemd_unit_property(unit, prop)
+                if v is _DBUS_UNAVAILABLE:
+                    break
+                st[prop] = str(v)
+            else:
+                out[unit] = st
+        if len(out) == len(units):
+            return out
+
+    r = _run_systemctl(
+        ["show", "--no-pager", "--property=" + ",".join(SYSTEMD_STATE_PROPS), *units],
+        timeout=SYSTEMCTL_CHECK_TIMEOUT,
+    )
+    if not r or r.returncode != 0:
+        return out
+    # Ein Block (durch Leerzeile getrennt) je Unit, in Aufruf-Reihenfolge
+    blocks = (r.stdout or "").strip().split("\n\n")
+    for unit, block in zip(units, blocks):
+        st = {}
+        for line in block.splitlines():
+            k, sep, v = line.partition("=")
+            if sep:
+                st[k.strip()] = v.strip()
+        out.setdefault(unit, st)
+    return out
+
+
+def _systemd_states_prefetch(units: list[str], states: dict[str, dict] | None = None) -> None:
+    """Unit-Zustände für den laufenden Request einmal holen (flask.g); service_exists /
+    service_is_enabled / service_is_active lesen danach nur noch daraus.
+
+    states: bereits (z.B. im Pool) geholtes Ergebnis von systemctl_show_many.
+    """
+    if not has_request_context():
+        return
+    memo = g.setdefault("_systemd_states", {})
+    if states is not None:
+        memo.update(states)
+    missing = [u for u in units if u not in memo]
+    if missing:
+        memo.update(systemctl_show_many(missing))
+
+
+def _systemd_states_memo() -> dict[str, dict]:
+    if not has_request_context():
+        return {}
+    return g.get("_systemd_states") or {}
+
+
+def _systemd_states_forget() -> None:
+    """Nach enable/disable/restart: gemerkte Zustände des Requests verwerfen."""
+    if has_request_context():
+        g.pop("_systemd_states", None)
 
 def _systemd_execstart_path(service_name: str) -> str | None:
     """Versucht den ExecStart-Pfad aus systemd herauszulesen (z.B. /home/peter/.local/bin/autodarts)."""
+    # D-Bus: ExecStart = a(sasbttttuii) -> (path, argv, ...)
+    execs = _systemd_unit_property(service_name, "ExecStart", iface="org.freedesktop.systemd1.Service", timeout=1.5)
+    if execs is not _DBUS_UNAVAILABLE:
+        try:
+            return str(execs[0][0]) or None
+        except Exception:
+            return None
     try:
         out = subprocess.run(
             ["systemctl", "show", "-p", "ExecStart", service_name],
@@ -1532,7 +2606,7 @@ def _systemd_execstart_path(service_name: str) -> str | None:
         # Beispiele:
         # ExecStart=/home/peter/.local/bin/autodarts
         # ExecStart={ path=/home/peter/.local/bin/autodarts ; argv[]=/home/peter/.local/bin/autodarts ; ... }
-        m = re.search(r"/[^\s;]+", line)
+        m = _RE_EXECSTART_PATH.search(line)
         if m:
             p = m.group(0).strip()
             return p if os.path.exists(p) else p  # exist check optional
@@ -1541,6 +2615,7 @@ def _systemd_execstart_path(service_name: str) -> str | None:
     return None
 
 
+@_ttl_cache("autodarts_paths")
 def get_autodarts_binary_path() -> str | None:
     """Findet das Autodarts Binary möglichst robust."""
     # 1) aus systemd
@@ -1557,37 +2632,46 @@ def get_autodarts_binary_path() -> str | None:
         "/usr/local/bin/autodarts",
         "/usr/bin/autodarts",
     ]
-    for c in candidates:
-        if c and os.path.exists(c):
-            return c
-    return None
+    return _first_existing(candidates)
 
 
 def get_autodarts_version() -> str | None:
     """Liest die installierte Autodarts-Version (über autodarts --version)."""
-    # Cache (damit die Startseite nicht träge wird)
+    bin_path = get_autodarts_binary_path()
+    if not bin_path:
+        return None
+    try:
+        mtime = os.stat(bin_path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    # Cache (damit die Startseite nicht träge wird) – ein Update tauscht das Binary (neue mtime)
+    # und wird damit sofort erkannt, ohne den TTL abzuwarten.
     try:
         now = time.time()
-        if (now - float(AUTODARTS_VERSION_CACHE.get("ts", 0.0))) < AUTODARTS_VERSION_CACHE_TTL_SEC:
+        if (
+            (now - float(AUTODARTS_VERSION_CACHE.get("ts", 0.0))) < AUTODARTS_VERSION_CACHE_TTL_SEC
+            and AUTODARTS_VERSION_CACHE.get("path") == bin_path
+            and AUTODARTS_VERSION_CACHE.get("mtime") == mtime
+        ):
             v = AUTODARTS_VERSION_CACHE.get("v")
             if v:
                 return str(v)
     except Exception:
         pass
-    bin_path = get_autodarts_binary_path()
-    if not bin_path:
-        return None
     try:
         r = subprocess.run([bin_path, "--version"], capture_output=True, text=True, timeout=1.5)
         if r.returncode != 0:
             # fallback: manche Tools nutzen -V
             r = subprocess.run([bin_path, "-V"], capture_output=True, text=True, timeout=1.5)
         out = (r.stdout or r.stderr or "").strip()
-        m = re.search(r"(\d+\.\d+\.\d+(?:-[A-Za-z0-9.]+)?)", out)
+        m = _RE_AD_VERSION.search(out)
         ver = m.group(1) if m else (out.splitlines()[0] if out else None)
         try:
             AUTODARTS_VERSION_CACHE["ts"] = time.time()
             AUTODARTS_VERSION_CACHE["v"] = ver
+            AUTODARTS_VERSION_CACHE["path"] = bin_path
+            AUTODARTS_VERSION_CACHE["mtime"] = mtime
         except Exception:
             pass
         return ver
@@ -1595,6 +2679,7 @@ def get_autodarts_version() -> str | None:
         return None
 
 
+@_ttl_cache("autodarts_paths")
 def _get_autodarts_updater_path() -> str | None:
     """Versucht updater.sh zu finden (wird vom offiziellen Installer angelegt)."""
     # Neben dem autodarts binary
@@ -1612,27 +2697,15 @@ def _get_autodarts_updater_path() -> str | None:
         "/home/pi/.local/bin/updater.sh",
         "/root/.local/bin/updater.sh",
     ]
-    for c in candidates:
-        if c and os.path.exists(c):
-            return c
-    return None
+    return _first_existing(candidates)
 
 
 def load_update_state() -> dict:
-    try:
-        with open(AUTODARTS_UPDATE_STATE, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
+    return _state_read(AUTODARTS_UPDATE_STATE)
 
 
 def save_update_state(state: dict):
-    try:
-        os.makedirs(os.path.dirname(AUTODARTS_UPDATE_STATE), exist_ok=True)
-        with open(AUTODARTS_UPDATE_STATE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-    except Exception:
-        pass
+    _state_write(AUTODARTS_UPDATE_STATE, state)
 
 
 def start_autodarts_update_background(
@@ -1657,6 +2730,9 @@ def start_autodarts_update_background(
         except Exception:
             pass  # PID tot -> weiter
 
+    # Pfade frisch suchen (vorheriges Update/Install kann sie verschoben haben)
+    _invalidate("autodarts_paths")
+
     # Command bestimmen
     cmd = (cmd_override or "").strip()
     if not cmd:
@@ -1719,84 +2795,12 @@ def start_autodarts_update_background(
     except Exception as e:
         return False, t("jobs.start_failed", "Job konnte nicht gestartet werden: {error}", error=e)
 
-def get_webpanel_version() -> str | None:
-    """Liest die installierte Webpanel-Version (lokale version.txt)."""
-    # 1) Hardcoded im Script (einfach zu pflegen)
-    try:
-        if (WEBPANEL_HARDCODED_VERSION or "").strip():
-            v = (WEBPANEL_HARDCODED_VERSION or "").strip().lstrip("v").strip()
-            return v or WEBPANEL_UI_FALLBACK_VERSION
-    except Exception:
-        pass
-
-    # 2) Aus Datei (/var/lib/... oder version.txt)
-    candidates = [
-        WEBPANEL_VERSION_FILE,
-        str(Path(BASE_DIR) / "version.txt"),
-    ]
-    for p in candidates:
-        try:
-            if p and os.path.exists(p):
-                v = Path(p).read_text(encoding="utf-8", errors="ignore").strip()
-                v = v.lstrip("v").strip()
-                if v:
-                    return v
-        except Exception:
-            continue
-    return WEBPANEL_UI_FALLBACK_VERSION
-
-
-def fetch_latest_webpanel_version(timeout_s: float = 2.0) -> str | None:
-    """Liest die aktuelle Webpanel-Version aus GitHub (raw version.txt)."""
-    try:
-        req = urllib.request.Request(WEBPANEL_VERSION_URL, headers={"User-Agent": "AutodartsPanel"})
-        with urllib.request.urlopen(req, timeout=timeout_s) as r:
-            v = (r.read().decode("utf-8", errors="ignore") or "").strip()
-        v = v.lstrip("v").strip()
-        return v or None
-    except Exception:
-        return None
-
-
-def load_webpanel_update_check() -> dict:
-    try:
-        with open(WEBPANEL_UPDATE_CHECK, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
-
-
-def save_webpanel_update_check(d: dict):
-    try:
-        os.makedirs(os.path.dirname(WEBPANEL_UPDATE_CHECK), exist_ok=True)
-        with open(WEBPANEL_UPDATE_CHECK, "w", encoding="utf-8") as f:
-            json.dump(d, f, indent=2)
-    except Exception:
-        pass
-
-
-def load_webpanel_update_state() -> dict:
-    try:
-        with open(WEBPANEL_UPDATE_STATE, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
 
 
-def save_webpanel_update_state(state: dict):
-    try:
-        os.makedirs(os.path.dirname(WEBPANEL_UPDATE_STATE), exist_ok=True)
-        with open(WEBPANEL_UPDATE_STATE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-    except Exception:
-        pass
 
 
 def get_uvc_backup_info() -> dict:
-    try:
-        kernel = os.uname().release
-    except Exception:
-        kernel = subprocess.run(["uname", "-r"], capture_output=True, text=True, timeout=1.0).stdout.strip() or "unknown"
+    kernel = os.uname().release or "unknown"
 
     backup_dir = os.path.join(UVC_BACKUP_ROOT, kernel)
     marker_path = os.path.join(STATE_DIR, f"once-uvc-hack-{kernel}.done")
@@ -1819,44 +2823,61 @@ def get_uvc_backup_info() -> dict:
     }
 
 
+WEBPANEL_JOB_LOCK_PATH = "/var/lib/autodarts/webpanel-update.lock"
+WEBPANEL_JOB_LOCK_WAIT_SEC = 5.0  # so lange nach dem Start warten, bis der Job den flock übernommen hat
+_WEBPANEL_START_LOCK = threading.Lock()
+
+
 def start_webpanel_update_background(mode: str = "update", allow_self_update: bool = True) -> tuple[bool, str]:
     """Startet das Webpanel-Update oder UVC-Spezialjobs außerhalb des Service-CGroups."""
     if not os.path.exists(WEBPANEL_UPDATE_SCRIPT):
         return False, t("webpanel.update_script_missing", "Update-Script nicht gefunden: {path}", path=WEBPANEL_UPDATE_SCRIPT)
 
     mode = (mode or "update").strip() or "update"
-    lock_path = "/var/lib/autodarts/webpanel-update.lock"
-
-    def _unit_is_active(unit: str) -> bool:
+    lock_path = WEBPANEL_JOB_LOCK_PATH
+
+    # flock statt Lock-JSON + is-active: Der Kernel serialisiert, und der Lock verschwindet mit dem
+    # Prozess (keine veralteten Locks). Nur der Job hält ihn (flock -n im Wrapper, bis zu seinem Ende);
+    # ist er schon belegt, beendet sich ein zweiter Job sofort mit 75. Das Webpanel prüft nur
+    # (/proc/locks) und hält _WEBPANEL_START_LOCK, bis der gestartete Job den flock hat – ein zweiter
+    # Klick in dieser Lücke wird so abgewiesen statt einen zweiten Job zu starten.
+    if not _WEBPANEL_START_LOCK.acquire(blocking=False):
+        return False, t("webpanel.job_already_running", "Webpanel-Job läuft bereits.")
+    try:
         try:
-            r = subprocess.run(["systemctl", "is-active", unit], capture_output=True, text=True)
-            return r.returncode == 0
-        except Exception:
-            return False
-
+            os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+            os.close(os.open(lock_path, os.O_CREAT | os.O_RDONLY, 0o644))
+        except OSError as e:
+            return False, t("jobs.start_failed", "Job konnte nicht gestartet werden: {error}", error=e)
+        if _flock_held(lock_path):
+            return False, t("webpanel.job_already_running", "Webpanel-Job läuft bereits.")
+        ok, msg = _start_webpanel_job_locked(mode, allow_self_update, lock_path)
+        if ok:
+            deadline = time.monotonic() + WEBPANEL_JOB_LOCK_WAIT_SEC
+            while time.monotonic() < deadline and not _flock_held(lock_path):
+                time.sleep(0.1)
+        return ok, msg
+    finally:
+        _WEBPANEL_START_LOCK.release()
+
+
+def _flock_held(path: str) -> bool:
+    """True, wenn irgendein Prozess einen flock auf path hält (/proc/locks, ohne selbst zu locken)."""
     try:
-        if os.path.exists(lock_path):
-            try:
-                with open(lock_path, "r", encoding="utf-8") as f:
-                    info = json.load(f) or {}
-            except Exception:
-                info = {}
-
-            unit = str(info.get("unit") or "").strip()
-            ts = int(info.get("ts") or 0)
-
-            if unit and _unit_is_active(unit):
-                return False, t("webpanel.job_already_running", "Webpanel-Job läuft bereits.")
-            if ts and (time.time() - ts) > 1800:
-                try:
-                    os.remove(lock_path)
-                except Exception:
-                    return False, t("webpanel.job_already_running_lock", "Webpanel-Job läuft bereits (Lock konnte nicht entfernt werden).")
-            else:
-                return False, t("webpanel.job_already_running", "Webpanel-Job läuft bereits.")
+        st = os.stat(path)
+        key = f"{os.major(st.st_dev):02x}:{os.minor(st.st_dev):02x}:{st.st_ino}"
+        with open("/proc/locks", "r", encoding="ascii", errors="ignore") as f:
+            for line in f:
+                parts = line.split()
+                # "1: FLOCK  ADVISORY  WRITE 1234 08:02:131 0 EOF" – wartende Einträge haben "->"
+                if len(parts) >= 6 and parts[1] == "FLOCK" and parts[5] == key:
+                    return True
     except Exception:
         pass
+    return False
 
+
+def _start_webpanel_job_locked(mode: str, allow_self_update: bool, lock_path: str) -> tuple[bool, str]:
     state = load_webpanel_update_state()
     state["started"] = time.strftime("%Y-%m-%d %H:%M:%S")
     state["finished"] = None
@@ -1865,11 +2886,11 @@ def start_webpanel_update_background(mode: str = "update", allow_self_update: bo
     state["mode"] = mode
     save_webpanel_update_state(state)
 
-    unit_suffix = re.sub(r"[^a-zA-Z0-9_.-]+", "-", mode).strip("-") or "update"
+    unit_suffix = _RE_UNIT_SUFFIX_BAD.sub("-", mode).strip("-") or "update"
     unit_name = f"autodarts-webpanel-{unit_suffix}-{int(time.time())}"
 
     try:
-        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        # nur zur Diagnose – gelockt wird über flock, nicht über den Inhalt
         with open(lock_path, "w", encoding="utf-8") as f:
             json.dump({"ts": int(time.time()), "unit": unit_name, "mode": mode}, f)
     except Exception:
@@ -1878,25 +2899,31 @@ def start_webpanel_update_background(mode: str = "update", allow_self_update: bo
     remote_updater_url = WEBPANEL_RAW_BASE + "/autodarts-webpanel-update.sh"
     mode_arg = shlex.quote(mode)
 
+    # Update-Script im Job selbst auffrischen (Download kann dauern, der POST kehrt sofort zurück).
+    # BOM/CRLF entfernen; nur ein echtes Script (#!) installieren, sonst (z.B. Captive-Portal-HTML)
+    # oder bei Download-Fehler bleibt das vorhandene unverändert.
     self_update_cmd = ""
     if allow_self_update and mode == "update":
         self_update_cmd = (
             "tmp=$(mktemp); "
             f"if curl -fsSL --retry 2 --connect-timeout 5 --max-time 30 {shlex.quote(remote_updater_url)} -o \"$tmp\"; then "
-            "sed -i 's/\r$//' \"$tmp\" || true; "
-            "sed -i '1s/^\xEF\xBB\xBF//' \"$tmp\" || true; "
-            f"sudo -n install -m 755 \"$tmp\" {shlex.quote(WEBPANEL_UPDATE_SCRIPT)}; "
+            "sed -i '1s/^\\xEF\\xBB\\xBF//; s/\\r$//' \"$tmp\" || true; "
+            "if [ \"$(head -c 2 \"$tmp\")\" = '#!' ]; then "
+            f"sudo -n install -m 755 \"$tmp\" {shlex.quote(WEBPANEL_UPDATE_SCRIPT)} || true; "
+            "fi; "
             "fi; "
             "rm -f \"$tmp\" || true; "
         )
 
+    # Job-Lock: fd 9 hält ihn bis Job-Ende; schon belegt -> anderer Job läuft, sofort mit 75 beenden
+    lock_cmd = f"exec 9<{shlex.quote(lock_path)}; flock -n 9 || exit 75; "
+
     wrapper_cmd = (
         "set -euo pipefail; "
-        f"lock={shlex.quote(lock_path)}; "
+        f"{lock_cmd}"
         f"{self_update_cmd}"
         "rc=0; "
         f"sudo -n {shlex.quote(WEBPANEL_UPDATE_SCRIPT)} {mode_arg} >> {shlex.quote(WEBPANEL_UPDATE_LOG)} 2>&1 || rc=$?; "
-        'rm -f "$lock" || true; '
         "exit $rc"
     )
 
@@ -1919,15 +2946,10 @@ def start_webpanel_update_background(mode: str = "update", allow_self_update: bo
             save_webpanel_update_state(state)
             return True, ""
 
-        try:
-            if os.path.exists(lock_path):
-                os.remove(lock_path)
-        except Exception:
-            pass
-
         fallback = (
             "nohup /bin/bash -lc "
             + shlex.quote(
+                f"{lock_cmd}"
                 f"{self_update_cmd}"
                 f"sudo -n {WEBPANEL_UPDATE_SCRIPT} {mode_arg} >> {WEBPANEL_UPDATE_LOG} 2>&1"
             )
@@ -1950,11 +2972,6 @@ def start_webpanel_update_background(mode: str = "update", allow_self_update: bo
         return False, state["error"]
 
     except Exception as e:
-        try:
-            if os.path.exists(lock_path):
-                os.remove(lock_path)
-        except Exception:
-            pass
         state["unit"] = None
         state["method"] = "exception"
         state["mode"] = mode
@@ -1962,6 +2979,24 @@ def start_webpanel_update_background(mode: str = "update", allow_self_update: bo
         save_webpanel_update_state(state)
         return False, state["error"]
 
+_VERSION_FILE_CACHE: dict[str, tuple[int, str]] = {}
+
+
+def _read_version_file(path: str) -> str | None:
+    """Versionsdatei lesen; solange sich die mtime nicht ändert, aus dem Speicher."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    hit = _VERSION_FILE_CACHE.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    v = Path(path).read_text(encoding="utf-8", errors="ignore").strip().lstrip("v").strip()
+    _VERSION_FILE_CACHE[path] = (mtime, v)
+    return v
+
+
+@_ttl_cache("webpanel_version")
 def get_webpanel_version() -> str | None:
     """Liest die installierte Webpanel-Version (lokale version.txt)."""
     # 1) Hardcoded im Script (einfach zu pflegen)
@@ -1979,22 +3014,24 @@ def get_webpanel_version() -> str | None:
     ]
     for p in candidates:
         try:
-            if p and os.path.exists(p):
-                v = Path(p).read_text(encoding="utf-8", errors="ignore").strip()
-                v = v.lstrip("v").strip()
-                if v:
-                    return v
+            v = _read_version_file(p) if p else None
+            if v:
+                return v
         except Exception:
             continue
     return WEBPANEL_UI_FALLBACK_VERSION
 
 
+def _http_get_bytes(url: str, timeout_s: float) -> bytes:
+    req = urllib.request.Request(url, headers={"User-Agent": "AutodartsPanel"})
+    with urllib.request.urlopen(req, timeout=timeout_s) as r:
+        return r.read()
+
+
 def fetch_latest_webpanel_version(timeout_s: float = 2.0) -> str | None:
     """Liest die aktuelle Webpanel-Version aus GitHub (raw version.txt)."""
     try:
-        req = urllib.request.Request(WEBPANEL_VERSION_URL, headers={"User-Agent": "AutodartsPanel"})
-        with urllib.request.urlopen(req, timeout=timeout_s) as r:
-            v = (r.read().decode("utf-8", errors="ignore") or "").strip()
+        v = (_http_get_bytes(WEBPANEL_VERSION_URL, timeout_s).decode("utf-8", errors="ignore") or "").strip()
         v = v.lstrip("v").strip()
         return v or None
     except Exception:
@@ -2002,37 +3039,19 @@ def fetch_latest_webpanel_version(timeout_s: float = 2.0) -> str | None:
 
 
 def load_webpanel_update_check() -> dict:
-    try:
-        with open(WEBPANEL_UPDATE_CHECK, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
+    return _state_read(WEBPANEL_UPDATE_CHECK)
 
 
 def save_webpanel_update_check(d: dict):
-    try:
-        os.makedirs(os.path.dirname(WEBPANEL_UPDATE_CHECK), exist_ok=True)
-        with open(WEBPANEL_UPDATE_CHECK, "w", encoding="utf-8") as f:
-            json.dump(d, f, indent=2)
-    except Exception:
-        pass
+    _state_write(WEBPANEL_UPDATE_CHECK, d)
 
 
 def load_webpanel_update_state() -> dict:
-    try:
-        with open(WEBPANEL_UPDATE_STATE, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
+    return _state_read(WEBPANEL_UPDATE_STATE)
 
 
 def save_webpanel_update_state(state: dict):
-    try:
-        os.makedirs(os.path.dirname(WEBPANEL_UPDATE_STATE), exist_ok=True)
-        with open(WEBPANEL_UPDATE_STATE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-    except Exception:
-        pass
+    _state_write(WEBPANEL_UPDATE_STATE, state)
 
 
 
@@ -2041,37 +3060,19 @@ def save_webpanel_update_state(state: dict):
 # ---------------- System Update (apt + reboot) ----------------
 
 def load_os_update_state() -> dict:
-    try:
-        with open(OS_UPDATE_STATE, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
+    return _state_read(OS_UPDATE_STATE)
 
 
 def save_os_update_state(state: dict):
-    try:
-        os.makedirs(os.path.dirname(OS_UPDATE_STATE), exist_ok=True)
-        with open(OS_UPDATE_STATE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-    except Exception:
-        pass
+    _state_write(OS_UPDATE_STATE, state)
 
 
 def load_ufw_state() -> dict:
-    try:
-        with open(UFW_STATE, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
+    return _state_read(UFW_STATE)
 
 
 def save_ufw_state(state: dict):
-    try:
-        os.makedirs(os.path.dirname(UFW_STATE), exist_ok=True)
-        with open(UFW_STATE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-    except Exception:
-        pass
+    _state_write(UFW_STATE, state)
 
 
 UFW_BIN_CANDIDATES = (
@@ -2082,7 +3083,9 @@ UFW_BIN_CANDIDATES = (
 )
 
 
+@functools.lru_cache(maxsize=None)
 def _get_ufw_cmd() -> str | None:
+    # gecached (PATH-Suche + stat je Kandidat); ufw_refresh_state()/Installation leeren den Cache
     found = shutil.which("ufw")
     if found:
         return found
@@ -2103,17 +3106,75 @@ def _run_root(cmd: list[str], timeout: float = 20.0) -> subprocess.CompletedProc
     return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
 
 
+def _systemd_start_transient(unit_name: str, argv: list[str], timeout: float = SYSTEMCTL_CHECK_TIMEOUT) -> bool:
+    """Transiente Service-Unit direkt per D-Bus (StartTransientUnit) starten – wie
+    'systemd-run --unit <name> --no-block --collect <argv>', aber ohne sudo/systemd-run/bash-Prozesse.
+
+    False, wenn D-Bus nicht nutzbar ist oder systemd ablehnt (z.B. nicht root) -> Aufrufer nimmt systemd-run.
+    """
+    bus = _systemd_bus()
+    if bus is None or not argv:
+        return False
+    if not unit_name.endswith(".service"):
+        unit_name += ".service"
+    props = [
+        ("ExecStart", Variant("a(sasb)", [(argv[0], list(argv), False)])),
+        ("CollectMode", Variant("s", "inactive-or-failed")),
+    ]
+    try:
+        bus.call_sync(
+            "org.freedesktop.systemd1", "/org/freedesktop/systemd1", "org.freedesktop.systemd1.Manager",
+            "StartTransientUnit", Variant("(ssa(sv)a(sa(sv)))", (unit_name, "fail", props, [])),
+            VariantType.new("(o)"), Gio.DBusCallFlags.NONE, int(timeout * 1000), None,
+        )
+        return True
+    except Exception:
+        return False
+
+
+def _prepare_local_script(path: str) -> bool:
+    """CRLF entfernen + ausführbar machen (statt sed/chmod im Root-Shell). False: fehlende Rechte o.ä."""
+    try:
+        data = Path(path).read_bytes()
+        if b"\r" in data:
+            fixed = re.sub(rb"\r$", b"", data, flags=re.M)
+            if fixed != data:
+                st = os.stat(path)
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(fixed)
+                os.chmod(tmp, st.st_mode & 0o7777)
+                os.replace(tmp, path)
+        mode = os.stat(path).st_mode
+        if (mode & 0o111) != 0o111:
+            os.chmod(path, (mode & 0o7777) | 0o111)
+        return True
+    except OSError:
+        return False
+
+
+def _proc_output(r: subprocess.CompletedProcess) -> str:
+    """stdout + stderr (falls vorhanden) einmalig zusammengesetzt und gestrippt."""
+    out = r.stdout or ""
+    if r.stderr:
+        out += "\n" + r.stderr
+    return out.strip()
+
+
 def _systemd_unit_state(unit_name: str, timeout: float = 5.0) -> str:
     unit_name = str(unit_name or "").strip()
     if not unit_name:
         return "missing"
     try:
-        r = _run_root(["systemctl", "show", unit_name, "--property=ActiveState,LoadState", "--value"], timeout=timeout)
-        if r.returncode != 0:
-            return "missing"
-        values = [line.strip() for line in (r.stdout or "").splitlines() if line.strip()]
-        active = values[0] if len(values) > 0 else ""
-        load = values[1] if len(values) > 1 else ""
+        load = _systemd_unit_property(unit_name, "LoadState", timeout=timeout)
+        active = _systemd_unit_property(unit_name, "ActiveState", timeout=timeout) if load is not _DBUS_UNAVAILABLE else _DBUS_UNAVAILABLE
+        if active is _DBUS_UNAVAILABLE:
+            r = _run_root(["systemctl", "show", unit_name, "--property=ActiveState,LoadState", "--value"], timeout=timeout)
+            if r.returncode != 0:
+                return "missing"
+            values = [line.strip() for line in (r.stdout or "").splitlines() if line.strip()]
+            active = values[0] if len(values) > 0 else ""
+            load = values[1] if len(values) > 1 else ""
         if load == "not-found":
             return "missing"
         if active in {"active", "activating", "reloading"}:
@@ -2125,10 +3186,44 @@ def _systemd_unit_state(unit_name: str, timeout: float = 5.0) -> str:
     return "missing"
 
 
-def ufw_refresh_state() -> dict:
+UFW_CONF_PATH = "/etc/ufw/ufw.conf"
+
+
+def _ufw_quick_status() -> str | None:
+    """
+    Billiger Status ohne sudo/"ufw status": systemctl is-active ufw + ENABLED= aus ufw.conf.
+    Liefert "active"/"inactive" oder None, wenn das nicht eindeutig ist.
+    """
+    unit = _systemd_active_state("ufw", timeout=0.8)
+    if unit is None:
+        return None
+    if unit in ("inactive", "failed"):
+        return "inactive"
+    if unit != "active":
+        return None
+    # ufw.service ist oneshot (RemainAfterExit) – "ufw disable" stoppt die Unit nicht, daher ENABLED= prüfen
+    try:
+        with open(UFW_CONF_PATH, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                key, _, val = line.strip().partition("=")
+                if key == "ENABLED":
+                    return "active" if val.strip().strip('"').lower() == "yes" else "inactive"
+    except Exception:
+        pass
+    return "active"
+
+
+def ufw_refresh_state(quick: bool = False) -> dict:
     """
     Liest UFW Status (active/inactive) aus. Wird auf Button-Klick und bei hängendem Install-Status genutzt.
+
+    quick=True: erst _ufw_quick_status() (kein sudo); "ufw status" nur, wenn das nicht eindeutig ist.
+    Die Regel-Ausgabe (raw) bleibt dann auf dem letzten Stand.
     """
+    _get_ufw_cmd.cache_clear()
+    if not quick:
+        # expliziter Klick: frisch prüfen, auch wenn "ufw status" gerade erst gehangen hat
+        _backoff_clear("ufw")
     st = load_ufw_state() or {}
     st["checked_ts"] = time.time()
     st["checked"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -2154,15 +3249,35 @@ def ufw_refresh_state() -> dict:
         save_ufw_state(st)
         return st
 
+    if quick:
+        qs = _ufw_quick_status()
+        if qs:
+            st["status"] = qs
+            st["enabled"] = (qs == "active")
+            st.pop("error", None)
+            save_ufw_state(st)
+            return st
+
+    if _backoff_active([ufw_cmd, "status"]):
+        # "ufw status" ist eben erst in den Timeout gelaufen -> letzten Stand behalten
+        return st
+
     try:
-        r = _run_root([ufw_cmd, "status"], timeout=6.0)
-        raw = (r.stdout or "") + (("\n" + r.stderr) if r.stderr else "")
-        st["raw"] = raw.strip()
+        try:
+            r = _run_root([ufw_cmd, "status"], timeout=6.0)
+        except subprocess.TimeoutExpired as e:
+            _backoff_record([ufw_cmd, "status"], str(e))
+            raise
+        raw = _proc_output(r)
+        st["raw"] = raw
         st.pop("error", None)
-        if "Status: active" in raw:
+        m = _RE_UFW_STATUS.search(raw)
+        ufw_status = m.group(1).lower() if m else ""
+        # auch deutsche Locale ("Status: aktiv/inaktiv") – Status-Wort wird nur einmal klein geschrieben
+        if ufw_status in ("active", "aktiv"):
             st["enabled"] = True
             st["status"] = "active"
-        elif "Status: inactive" in raw:
+        elif ufw_status in ("inactive", "inaktiv"):
             st["enabled"] = False
             st["status"] = "inactive"
         else:
@@ -2178,6 +3293,10 @@ def ufw_refresh_state() -> dict:
     return st
 
 
+_UFW_FAIL_MARKER = "@@ufw-fail "
+_UFW_MUTATE_LOCK = threading.Lock()  # allow/enable/disable nicht parallel (mehrere Tabs/Klicks)
+
+
 def ufw_apply_port_rules() -> tuple[bool, str]:
     """
     Setzt die erlaubten Ports idempotent (mehrfach ausführen ist ok).
@@ -2186,22 +3305,33 @@ def ufw_apply_port_rules() -> tuple[bool, str]:
     if not ufw_cmd:
         return False, t("ufw.not_installed", "UFW ist nicht installiert.")
 
+    # Alle Regeln in EINEM sudo/bash-Aufruf (statt je Regel sudo + ufw-Start).
+    # Marker-Zeilen ordnen Fehler trotzdem der jeweiligen Regel zu.
+    ufw_q = shlex.quote(ufw_cmd)
+    script = "; ".join(
+        f"{ufw_q} allow {shlex.quote(rule)} 2>&1 || echo {shlex.quote(_UFW_FAIL_MARKER + rule)}"
+        for rule in UFW_PORT_RULES
+    )
+
     logs = []
     ok = True
-    for rule in UFW_PORT_RULES:
-        try:
-            r = _run_root([ufw_cmd, "allow", rule], timeout=10.0)
-            if r.returncode != 0:
-                ok = False
-            out = (r.stdout or "").strip()
-            err = (r.stderr or "").strip()
-            if out:
-                logs.append(out)
-            if err:
-                logs.append(err)
-        except Exception as e:
+    try:
+        with _UFW_MUTATE_LOCK:
+            r = _run_root(["bash", "-c", script], timeout=10.0 + 5.0 * len(UFW_PORT_RULES))
+        if r.returncode != 0:
             ok = False
-            logs.append(str(e))
+        for line in ((r.stdout or "") + "\n" + (r.stderr or "")).splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(_UFW_FAIL_MARKER):
+                ok = False
+                logs.append(t("ufw.rule_failed", "Regel fehlgeschlagen: {rule}", rule=line[len(_UFW_FAIL_MARKER):]))
+                continue
+            logs.append(line)
+    except Exception as e:
+        ok = False
+        logs.append(str(e))
 
     msg = t("ufw.ports_applied", "Ports angewendet.") if ok else t("ufw.ports_applied_with_errors", "Ports angewendet, aber es gab Fehler.")
     return ok, msg + ("\n" + "\n".join(logs[-10:]) if logs else "")
@@ -2215,11 +3345,11 @@ def ufw_set_enabled(enable: bool) -> tuple[bool, str]:
     if enable:
         ok_ports, msg_ports = ufw_apply_port_rules()
         try:
-            r = _run_root([ufw_cmd, "--force", "enable"], timeout=10.0)
+            with _UFW_MUTATE_LOCK:
+                r = _run_root([ufw_cmd, "--force", "enable"], timeout=10.0)
             ok = (r.returncode == 0) and ok_ports
             msg = t("ufw.enabled", "UFW aktiviert.") if ok else t("ufw.enable_failed", "UFW Aktivierung fehlgeschlagen.")
-            extra = (r.stdout or "") + (("\n" + r.stderr) if r.stderr else "")
-            extra = extra.strip()
+            extra = _proc_output(r)
             if msg_ports:
                 extra = (msg_ports + "\n" + extra).strip()
             return ok, (msg + ("\n" + extra if extra else ""))
@@ -2227,10 +3357,10 @@ def ufw_set_enabled(enable: bool) -> tuple[bool, str]:
             return False, t("ufw.enable_failed_error", "UFW Aktivierung fehlgeschlagen: {error}", error=e)
     else:
         try:
-            r = _run_root([ufw_cmd, "disable"], timeout=10.0)
+            with _UFW_MUTATE_LOCK:
+                r = _run_root([ufw_cmd, "disable"], timeout=10.0)
             ok = (r.returncode == 0)
-            extra = (r.stdout or "") + (("\n" + r.stderr) if r.stderr else "")
-            extra = extra.strip()
+            extra = _proc_output(r)
             return ok, (t("ufw.disabled", "UFW deaktiviert.") + ("\n" + extra if extra else ""))
         except Exception as e:
             return False, t("ufw.disable_failed_error", "UFW deaktivieren fehlgeschlagen: {error}", error=e)
@@ -2242,6 +3372,7 @@ def start_ufw_install_background() -> tuple[bool, str]:
     Damit blockiert die Weboberfläche nicht.
     """
     unit_name = f"autodarts-ufw-install-{int(time.time())}"
+    _get_ufw_cmd.cache_clear()
     st = load_ufw_state() or {}
     st["started"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     st["unit"] = unit_name
@@ -2252,14 +3383,14 @@ def start_ufw_install_background() -> tuple[bool, str]:
     cmdline = (
         "export PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin:$PATH; "
         "set -e; "
-        "echo '[ufw] apt-get update'; apt-get update -y; "
-        "echo '[ufw] install'; apt-get install -y ufw; "
+        "echo '[ufw] apt-get update'; apt-get -qq update; "
+        "echo '[ufw] install'; apt-get install -y -q ufw; "
         f"echo '[ufw] rules'; {rules} "
         "echo '[ufw] enable'; ufw --force enable; "
         "echo '[ufw] done'; ufw status"
     )
-    # Logfile
-    cmdline = f"{{ {cmdline}; }} >> '{UFW_LOG}' 2>&1"
+    # Logfile (nur der letzte Lauf zählt – Statusseite zeigt ohnehin nur das Ende; Datei nicht endlos wachsen lassen)
+    cmdline = f"{{ {cmdline}; }} > '{UFW_LOG}' 2>&1"
 
     try:
         cmd = [
@@ -2272,7 +3403,8 @@ def start_ufw_install_background() -> tuple[bool, str]:
         if os.geteuid() != 0:
             cmd = ["sudo", "-n"] + cmd
 
-        res = subprocess.run(cmd, capture_output=True, text=True)
+        # --no-block: systemd-run kehrt sofort zurück, apt-Ausgabe landet nur im Logfile (nie im Speicher)
+        res = subprocess.run(cmd, capture_output=True, text=True, timeout=15.0)
         if res.returncode == 0:
             return True, t("ufw.install_started", "UFW Installation gestartet (läuft im Hintergrund).")
         st["status"] = "install_failed"
@@ -2340,381 +3472,19 @@ def start_os_update_background() -> tuple[bool, str]:
         save_os_update_state(state)
         return False, state["error"]
 
-def service_enable_now(service_name: str):
-    _run_systemctl(["enable", "--now", service_name], timeout=SYSTEMCTL_ACTION_TIMEOUT)
-
-def service_disable_now(service_name: str):
-    _run_systemctl(["disable", "--now", service_name], timeout=SYSTEMCTL_ACTION_TIMEOUT)
-
-def service_restart(service_name: str):
-    _run_systemctl(["restart", service_name], timeout=SYSTEMCTL_ACTION_TIMEOUT)
-
-def service_is_enabled(service_name: str) -> bool:
-    r = _run_systemctl(["is-enabled", service_name], timeout=SYSTEMCTL_CHECK_TIMEOUT)
-    return bool(r and r.stdout.strip() == "enabled")
-
-def autodarts_autoupdate_is_enabled() -> bool | None:
-    """True/False wenn Service existiert, sonst None."""
-    if not service_exists(AUTOUPDATE_SERVICE):
-        return None
-    return service_is_enabled(AUTOUPDATE_SERVICE)
-
-def autodarts_set_autoupdate(enabled: bool) -> tuple[bool, str]:
-    """Enable/disable autodarts auto-updater service.
-
-    Wenn der Service nicht existiert:
-      - disable => OK (bereits aus)
-      - enable  => Fehler (Service fehlt)
-    """
-    if not service_exists(AUTOUPDATE_SERVICE):
-        if not enabled:
-            return True, t("autoupdate.already_disabled_missing_service", "Auto-Update ist bereits deaktiviert (Service fehlt).")
-        return False, t("autoupdate.service_missing", "{service} nicht gefunden.", service=AUTOUPDATE_SERVICE)
-    try:
-        cmd = ["systemctl", ("enable" if enabled else "disable"), "--now", AUTOUPDATE_SERVICE]
-        if os.geteuid() != 0:
-            cmd = ["sudo", "-n"] + cmd
-        r = subprocess.run(cmd, capture_output=True, text=True)
-        if r.returncode == 0:
-            return True, (t("autoupdate.enabled", "Auto-Update aktiviert.") if enabled else t("autoupdate.disabled", "Auto-Update deaktiviert."))
-        err = (r.stderr or r.stdout or "").strip()
-        short = (err.splitlines()[0] if err else "systemctl fehlgeschlagen.")
-        return False, short
-    except Exception as e:
-        return False, t("autoupdate.change_failed", "Auto-Update konnte nicht geändert werden: {error}", error=e)
-
-
-
 # ---------------- Extensions Update (darts-caller / darts-wled) ----------------
 
 def load_extensions_update_state() -> dict:
-    try:
-        with open(EXTENSIONS_UPDATE_STATE, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
+    return _state_read(EXTENSIONS_UPDATE_STATE)
 
 
 def save_extensions_update_state(state: dict):
-    try:
-        os.makedirs(os.path.dirname(EXTENSIONS_UPDATE_STATE), exist_ok=True)
-        with open(EXTENSIONS_UPDATE_STATE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-    except Exception:
-        pass
+    _state_write(EXTENSIONS_UPDATE_STATE, state)
 
 
 def load_extensions_update_last() -> dict:
-    try:
-        with open(EXTENSIONS_UPDATE_LAST, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
-    except Exception:
-        return {}
-
-
-EXTENSIONS_UPDATE_SCRIPT_TEMPLATE = r"""#!/usr/bin/env bash
-set -euo pipefail
-
-# --- Einstellungen ---
-CALLER_DIR="/var/lib/autodarts/extensions/darts-caller"
-WLED_DIR="/var/lib/autodarts/extensions/darts-wled"
-
-CALLER_START="${CALLER_DIR}/start-custom.sh"
-WLED_WRAPPER="${WLED_DIR}/start-custom.sh"
-WLED_CONFIG="/var/lib/autodarts/config/darts-wled/start-custom.sh"
-
-BACKUP_ROOT="/var/lib/autodarts/config/backups"
-TS="$(date +'%Y%m%d-%H%M%S')"
-BK="${BACKUP_ROOT}/extensions-update-${TS}"
-
-LOG_FILE="/var/log/autodarts_extensions_update.log"
-RESULT_JSON="/var/lib/autodarts/extensions-update-last.json"
-
-FORCE="${FORCE:-0}"
-TARGET="${1:-all}"   # all | caller | wled
-
-# --- Helpers ---
-log() { echo "[$(date +'%F %T')] $*"; }
-
-mkdir -p "$(dirname "$LOG_FILE")" "$(dirname "$RESULT_JSON")"
-exec >>"$LOG_FILE" 2>&1
-
-# Lock gegen Doppelklick
-LOCK="/run/autodarts-extensions-update.lock"
-if command -v flock >/dev/null 2>&1; then
-  exec 9>"$LOCK"
-  flock -n 9 || { log "Update läuft bereits (lock: $LOCK)."; exit 0; }
-fi
-
-CALLER_STATUS="SKIPPED"
-WLED_STATUS="SKIPPED"
-ERRORS=""
-
-write_result() {
-  cat > "$RESULT_JSON" <<JSON
-{
-  "ts": "$(date +'%F %T')",
-  "target": "$TARGET",
-  "caller": "$CALLER_STATUS",
-  "wled": "$WLED_STATUS",
-  "backup": "$BK",
-  "force": "$FORCE",
-  "errors": "$(echo "$ERRORS" | tr '\n' ' ' | sed 's/"/\\"/g')"
-}
-JSON
-  chmod 666 "$RESULT_JSON" 2>/dev/null || true
-}
-trap write_result EXIT
-
-exists_unitfile() {
-  systemctl list-unit-files --no-legend 2>/dev/null | awk '{print $1}' | grep -qx "$1"
-}
-is_active() { systemctl is-active --quiet "$1"; }
-
-stop_if_exists() {
-  local svc="$1"
-  if exists_unitfile "$svc"; then
-    if is_active "$svc"; then
-      log "Stoppe $svc ..."
-      systemctl stop "$svc" || true
-      echo "1"
-    else
-      echo "0"
-    fi
-  else
-    echo "0"
-  fi
-}
-
-restart_if_exists() {
-  local svc="$1"
-  if exists_unitfile "$svc"; then
-    log "Starte/Restarte $svc ..."
-    systemctl restart "$svc" || systemctl start "$svc" || true
-  else
-    log "Service nicht gefunden: $svc (ok, übersprungen)"
-  fi
-}
-
-ensure_wrapper() {
-  if [[ -d "$WLED_DIR" ]]; then
-    log "Stelle sicher: WLED Wrapper zeigt auf Config-Startscript ..."
-    cat > "$WLED_WRAPPER" <<EOF
-#!/usr/bin/env bash
-exec "$WLED_CONFIG"
-EOF
-    chmod +x "$WLED_WRAPPER" || true
-  fi
-  if [[ -f "$WLED_CONFIG" ]]; then
-    chmod +x "$WLED_CONFIG" || true
-  fi
-}
-
-backup_file_if_exists() {
-  local src="$1"
-  local dst="$2"
-  if [[ -f "$src" ]]; then
-    mkdir -p "$(dirname "$dst")"
-    cp -a "$src" "$dst"
-    log "Backup: $src -> $dst"
-  else
-    log "Backup übersprungen (nicht gefunden): $src"
-  fi
-}
-
-restore_file_if_exists() {
-  local src="$1"
-  local dst="$2"
-  if [[ -f "$src" ]]; then
-    mkdir -p "$(dirname "$dst")"
-    cp -a "$src" "$dst"
-    log "Restore: $src -> $dst"
-  else
-    log "Restore übersprungen (Backup fehlt): $src"
-  fi
-}
-
-repo_update_status() {
-  # prints: CHANGED / UNCHANGED / SKIPPED
-  local dir="$1"
-  local label="$2"
-
-  if [[ ! -d "$dir/.git" ]]; then
-    log "$label: Kein Git-Repo: $dir (SKIPPED)"
-    echo "SKIPPED"
-    return 0
-  fi
-
-  git config --global --add safe.directory "$dir" >/dev/null 2>&1 || true
-
-  log "$label: Update Repo: $dir"
-  pushd "$dir" >/dev/null || { echo "SKIPPED"; return 0; }
+    return _state_read(EXTENSIONS_UPDATE_LAST)
 
-  local before after upstream
-  before="$(git rev-parse HEAD 2>/dev/null || echo "")"
-  upstream="$(git rev-parse --abbrev-ref --symbolic-full-name '@{u}' 2>/dev/null || echo "")"
-
-  git fetch --all --prune || true
-
-  if [[ -n "$upstream" ]]; then
-    git reset --hard "@{u}" || true
-  else
-    git pull --rebase --autostash || true
-  fi
-
-  after="$(git rev-parse HEAD 2>/dev/null || echo "")"
-  popd >/dev/null || true
-
-  if [[ -n "$before" && -n "$after" && "$before" != "$after" ]]; then
-    log "$label: CHANGED ($before -> $after)"
-    echo "CHANGED"
-  else
-    log "$label: UNCHANGED ($after)"
-    echo "UNCHANGED"
-  fi
-}
-
-venv_refresh_install_if_needed() {
-  local dir="$1"
-  local label="$2"
-  local changed="$3"
-  local requirements="$dir/requirements.txt"
-
-  [[ -d "$dir" ]] || return 0
-
-  if [[ "$FORCE" == "1" ]]; then
-    log "$label: FORCE=1 -> pip/venv wird ausgeführt."
-  elif [[ "$changed" != "CHANGED" && -d "$dir/.venv" ]]; then
-    log "$label: Keine Repo-Änderung und .venv vorhanden -> pip übersprungen."
-    return 0
-  fi
-
-  log "$label: Python venv/requirements: $dir"
-  pushd "$dir" >/dev/null || return 1
-
-  export PIP_DISABLE_PIP_VERSION_CHECK=1
-  export PIP_NO_INPUT=1
-
-  if [[ ! -d ".venv" ]]; then
-    if ! python3 -m venv .venv; then
-      ERRORS="${ERRORS}\n${label}: python3 -m venv fehlgeschlagen (python3-venv installiert?)"
-      popd >/dev/null || true
-      return 0
-    fi
-  fi
-
-  # shellcheck disable=SC1091
-  source .venv/bin/activate
-
-  python3 -m pip install -U pip setuptools wheel || true
-
-  if [[ -f "$requirements" ]]; then
-    if python3 -m pip install -r "$requirements" --upgrade; then
-      log "$label: requirements OK"
-    else
-      log "$label: requirements FAIL -> Retry ohne pyinstaller/pyinstaller-hooks-contrib"
-      grep -v -E '^pyinstaller(==|$)|^pyinstaller-hooks-contrib(==|$)' "$requirements" > /tmp/req-no-pyinstaller.txt
-      if ! python3 -m pip install -r /tmp/req-no-pyinstaller.txt --upgrade; then
-        ERRORS="${ERRORS}\n${label}: pip install requirements fehlgeschlagen"
-      fi
-    fi
-  else
-    log "$label: Keine requirements.txt gefunden (übersprungen)"
-  fi
-
-  deactivate || true
-  popd >/dev/null || true
-}
-
-# ---- MAIN ----
-log "===== Extensions Update START (target=${TARGET}) ====="
-
-if [[ "$(id -u)" -ne 0 ]]; then
-  log "Bitte mit sudo ausführen."
-  exit 1
-fi
-
-mkdir -p "$BK"
-log "Backup-Ordner: $BK"
-log "FORCE=$FORCE"
-
-DO_CALLER=0
-DO_WLED=0
-case "$TARGET" in
-  all) DO_CALLER=1; DO_WLED=1;;
-  caller) DO_CALLER=1;;
-  wled) DO_WLED=1;;
-  *) log "Unbekannter TARGET: $TARGET -> all"; DO_CALLER=1; DO_WLED=1;;
-esac
-
-CALLER_WAS_ACTIVE="0"
-WLED_WAS_ACTIVE="0"
-
-if [[ "$DO_CALLER" == "1" ]]; then
-  CALLER_WAS_ACTIVE="$(stop_if_exists darts-caller.service)"
-  backup_file_if_exists "$CALLER_START" "${BK}/darts-caller/start-custom.sh"
-fi
-
-if [[ "$DO_WLED" == "1" ]]; then
-  WLED_WAS_ACTIVE="$(stop_if_exists darts-wled.service)"
-  backup_file_if_exists "$WLED_WRAPPER" "${BK}/darts-wled/start-custom.wrapper.sh"
-  backup_file_if_exists "$WLED_CONFIG"  "${BK}/darts-wled/start-custom.config.sh"
-fi
-
-# Repos updaten
-if [[ "$DO_CALLER" == "1" ]]; then
-  CALLER_STATUS="$(repo_update_status "$CALLER_DIR" "CALLER")"
-fi
-if [[ "$DO_WLED" == "1" ]]; then
-  WLED_STATUS="$(repo_update_status "$WLED_DIR" "WLED")"
-fi
-
-# Restore start-custom
-if [[ "$DO_CALLER" == "1" ]]; then
-  restore_file_if_exists "${BK}/darts-caller/start-custom.sh" "$CALLER_START"
-fi
-if [[ "$DO_WLED" == "1" ]]; then
-  restore_file_if_exists "${BK}/darts-wled/start-custom.wrapper.sh" "$WLED_WRAPPER"
-  restore_file_if_exists "${BK}/darts-wled/start-custom.config.sh" "$WLED_CONFIG"
-  ensure_wrapper
-fi
-
-# venv + requirements nur wenn nötig
-if [[ "$DO_CALLER" == "1" ]]; then
-  venv_refresh_install_if_needed "$CALLER_DIR" "CALLER" "$CALLER_STATUS" || true
-fi
-if [[ "$DO_WLED" == "1" ]]; then
-  venv_refresh_install_if_needed "$WLED_DIR" "WLED" "$WLED_STATUS" || true
-fi
-
-# Services restart nur wenn vorher aktiv UND relevant geändert (oder FORCE)
-if [[ "$DO_CALLER" == "1" && "$CALLER_WAS_ACTIVE" == "1" ]]; then
-  if [[ "$FORCE" == "1" || "$CALLER_STATUS" == "CHANGED" ]]; then
-    restart_if_exists darts-caller.service
-  else
-    log "CALLER: war aktiv, aber UNCHANGED -> kein Restart."
-  fi
-fi
-
-if [[ "$DO_WLED" == "1" && "$WLED_WAS_ACTIVE" == "1" ]]; then
-  if [[ "$FORCE" == "1" || "$WLED_STATUS" == "CHANGED" ]]; then
-    restart_if_exists darts-wled.service
-  else
-    log "WLED: war aktiv, aber UNCHANGED -> kein Restart."
-  fi
-fi
-
-systemctl daemon-reload || true
-
-log "===== SUMMARY ====="
-log "CALLER: $CALLER_STATUS"
-log "WLED:   $WLED_STATUS"
-if [[ -n "$ERRORS" ]]; then
-  log "WARN/ERRORS: $ERRORS"
-fi
-log "Backup: $BK"
-log "===== Extensions Update DONE ====="
-"""
 
 def start_extensions_update_background(target: str = "all") -> tuple[bool, str]:
     """Startet das Extensions-Update (darts-caller + darts-wled) im Hintergrund via systemd-run.
@@ -2749,7 +3519,15 @@ def start_extensions_update_background(target: str = "all") -> tuple[bool, str]:
         save_extensions_update_state(state)
         return False, state["error"]
 
-    # Im Root-Context: CRLF entfernen (falls per Download reingekommen), ausführbar machen, dann starten
+    # Direkt als root: Script in Python vorbereiten und die Unit per D-Bus starten (keine Prozesse)
+    if os.geteuid() == 0 and _prepare_local_script(EXTENSIONS_UPDATE_SCRIPT) and \
+            _systemd_start_transient(unit_name, [EXTENSIONS_UPDATE_SCRIPT, target]):
+        state["unit"] = unit_name
+        state["method"] = "dbus"
+        save_extensions_update_state(state)
+        return True, t("extensions.update_started", "WLED UPDATE gestartet (Caller/WLED werden nur aktualisiert, wenn nötig).")
+
+    # Sonst im Root-Context via sudo: CRLF entfernen (falls per Download reingekommen), ausführbar machen, dann starten
     cmdline = "\n".join([
         "set -e",
         f"sed -i 's/\\r$//' {EXTENSIONS_UPDATE_SCRIPT} || true",
@@ -2789,16 +3567,21 @@ def start_extensions_update_background(target: str = "all") -> tuple[bool, str]:
         return False, state["error"]
 def service_enable_now(service_name: str):
     _run_systemctl(["enable", "--now", service_name], timeout=SYSTEMCTL_ACTION_TIMEOUT)
+    _systemd_states_forget()
 
 def service_disable_now(service_name: str):
     _run_systemctl(["disable", "--now", service_name], timeout=SYSTEMCTL_ACTION_TIMEOUT)
+    _systemd_states_forget()
 
 def service_restart(service_name: str):
     _run_systemctl(["restart", service_name], timeout=SYSTEMCTL_ACTION_TIMEOUT)
+    _systemd_states_forget()
 
 def service_is_enabled(service_name: str) -> bool:
-    r = _run_systemctl(["is-enabled", service_name], timeout=SYSTEMCTL_CHECK_TIMEOUT)
-    return bool(r and r.stdout.strip() == "enabled")
+    st = _systemd_states_memo().get(service_name)
+    if st is None:
+        st = systemctl_show_many([service_name]).get(service_name) or {}
+    return st.get("UnitFileState") == "enabled"
 
 def autodarts_autoupdate_is_enabled() -> bool | None:
     """True/False wenn Service existiert, sonst None."""
@@ -2822,6 +3605,7 @@ def autodarts_set_autoupdate(enabled: bool) -> tuple[bool, str]:
         if os.geteuid() != 0:
             cmd = ["sudo", "-n"] + cmd
         r = subprocess.run(cmd, capture_output=True, text=True)
+        _systemd_states_forget()
         if r.returncode == 0:
             return True, (t("autoupdate.enabled", "Auto-Update aktiviert.") if enabled else t("autoupdate.disabled", "Auto-Update deaktiviert."))
         err = (r.stderr or r.stdout or "").strip()
@@ -2905,20 +3689,19 @@ def ensure_autoupdate_default_once() -> str | None:
 
 def load_update_check() -> dict:
     try:
-        with open(AUTODARTS_UPDATE_CHECK, "r", encoding="utf-8") as f:
-            return json.load(f) or {}
+        return _json_read_file_cached(AUTODARTS_UPDATE_CHECK) or {}
     except Exception:
         return {}
 
 def save_update_check(d: dict):
     os.makedirs(os.path.dirname(AUTODARTS_UPDATE_CHECK), exist_ok=True)
-    with open(AUTODARTS_UPDATE_CHECK, "w", encoding="utf-8") as f:
-        json.dump(d, f, indent=2)
+    _json_write_file(AUTODARTS_UPDATE_CHECK, d)
 
+@functools.lru_cache(maxsize=1)
 def _get_platform_arch_for_autodarts() -> tuple[str, str]:
-    # Plattform ist im Installer 'linux'
+    # Plattform ist im Installer 'linux'; Architektur ändert sich zur Laufzeit nicht
     platform = "linux"
-    arch = subprocess.run(["uname", "-m"], capture_output=True, text=True).stdout.strip()
+    arch = os.uname().machine.strip()
     if arch in ("x86_64", "amd64"):
         arch = "amd64"
     elif arch in ("aarch64", "arm64"):
@@ -2927,8 +3710,9 @@ def _get_platform_arch_for_autodarts() -> tuple[str, str]:
         arch = "armv7l"
     return platform, arch
 
+@_ttl_cache("autodarts_paths")
 def _get_updater_channel() -> str:
-    # Versuche CHANNEL aus updater.sh zu lesen (latest/beta)
+    # Versuche CHANNEL aus updater.sh zu lesen (latest/beta); gecacht wie der updater.sh-Pfad
     updater = _get_autodarts_updater_path()
     if updater:
         try:
@@ -2963,18 +3747,19 @@ def fetch_latest_autodarts_version(channel: str | None = None, timeout_s: float
 # ---------------- Verbindungstest (Ping) ----------------
 
 PING_JOBS: dict[str, dict] = {}
+PING_STREAM_MAX_SEC = 120.0  # 30 Pakete à 1s + Reserve; danach fällt der Browser auf Polling zurück
+
+
+def _ping_notify(job: dict) -> None:
+    """Wartende Status-Streams wecken (job["changed"] = threading.Condition)."""
+    cond = job.get("changed")
+    if cond is not None:
+        with cond:
+            cond.notify_all()
 
 def get_default_gateway() -> str | None:
-    # Default-Route -> Gateway IP
-    try:
-        r = subprocess.run(["ip", "route", "show", "default"], capture_output=True, text=True)
-        if r.returncode != 0:
-            return None
-        # Beispiel: 'default via 192.168.178.1 dev wlan0 ...'
-        m = re.search(r"default\s+via\s+(\d+\.\d+\.\d+\.\d+)", r.stdout)
-        return m.group(1) if m else None
-    except Exception:
-        return None
+    # Default-Route -> Gateway IP (teilt sich den Cache mit _get_default_route_interface)
+    return _get_default_route_info()[1]
 
 
 def get_ping_uplink_interface() -> str | None:
@@ -2999,7 +3784,7 @@ def get_default_gateway_for_interface(iface: str) -> str | None:
         r = subprocess.run(["ip", "route", "show", "default", "dev", iface], capture_output=True, text=True, timeout=1.2)
         if r.returncode != 0:
             return None
-        m = re.search(r"default\s+via\s+(\d+\.\d+\.\d+\.\d+)", r.stdout or "")
+        m = _RE_ROUTE_GW.search(r.stdout or "")
         return m.group(1) if m else None
     except Exception:
         return None
@@ -3012,44 +3797,282 @@ def ping_iface_label(iface: str) -> str:
         return t("ping.label_wifi", "Verbindungstest über WLAN ({iface})", iface=iface)
     return t("ping.label_generic", "Verbindungstest über {iface}", iface=iface)
 
+PING_INTERVAL_SEC = 1.0
+PING_REPLY_TIMEOUT_SEC = 1.0
+_RE_PING_REPLY = re.compile(rb"icmp_seq=(\d+)[^\n]*?time=([\d.]+)")
+_PING_IDENT = itertools.count(os.getpid() & 0xFFFF)
+
+
+def _icmp_checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\0"
+    s = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    s = (s >> 16) + (s & 0xFFFF)
+    s += s >> 16
+    return ~s & 0xFFFF
+
+
+def _icmp_echo_socket(iface: str | None) -> tuple[socket.socket, bool] | None:
+    """ICMP-Socket für Echo-Requests -> (socket, raw) oder None (dann /bin/ping).
+
+    Bevorzugt unprivilegiert (SOCK_DGRAM, net.ipv4.ping_group_range), sonst SOCK_RAW (root/CAP_NET_RAW).
+    """
+    for kind, raw in ((socket.SOCK_DGRAM, False), (socket.SOCK_RAW, True)):
+        try:
+            sock = socket.socket(socket.AF_INET, kind, socket.IPPROTO_ICMP)
+        except OSError:
+            continue
+        if iface:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, getattr(socket, "SO_BINDTODEVICE", 25), iface.encode() + b"\0")
+            except OSError:
+                sock.close()
+                continue
+        return sock, raw
+    return None
+
+
+def _ping_icmp(job: dict, sock: socket.socket, raw: bool, target: str, count: int) -> list[float]:
+    """Echo-Requests direkt per Socket (Takt wie 'ping': 1/s, 1s Timeout je Antwort)."""
+    ident = next(_PING_IDENT) & 0xFFFF  # bei SOCK_DGRAM setzt der Kernel die ID selbst
+    payload = b"autodarts-web ping".ljust(56, b".")
+    times: list[float] = []
+    with sock:
+        for seq in range(1, count + 1):
+            if job.get("cancel"):
+                break
+            hdr = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+            pkt = struct.pack("!BBHHH", 8, 0, _icmp_checksum(hdr + payload), ident, seq) + payload
+            t0 = time.monotonic()
+            try:
+                sock.sendto(pkt, (target, 0))
+            except OSError:
+                t0 = None  # z.B. Network unreachable -> zählt als verloren
+            while t0 is not None:
+                left = t0 + PING_REPLY_TIMEOUT_SEC - time.monotonic()
+                if left <= 0:
+                    break
+                sock.settimeout(left)
+                try:
+                    data, addr = sock.recvfrom(2048)
+                except (socket.timeout, OSError):
+                    break
+                if raw:
+                    if addr[0] != target or len(data) < 20:
+                        continue
+                    data = data[(data[0] & 0x0F) * 4:]  # IP-Header abschneiden
+                if len(data) < 8:
+                    continue
+                r_type, _code, _sum, r_ident, r_seq = struct.unpack("!BBHHH", data[:8])
+                if r_type != 0 or r_seq != seq or (raw and r_ident != ident):
+                    continue
+                times.append((time.monotonic() - t0) * 1000.0)
+                job["received"] = len(times)
+                break
+            job["progress"] = seq
+            _ping_notify(job)
+            if seq < count:
+                rest = (t0 or time.monotonic()) + PING_INTERVAL_SEC - time.monotonic()
+                if rest > 0:
+                    time.sleep(rest)
+    return times
+
+
+def _ping_popen(job: dict, target: str, count: int) -> subprocess.Popen:
+    """Fallback ohne ICMP-Socket: /bin/ping starten, stdout liest der _PingDispatcher."""
+    p = subprocess.Popen(
+        ["ping", "-n", "-c", str(count), *(["-I", str(job.get("iface"))] if job.get("iface") else []), target],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    job["pid"] = p.pid
+    return p
+
+
+def _ping_finish(job: dict, times: list[float]):
+    if times:
+        job["min_ms"] = round(min(times), 2)
+        job["max_ms"] = round(max(times), 2)
+        job["avg_ms"] = round(sum(times) / len(times), 2)
+    job["done"] = True
+    _ping_notify(job)
+
+
+class _PingDispatcher:
+    """Ein Thread bedient die stdout-Pipes aller laufenden ping-Prozesse (selectors statt Thread je Ping).
+
+    Läuft nur, solange Pings aktiv sind; prüft alle 0.25s job["cancel"] und beendet den Prozess dann.
+    Beendete Prozesse werden per poll() eingesammelt – nie blockierend, damit andere Pings weiterlaufen.
+    """
+
+    REAP_GRACE_SEC = 2.0
+
+    def __init__(self):
+        self._sel = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._pending: list[tuple[dict, subprocess.Popen]] = []
+        self._reaping: list[tuple[subprocess.Popen, float]] = []
+        self._thread: threading.Thread | None = None
+
+    def submit(self, job: dict, p: subprocess.Popen):
+        with self._lock:
+            self._pending.append((job, p))
+            self._ensure_thread()
+
+    def _ensure_thread(self):
+        # nur mit self._lock aufrufen
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ping-dispatch", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        try:
+            while True:
+                with self._lock:
+                    pending, self._pending = self._pending, []
+                    if not pending and not self._sel.get_map() and not self._reaping:
+                        self._thread = None
+                        return
+                try:
+                    self._step(pending)
+                except Exception as e:
+                    print(f"[autodarts-web] Warnung ping-dispatch: {e}")
+                    time.sleep(0.25)
+        finally:
+            # unerwarteter Abbruch: Thread-Slot freigeben, wartende Jobs bekommen einen neuen Thread
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                    if self._pending:
+                        self._ensure_thread()
+
+    def _step(self, pending: list[tuple[dict, subprocess.Popen]]):
+        for job, p in pending:
+            try:
+                os.set_blocking(p.stdout.fileno(), False)
+                self._sel.register(p.stdout, selectors.EVENT_READ, {"job": job, "proc": p, "buf": b"", "times": []})
+            except Exception as e:
+                job["error"] = str(e)
+                self._close(p.stdout)
+                self._reap_later(p, kill=True)
+                _ping_finish(job, [])
+        for key, _ev in self._sel.select(timeout=0.25):
+            try:
+                self._read(key)
+            except Exception as e:
+                key.data["job"]["error"] = str(e)
+                self._drop(key, kill=True)
+        for key in list(self._sel.get_map().values()):
+            st = key.data
+            if st["job"].get("cancel") and st["proc"].poll() is None:
+                try:
+                    st["proc"].terminate()
+                except Exception:
+                    pass
+        self._reap()
+
+    @staticmethod
+    def _close(f):
+        try:
+            f.close()
+        except Exception:
+            pass
+
+    def _reap_later(self, p: subprocess.Popen, kill: bool = False):
+        if kill:
+            try:
+                p.kill()
+            except Exception:
+                pass
+        self._reaping.append((p, time.monotonic() + self.REAP_GRACE_SEC))
+
+    def _reap(self):
+        left = []
+        now = time.monotonic()
+        for p, deadline in self._reaping:
+            if p.poll() is not None:
+                continue
+            if now >= deadline:
+                try:
+                    p.kill()
+                except Exception:
+                    pass
+            left.append((p, deadline))
+        self._reaping = left
+
+    def _drop(self, key: selectors.SelectorKey, kill: bool = False):
+        """Pipe abmelden, Prozess zum Einsammeln vormerken, Job abschließen."""
+        st = key.data
+        try:
+            self._sel.unregister(key.fileobj)
+        except Exception:
+            pass
+        self._close(key.fileobj)
+        self._reap_later(st["proc"], kill=kill)
+        _ping_finish(st["job"], st["times"])
+
+    @staticmethod
+    def _line(st: dict, line: bytes):
+        # icmp_seq=1 time=12.3 ms (Bytes, nur die beiden Treffer werden umgewandelt)
+        m = _RE_PING_REPLY.search(line)
+        if m:
+            job = st["job"]
+            st["times"].append(float(m.group(2)))
+            job["progress"] = max(job.get("progress", 0), int(m.group(1)))
+            job["received"] = len(st["times"])
+            _ping_notify(job)
+
+    def _read(self, key: selectors.SelectorKey):
+        st = key.data
+        try:
+            chunk = os.read(key.fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        if chunk:
+            *lines, st["buf"] = (st["buf"] + chunk).split(b"\n")
+            for line in lines:
+                self._line(st, line)
+            return
+        # EOF: ping ist fertig oder wurde beendet
+        if st["buf"]:
+            self._line(st, st["buf"])
+        self._drop(key)
+
+
+_PING_DISPATCHER = _PingDispatcher()
+
+
 def _ping_worker(job_id: str, target: str, count: int):
     job = PING_JOBS.get(job_id)
     if not job:
         return
     times = []
-    received = 0
     try:
-        p = subprocess.Popen(
-            ["ping", "-n", "-c", str(count), *(["-I", str(job.get("iface"))] if job and job.get("iface") else []), target],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
-        )
-        job["pid"] = p.pid
-        for line in p.stdout or []:
-            # icmp_seq=1 time=12.3 ms
-            m = re.search(r"icmp_seq=(\d+).*time=([0-9\.]+)\s*ms", line)
-            if m:
-                seq = int(m.group(1))
-                t = float(m.group(2))
-                times.append(t)
-                received = len(times)
-                job["progress"] = max(job.get("progress", 0), seq)
-                job["received"] = received
-        p.wait()
-        # Summary parse (optional)
-        # '30 packets transmitted, 30 received, 0% packet loss, time ...'
-        # We prefer our measured times for min/avg/max.
+        s = _icmp_echo_socket(job.get("iface"))
+        if s is None:
+            # Ergebnis/done setzt der Dispatcher, dieser Worker ist sofort wieder frei
+            _PING_DISPATCHER.submit(job, _ping_popen(job, target, count))
+            return
+        times = _ping_icmp(job, s[0], s[1], target, count)
     except Exception as e:
         job["error"] = str(e)
+    _ping_finish(job, times)
+
+# Eigener Pool: ein 30s-Ping darf die WLED-Checks im _NET_POOL nicht verdrängen. Es läuft immer nur ein Ping.
+_PING_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ping")
+_PING_START_LOCK = threading.Lock()
+PING_JOB_STALE_SEC = 900.0
+
+
+def _ping_job_running() -> bool:
+    now = time.time()
+    return any(
+        not j.get("done") and not j.get("cancel") and now - float(j.get("started") or 0) < PING_JOB_STALE_SEC
+        for j in list(PING_JOBS.values())
+    )
 
-    if times:
-        job["min_ms"] = round(min(times), 2)
-        job["max_ms"] = round(max(times), 2)
-        job["avg_ms"] = round(sum(times) / len(times), 2)
-    job["done"] = True
 
 def start_ping_test(count: int = 30) -> tuple[bool, str, str | None]:
     iface = get_ping_uplink_interface()
@@ -3061,7 +4084,16 @@ def start_ping_test(count: int = 30) -> tuple[bool, str, str | None]:
         return False, t("ping.no_gateway_on_iface", "Kein Gateway auf {iface} gefunden (nicht verbunden?).", iface=iface), None
 
     job_id = uuid.uuid4().hex[:10]
-    PING_JOBS[job_id] = {
+    with _PING_START_LOCK:
+        if _ping_job_running():
+            return False, t("ping.already_running", "Es läuft bereits ein Verbindungstest. Bitte kurz warten."), None
+        PING_JOBS[job_id] = _ping_new_job(gw, iface, count)
+    _PING_POOL.submit(_ping_worker, job_id, gw, int(count))
+    return True, "Ping gestartet.", job_id
+
+
+def _ping_new_job(gw: str, iface: str, count: int) -> dict:
+    return {
         "target": gw,
         "iface": iface,
         "iface_label": ping_iface_label(iface),
@@ -3075,24 +4107,67 @@ def start_ping_test(count: int = 30) -> tuple[bool, str, str | None]:
         "avg_ms": None,
         "error": None,
         "pid": None,
+        "cancel": False,
+        "changed": threading.Condition(),
     }
-    th = threading.Thread(target=_ping_worker, args=(job_id, gw, int(count)), daemon=True)
-    th.start()
-    return True, "Ping gestartet.", job_id
 
 
 
 
 # ---------------- WLED reachability ----------------
 
+# Keep-Alive-Verbindungen je WLED-Host: der Status-Poll spart sich so den TCP-Handshake.
+# Ein Lock je Host; ist er belegt, nimmt der Aufrufer eine einmalige eigene Verbindung.
+_WLED_HTTP_CONNS: dict[str, http.client.HTTPConnection] = {}
+_WLED_HTTP_LOCKS: dict[str, threading.Lock] = {}
+_WLED_HTTP_LOCKS_LOCK = threading.Lock()
+
+
+def _wled_http_get(host: str, path: str = "/json/info", timeout_s: float = 1.2) -> tuple[int, bytes]:
+    """GET http://<host><path> über eine wiederverwendete Verbindung -> (status, body). Wirft bei Fehlern."""
+    with _WLED_HTTP_LOCKS_LOCK:
+        lock = _WLED_HTTP_LOCKS.setdefault(host, threading.Lock())
+    pooled = lock.acquire(blocking=False)
+    try:
+        conn = _WLED_HTTP_CONNS.pop(host, None) if pooled else None
+        reused = conn is not None
+        for attempt in (0, 1):
+            if conn is None:
+                conn = http.client.HTTPConnection(host, timeout=timeout_s)
+            else:
+                conn.timeout = timeout_s
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout_s)
+            try:
+                conn.request("GET", path, headers={"User-Agent": "AutodartsPanel", "Connection": "keep-alive"})
+                r = conn.getresponse()
+                body = r.read()  # komplett lesen, sonst ist die Verbindung nicht wiederverwendbar
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError, http.client.CannotSendRequest):
+                conn.close()
+                conn = None
+                if reused and attempt == 0:
+                    reused = False  # Server hat die alte Verbindung geschlossen -> einmal frisch versuchen
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if pooled and not r.will_close:
+                _WLED_HTTP_CONNS[host] = conn
+            else:
+                conn.close()
+            return r.status, body
+        raise ConnectionError(host)
+    finally:
+        if pooled:
+            lock.release()
+
+
 def is_wled_reachable(ip_or_host: str, timeout_sec: float = 1.2) -> bool:
-    url = f"http://{ip_or_host}/json/info"
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "AutodartsPanel"})
-        with urllib.request.urlopen(req, timeout=timeout_sec) as r:
-            status = getattr(r, "status", 200)
-            return 200 <= status < 300
-    except (urllib.error.URLError, TimeoutError, Exception):
+        status, _body = _wled_http_get(ip_or_host, "/json/info", timeout_s=timeout_sec)
+        return 200 <= status < 300
+    except Exception:
         return False
 
 
@@ -3104,13 +4179,83 @@ _HTTP_CACHE: dict[tuple[str, float], tuple[float, bool, str | None]] = {}
 _DNS_TTL_SEC = 60.0
 _HTTP_TTL_SEC = 4.0
 
+# DNS-Ergebnisse zusätzlich in einer Datei (L2): ein Neustart des Panels muss .local-Namen
+# nicht sofort neu per avahi auflösen. Liegt wie die anderen Laufzeit-States unter /tmp.
+NET_CACHE_PATH = "/tmp/autodarts-web-net-cache.json"
+_NET_CACHE_LOADED = False
+
+
+def _net_cache_load() -> None:
+    """Noch gültige DNS-Einträge einmalig aus NET_CACHE_PATH in _DNS_CACHE übernehmen."""
+    global _NET_CACHE_LOADED
+    if _NET_CACHE_LOADED:
+        return
+    _NET_CACHE_LOADED = True
+    now = time.time()
+    for host, e in _state_read(NET_CACHE_PATH).items():
+        try:
+            ts = float(e.get("ts", 0))
+            if 0 <= now - ts < _DNS_TTL_SEC and host not in _DNS_CACHE:
+                _DNS_CACHE[host] = (ts, e.get("ip") or None)
+        except Exception:
+            pass
+
+
+def _net_cache_store(host: str, ts: float, ip: str | None) -> None:
+    """Eintrag in NET_CACHE_PATH mergen (flock gegen parallele Schreiber, Datei selbst atomar ersetzt)."""
+    try:
+        with open(NET_CACHE_PATH + ".lock", "a") as lf:
+            fcntl.flock(lf, fcntl.LOCK_EX)
+            data = _state_read(NET_CACHE_PATH)
+            data = {h: e for h, e in data.items() if isinstance(e, dict) and ts - float(e.get("ts", 0)) < _DNS_TTL_SEC}
+            data[host] = {"ip": ip, "ts": ts}
+            _state_write(NET_CACHE_PATH, data)
+    except Exception:
+        pass
+
+def _resolve_mdns_dbus(host: str, timeout_s: float = 0.6):
+    """.local-Namen direkt beim avahi-daemon auflösen (D-Bus ResolveHostName, IPv4).
+
+    IP, None (nicht gefunden) oder _DBUS_UNAVAILABLE (kein gi/System-Bus/avahi).
+    """
+    bus = _systemd_bus()  # System-Bus-Verbindung (auch für avahi)
+    if bus is None:
+        return _DBUS_UNAVAILABLE
+    try:
+        # interface=-1 (alle), protocol=0 (INET), aprotocol=0 (INET), flags=0
+        res = bus.call_sync(
+            "org.freedesktop.Avahi", "/", "org.freedesktop.Avahi.Server",
+            "ResolveHostName", Variant("(iisiu)", (-1, 0, host, 0, 0)), VariantType.new("(iisisu)"),
+            Gio.DBusCallFlags.NONE, int(max(0.2, timeout_s) * 1000), None,
+        ).unpack()
+        return res[4] or None
+    except Exception as e:
+        msg = str(e)
+        if "ServiceUnknown" in msg or "NameHasNoOwner" in msg:
+            return _DBUS_UNAVAILABLE  # avahi-daemon läuft nicht -> Fallback
+        return None  # Timeout / nicht gefunden
+
+
+# Eigener kleiner Pool für getaddrinfo: resolve_host_to_ip_fast läuft oft selbst in einem _NET_POOL-Worker
+# (WLED-Check); ein Submit in denselben, evtl. vollen Pool würde nur bis zum Timeout in der Warteschlange stehen.
+_RESOLVE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="resolve")
+
+
+def _getaddrinfo_ipv4(host: str) -> str | None:
+    try:
+        infos = socket.getaddrinfo(host, None, socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return None
+    return infos[0][4][0] if infos else None
+
+
 def resolve_host_to_ip_fast(host: str, timeout_s: float = 0.6) -> str | None:
     """
     Schnelle, robuste Namensauflösung (wichtig bei .local/mDNS):
     - IP bleibt IP
-    - .local bevorzugt via avahi-resolve-host-name (mit Timeout)
-    - sonst via getent (mit Timeout)
-    - KEIN socket.gethostbyname (kann sonst lange blockieren)
+    - .local bevorzugt über avahi per D-Bus (sonst avahi-resolve-host-name mit Timeout)
+    - sonst getaddrinfo im _RESOLVE_POOL mit Deadline – der Aufrufer wartet nie länger als timeout_s
+      (getaddrinfo selbst kennt keinen Timeout und kann sonst lange blockieren)
     """
     host = (host or "").strip()
     if not host:
@@ -3118,42 +4263,38 @@ def resolve_host_to_ip_fast(host: str, timeout_s: float = 0.6) -> str | None:
 
     # Wenn schon IP
     try:
-        socket.inet_aton(host)
-        return host
-    except OSError:
-        pass
-
-    # .local -> avahi
-    if host.endswith(".local") and shutil.which("avahi-resolve-host-name"):
-        try:
-            r = subprocess.run(
-                ["avahi-resolve-host-name", "-4", host],
-                capture_output=True,
-                text=True,
-                timeout=max(0.2, timeout_s),
-            )
-            if r.returncode == 0 and r.stdout.strip():
-                parts = r.stdout.strip().split()
-                if len(parts) >= 2:
-                    return parts[1].strip()
-        except Exception:
-            pass
+        socket.inet_aton(host)
+        return host
+    except OSError:
+        pass
 
-    # Fallback -> getent
-    if shutil.which("getent"):
-        try:
-            r = subprocess.run(
-                ["getent", "hosts", host],
-                capture_output=True,
-                text=True,
-                timeout=max(0.2, timeout_s),
-            )
-            if r.returncode == 0 and r.stdout.strip():
-                return r.stdout.strip().split()[0].strip()
-        except Exception:
-            pass
+    # .local -> avahi
+    if host.endswith(".local"):
+        ip = _resolve_mdns_dbus(host, timeout_s=timeout_s)
+        if ip is _DBUS_UNAVAILABLE:
+            ip = None
+            if shutil.which("avahi-resolve-host-name"):
+                try:
+                    r = subprocess.run(
+                        ["avahi-resolve-host-name", "-4", host],
+                        capture_output=True,
+                        text=True,
+                        timeout=max(0.2, timeout_s),
+                    )
+                    if r.returncode == 0 and r.stdout.strip():
+                        parts = r.stdout.strip().split()
+                        if len(parts) >= 2:
+                            ip = parts[1].strip()
+                except Exception:
+                    pass
+        if ip:
+            return ip
 
-    return None
+    # Fallback -> NSS (wie getent hosts), aber ohne Prozess
+    try:
+        return _RESOLVE_POOL.submit(_getaddrinfo_ipv4, host).result(timeout=max(0.2, timeout_s))
+    except Exception:
+        return None
 
 
 def resolve_host_to_ip(host: str) -> str | None:
@@ -3162,6 +4303,7 @@ def resolve_host_to_ip(host: str) -> str | None:
     if not host:
         return None
 
+    _net_cache_load()
     now = time.time()
     cached = _DNS_CACHE.get(host)
     if cached and (now - cached[0]) < _DNS_TTL_SEC:
@@ -3169,6 +4311,7 @@ def resolve_host_to_ip(host: str) -> str | None:
 
     ip = resolve_host_to_ip_fast(host, timeout_s=0.6)
     _DNS_CACHE[host] = (now, ip)
+    _net_cache_store(host, now, ip)
     return ip
 
 
@@ -3196,12 +4339,8 @@ def is_http_reachable(host: str, timeout_s: float = 0.6) -> tuple[bool, str | No
 
     ok = False
     try:
-        url = f"http://{target}/json/info"
-        req = urllib.request.Request(url, headers={"User-Agent": "AutodartsPanel"})
-        with urllib.request.urlopen(req, timeout=timeout_s) as r:
-            status = getattr(r, "status", 200)
-            data = r.read(64)  # reicht als Lebenszeichen
-            ok = (200 <= status < 300) and bool(data)
+        status, data = _wled_http_get(target, "/json/info", timeout_s=timeout_s)
+        ok = (200 <= status < 300) and bool(data)
     except Exception:
         ok = False
 
@@ -3239,8 +4378,7 @@ def load_wled_config() -> dict:
 
     # Neu vorhanden?
     try:
-        with open(WLED_CONFIG_PATH, "r", encoding="utf-8") as f:
-            cfg = json.load(f) or {}
+        cfg = _json_read_file_cached(WLED_CONFIG_PATH) or {}
     except FileNotFoundError:
         cfg = None
     except Exception:
@@ -3283,6 +4421,44 @@ def load_wled_config() -> dict:
     return {"master_enabled": master_enabled, "targets": norm_targets}
 
 
+# (Datei-Identität, (master_enabled, bands, hosts)) – die Startseite rechnet nur nach Änderungen neu
+_WLED_INDEX_CACHE: tuple | None = None
+
+
+def _wled_pad_targets(targets: list, host_fmt: str = "") -> list:
+    """Auf genau 3 Slots bringen: fehlende Slots (Dart LED<n>, aus) in einem extend anhängen, Rest abschneiden."""
+    base = len(targets)
+    if base < 3:
+        targets.extend(
+            {"label": f"Dart LED{i}", "host": host_fmt.format(i), "enabled": False}
+            for i in range(base + 1, 4)
+        )
+    return targets[:3]
+
+
+def wled_index_view() -> tuple[bool, list[dict], list[str]]:
+    """Master-Schalter, Band-Schalter und Hosts der 3 Slots für index.html (Ergebnis nicht verändern)."""
+    global _WLED_INDEX_CACHE
+    try:
+        st = os.stat(WLED_CONFIG_PATH)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    hit = _WLED_INDEX_CACHE
+    if key is not None and hit is not None and hit[0] == key:
+        return hit[1]
+
+    cfg = load_wled_config()
+    targets = cfg.get("targets", []) or []
+    targets = _wled_pad_targets(targets)
+    bands = [{"slot": i, "enabled": bool(tg.get("enabled", False))} for i, tg in enumerate(targets, start=1)]
+    hosts = [str(tg.get("host", "")).strip() for tg in targets]
+    val = (bool(cfg.get("master_enabled", True)), bands, hosts)
+    if key is not None:
+        _WLED_INDEX_CACHE = (key, val)
+    return val
+
+
 def save_wled_config(cfg: dict):
     os.makedirs(os.path.dirname(WLED_CONFIG_PATH), exist_ok=True)
     with open(WLED_CONFIG_PATH, "w", encoding="utf-8") as f:
@@ -3310,42 +4486,39 @@ def update_darts_wled_start_custom_weps(hosts: list[str]) -> tuple[bool, str]:
         return False, t("wled.start_custom_missing", "start-custom.sh nicht gefunden: {path}", path=DARTS_WLED_START_CUSTOM)
 
     try:
-        with open(DARTS_WLED_START_CUSTOM, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        data = Path(DARTS_WLED_START_CUSTOM).read_bytes()
     except Exception as e:
         return False, t("wled.start_custom_read_failed", "start-custom.sh konnte nicht gelesen werden: {error}", error=e)
 
-    new_lines = []
-    replaced = False
-    weps_re = re.compile(r'^\s*-WEPS\b')
-
-    for line in lines:
-        if (not replaced) and weps_re.match(line):
-            indent = line.split("-WEPS", 1)[0]
-            has_backslash = line.rstrip().endswith("\\")
-            args = " ".join([f'"{h}"' for h in hosts]) if hosts else f'"{WLED_MDNS_NAME}"'
-            new_line = f"{indent}-WEPS {args} "
-            new_line += "\\\n" if has_backslash else "\n"
-            new_lines.append(new_line)
-            replaced = True
-        else:
-            new_lines.append(line)
+    # Nur die erste -WEPS Zeile ersetzen, direkt auf den Bytes (kein Zerlegen in Zeilen)
+    args = " ".join([f'"{h}"' for h in hosts]) if hosts else f'"{WLED_MDNS_NAME}"'
+
+    def _weps(m):
+        has_backslash = m.group(2).rstrip().endswith(b"\\")
+        return m.group(1) + f"-WEPS {args} ".encode("utf-8") + (b"\\" if has_backslash else b"")
+
+    new_data, replaced = _RE_WEPS_LINE.subn(_weps, data, count=1)
 
     if not replaced:
         return False, t("wled.weps_line_missing_unexpected", "Keine -WEPS Zeile in start-custom.sh gefunden (unerwartetes Format).")
 
-    # Backup einmalig
+    if new_data == data:
+        return True, "start-custom.sh (-WEPS) unverändert."
+
+    # Backup des vorherigen Stands (neu, sobald die Datei jünger als das Backup ist)
     try:
         bak = DARTS_WLED_START_CUSTOM + ".bak"
-        if not os.path.exists(bak):
-            with open(bak, "w", encoding="utf-8") as f:
-                f.writelines(lines)
+        try:
+            bak_mtime = os.stat(bak).st_mtime_ns
+        except FileNotFoundError:
+            bak_mtime = -1
+        if bak_mtime < os.stat(DARTS_WLED_START_CUSTOM).st_mtime_ns:
+            _atomic_write_bytes(bak, data)
     except Exception:
         pass
 
     try:
-        with open(DARTS_WLED_START_CUSTOM, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
+        _atomic_write_bytes(DARTS_WLED_START_CUSTOM, new_data)
     except Exception as e:
         return False, t("wled.start_custom_write_failed", "start-custom.sh konnte nicht geschrieben werden: {error}", error=e)
 
@@ -3392,7 +4565,7 @@ def _wled_presets_read_file() -> list[str]:
 
 def _wled_presets_find_weps_index(lines: list[str]) -> int:
     for idx, line in enumerate(lines):
-        if re.match(r'^\s*-WEPS\b', line or ""):
+        if _RE_WEPS_START.match(line or ""):
             return idx
     return -1
 
@@ -3401,7 +4574,7 @@ def _wled_presets_extract_weps_text(lines: list[str], weps_idx: int) -> str:
     if weps_idx < 0 or weps_idx >= len(lines):
         return _wled_presets_default_weps_text()
     cleaned = _wled_presets_strip_line(lines[weps_idx])
-    m = re.match(r'^-WEPS\s+(.*)$', cleaned)
+    m = _RE_WEPS_VALUE.match(cleaned)
     if not m:
         return _wled_presets_default_weps_text()
     value = (m.group(1) or "").strip()
@@ -3415,7 +4588,7 @@ def _wled_presets_block_end(lines: list[str], start_idx: int) -> int:
         if stripped == "" or stripped.startswith("#"):
             idx += 1
             continue
-        if re.match(r'^-[A-Za-z0-9]+\b', stripped):
+        if _RE_WLED_ARG.match(stripped):
             idx += 1
             continue
         break
@@ -3468,7 +4641,7 @@ def _wled_presets_row_from_line(line: str) -> dict | None:
     if not cleaned or cleaned.startswith("#"):
         return None
 
-    m = re.match(r'^(-A\d+)\s+(\d+)-(\d+)\s+"ps\|(\d+)(?:\|([^\"]+))?"$', cleaned)
+    m = _RE_WLED_PRESET_RANGE.match(cleaned)
     if m:
         return {
             "preset": int(m.group(4)),
@@ -3483,7 +4656,7 @@ def _wled_presets_row_from_line(line: str) -> dict | None:
             "to": int(m.group(3)),
         }
 
-    m = re.match(r'^(-S(\d+))\s+"ps\|(\d+)(?:\|([^\"]+))?"$', cleaned)
+    m = _RE_WLED_PRESET_SCORE.match(cleaned)
     if m:
         score_val = int(m.group(2))
         preset = int(m.group(3))
@@ -3514,7 +4687,7 @@ def _wled_presets_row_from_line(line: str) -> dict | None:
             "to": 60,
         }
 
-    m = re.match(r'^(-[A-Z0-9]+)\s+"ps\|(\d+)(?:\|([^\"]+))?"$', cleaned)
+    m = _RE_WLED_PRESET_FIXED.match(cleaned)
     if m:
         arg = m.group(1)
         preset = int(m.group(2))
@@ -3793,21 +4966,26 @@ def save_wled_flag(enabled: bool):
 def tail_file(path: str, n: int = 20, max_chars: int = 6000) -> str:
     """Liest die letzten N Zeilen einer Datei, ohne die komplette Datei einzulesen."""
     try:
-        if not os.path.exists(path):
+        # Vom Dateiende in 8-KiB-Blöcken rückwärts lesen, bis N Zeilen da sind (max. max_chars*6 Bytes)
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
             return ""
-
-        # Wir lesen von hinten in Blöcken, bis wir genug Zeilen haben.
-        block_size = 4096
-        data = b""
-        with open(path, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            pos = f.tell()
-
-            while pos > 0 and data.count(b"\n") <= (n + 2) and len(data) < (max_chars * 6):
-                step = min(block_size, pos)
-                pos -= step
-                f.seek(pos)
-                data = f.read(step) + data
+        try:
+            pos = os.fstat(fd).st_size
+            left = max_chars * 6
+            chunks: list[bytes] = []
+            newlines = 0
+            while pos > 0 and left > 0 and newlines <= n:
+                block = min(8192, pos, left)
+                pos -= block
+                left -= block
+                chunk = os.pread(fd, block, pos)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+        finally:
+            os.close(fd)
+        data = b"".join(reversed(chunks))
 
         text = data.decode("utf-8", errors="replace")
         out = "\n".join(text.splitlines()[-n:])
@@ -3820,11 +4998,14 @@ def tail_file(path: str, n: int = 20, max_chars: int = 6000) -> str:
 # ---------------- darts-caller start-custom.sh read/write ----------------
 
 # === Pi monitor test: status/lock helpers (leichtgewichtig, damit man nicht mehrfach startet) ===
-def _pid_cmdline_contains(pid: int, needle: str) -> bool:
+def _pid_cmdline_contains(pid: int, needle: str | bytes) -> bool:
+    needle_b = needle if isinstance(needle, bytes) else needle.encode("utf-8")
     try:
         with open(f"/proc/{pid}/cmdline", "rb") as f:
-            cmd = f.read().decode("utf-8", "ignore").replace("\x00", " ")
-        return needle in cmd
+            cmd = f.read()
+        if len(cmd) < len(needle_b):
+            return False
+        return needle_b in cmd.replace(b"\x00", b" ")
     except Exception:
         return False
 
@@ -3837,14 +5018,13 @@ def _is_pi_monitor_running(pid: int | None) -> bool:
     except Exception:
         return False
     # sicherstellen, dass es wirklich unser Script ist (pid reuse vermeiden)
-    return _pid_cmdline_contains(pid, "pi_monitor_test.sh")
+    return _pid_cmdline_contains(pid, b"pi_monitor_test.sh")
 
 
 def _read_pi_monitor_state() -> dict:
     state: dict = {}
     try:
-        with open(PI_MONITOR_STATE, "r", encoding="utf-8") as f:
-            state = json.load(f) or {}
+        state = _json_read_file_cached(PI_MONITOR_STATE) or {}
     except Exception:
         state = {}
     pid = None
@@ -3886,20 +5066,25 @@ def _read_pi_monitor_state() -> dict:
     }
 
 
+@functools.lru_cache(maxsize=64)
+def _fmt_ts(ts) -> str:
+    """Unix-Zeit -> 'YYYY-mm-dd HH:MM:SS' (lokal); "" bei fehlendem/ungültigem Wert. Start/Ende ändern sich während eines Laufs nicht."""
+    if ts is None:
+        return ""  # time.localtime(None) wäre "jetzt" – und bliebe im Cache hängen
+    try:
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+    except Exception:
+        return ""
+
+
 def get_pi_monitor_status() -> dict:
     st = _read_pi_monitor_state()
     if not st.get("running"):
         return {"running": False, "msg": t("pi_monitor.not_active", "Nicht aktiv.")}
 
     # menschenlesbare Infos
-    try:
-        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(st["started_ts"]))
-    except Exception:
-        started = ""
-    try:
-        ends = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(st["ends_ts"]))
-    except Exception:
-        ends = ""
+    started = _fmt_ts(st.get("started_ts"))
+    ends = _fmt_ts(st.get("ends_ts"))
     return {
         "running": True,
         "msg": t("pi_monitor.running_status", "Läuft (PID {pid}). Start: {started} · Ende: {ends}", pid=st.get("pid"), started=started, ends=ends),
@@ -3907,6 +5092,19 @@ def get_pi_monitor_status() -> dict:
     }
 
 
+# Start/Stop weckt offene Status-Streams sofort (statt bis zum nächsten Tick zu warten)
+_PI_MON_CHANGED = threading.Condition()
+PI_MONITOR_STREAM_TICK_SEC = 1.0
+PI_MONITOR_STREAM_MAX_SEC = 45.0  # danach verbindet der Browser neu (kein lange belegter Worker-Thread)
+# Waitress merkt einen geschlossenen Tab erst beim Schreiben: regelmäßig einen SSE-Kommentar senden
+PI_MONITOR_STREAM_HEARTBEAT_SEC = 5.0
+
+
+def _pi_monitor_notify() -> None:
+    with _PI_MON_CHANGED:
+        _PI_MON_CHANGED.notify_all()
+
+
 def start_pi_monitor(interval_s: int, duration_min: int) -> dict:
     # Guard: nicht mehrfach starten
     st = _read_pi_monitor_state()
@@ -3961,6 +5159,8 @@ def start_pi_monitor(interval_s: int, duration_min: int) -> dict:
             f.write(str(proc.pid))
     except Exception:
         pass
+    _invalidate("index_files")  # CSV/README entstehen jetzt
+    _pi_monitor_notify()
 
     return {"ok": True, "running": True, "msg": t("pi_monitor.started", "Pi Monitor gestartet."), **get_pi_monitor_status()}
 
@@ -3974,8 +5174,14 @@ def stop_pi_monitor() -> dict:
         os.kill(int(pid), 15)  # SIGTERM
     except Exception as e:
         return {"ok": False, "running": True, "msg": t("generic.stop_failed", "Konnte nicht stoppen: {error}", error=e)}
+    _invalidate("index_files")
+    _pi_monitor_notify()
     return {"ok": True, "running": False, "msg": t("generic.stop_sent", "Stop gesendet.")}
 
+# start-custom.sh: Zuweisung einer der drei Credential-Variablen (prefix inkl. '=' in Gruppe 1)
+_RE_CALLER_VAR = re.compile(rb"^([ \t]*(autodarts_email|autodarts_password|autodarts_board_id)[ \t]*=[ \t]*)[^\n]*$", re.M)
+
+
 def _read_var_from_line(line: str) -> str:
     if "=" not in line:
         return ""
@@ -4002,55 +5208,57 @@ def read_darts_caller_credentials():
         return email, password, board_id, False, ""
 
     try:
-        with open(DARTS_CALLER_START_CUSTOM, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        data = Path(DARTS_CALLER_START_CUSTOM).read_bytes()
     except Exception as e:
         return email, password, board_id, True, t("caller.read_start_custom_failed", "Fehler beim Lesen von start-custom.sh: {error}", error=e)
 
-    for line in lines:
-        s = line.strip()
-        if not s or s.startswith("#"):
-            continue
-        if s.startswith("autodarts_email"):
-            email = _read_var_from_line(s)
-        elif s.startswith("autodarts_password"):
-            password = _read_var_from_line(s)
-        elif s.startswith("autodarts_board_id"):
-            board_id = _read_var_from_line(s)
+    vals = {}
+    for m in _RE_CALLER_VAR.finditer(data):
+        vals[m.group(2).decode()] = _read_var_from_line(m.group(0).decode("utf-8", errors="replace").strip())
+    email = vals.get("autodarts_email", "")
+    password = vals.get("autodarts_password", "")
+    board_id = vals.get("autodarts_board_id", "")
 
     return email, password, board_id, True, ""
 
 
-def _set_var_line(lines, key, value):
-    pattern = re.compile(rf'^(\s*{re.escape(key)}\s*=\s*).*$')
-    for i, line in enumerate(lines):
-        if line.lstrip().startswith("#"):
-            continue
-        m = pattern.match(line)
-        if m:
-            prefix = m.group(1)
-            safe = str(value).replace("\\", "\\\\").replace('"', '\\"')
-            lines[i] = f'{prefix}"{safe}"\n'
-            return True
-    return False
+def _set_var_lines(data: bytes, values: dict) -> tuple[bytes, set]:
+    """Setzt je Key das erste Vorkommen (ein Durchlauf über die Bytes) -> (neue Daten, gesetzte Keys)."""
+    done = set()
 
+    def _sub(m):
+        key = m.group(2).decode()
+        if key not in values or key in done:
+            return m.group(0)
+        done.add(key)
+        safe = str(values[key]).replace("\\", "\\\\").replace('"', '\\"')
+        return m.group(1) + f'"{safe}"'.encode("utf-8")
 
-def write_darts_caller_credentials_strict(path, email, password, board_id):
-    with open(path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+    return _RE_CALLER_VAR.sub(_sub, data), done
 
-    ok1 = _set_var_line(lines, "autodarts_email", email) if email is not None else True
-    ok2 = _set_var_line(lines, "autodarts_password", password) if password is not None else True
-    ok3 = _set_var_line(lines, "autodarts_board_id", board_id) if board_id is not None else True
 
-    if not (ok1 and ok2 and ok3):
+def write_darts_caller_credentials_strict(path, email, password, board_id) -> bool:
+    """Setzt die Zugangsdaten in start-custom.sh. False: Inhalt unverändert, nichts geschrieben."""
+    data = Path(path).read_bytes()
+
+    values = {
+        k: v for k, v in (
+            ("autodarts_email", email),
+            ("autodarts_password", password),
+            ("autodarts_board_id", board_id),
+        ) if v is not None
+    }
+    new_data, done = _set_var_lines(data, values)
+    if len(done) != len(values):
         raise RuntimeError(t("caller.required_lines_missing", "start-custom.sh: benötigte Variablenzeilen nicht gefunden – es wurde NICHT geschrieben."))
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+    if new_data == data:
+        return False
+    _atomic_write_bytes(path, new_data)
+    return True
 
 
-def write_darts_caller_credentials(email, password, board_id):
+def write_darts_caller_credentials(email, password, board_id) -> bool:
     return write_darts_caller_credentials_strict(
         DARTS_CALLER_START_CUSTOM,
         email=email,
@@ -4064,7 +5272,7 @@ def write_darts_caller_credentials(email, password, board_id):
 def _normalize_lang_code(code: str) -> str:
     code = str(code or "").strip().lower().replace(" ", "")
     code = code.replace("-", "_")
-    code = re.sub(r"[^a-z0-9_]", "", code)
+    code = _RE_LANG_CODE_BAD.sub("", code)
     return code
 
 
@@ -4185,7 +5393,7 @@ def _normalize_lang_payload(data, fallback_code: str):
         abk = fallback_code
 
     flag = str(config.get("flag") or "").strip().lower()
-    flag = re.sub(r"[^a-z0-9_-]", "", flag)
+    flag = _RE_FLAG_BAD.sub("", flag)
     if not flag:
         flag = _default_flag_for_lang(abk)
 
@@ -4198,7 +5406,26 @@ def _normalize_lang_payload(data, fallback_code: str):
     return payload
 
 
+_LANG_DEFAULT_CACHE: tuple | None = None  # (stat-Key, Ergebnis)
+
+
 def _read_lang_default_config() -> tuple[str | None, str | None]:
+    """Default-Sprache aus config_lang.json; neu gelesen nur, wenn sich die Datei geändert hat."""
+    global _LANG_DEFAULT_CACHE
+    try:
+        st = os.stat(LANG_CONFIG_PATH)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    hit = _LANG_DEFAULT_CACHE
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    res = _read_lang_default_config_uncached()
+    _LANG_DEFAULT_CACHE = (key, res)
+    return res
+
+
+def _read_lang_default_config_uncached() -> tuple[str | None, str | None]:
     try:
         if not LANG_CONFIG_PATH.exists():
             return None, None
@@ -4266,7 +5493,38 @@ def _load_lang_json(code: str) -> tuple[dict | None, str | None, str | None, str
         return None, str(path), f"Datei konnte nicht gelesen werden: {e}", normalized
 
 
+# Alle Sprachdateien geparst: (Verzeichnis-Signatur, Ergebnis). t() läuft mehrfach pro Seitenaufruf,
+# die JSONs ändern sich aber nur beim Upload/Update -> nur neu parsen, wenn sich eine Datei geändert hat.
+_LANG_ALL_CACHE: tuple | None = None
+
+
+def _lang_dir_signature() -> tuple | None:
+    try:
+        with os.scandir(LANG_JSON_DIR) as it:
+            entries = [e for e in it if e.name.startswith("lang_") and e.name.endswith(".json")]
+        sig = []
+        for e in entries:
+            st = e.stat()  # folgt Symlinks wie _iter_all_lang_paths
+            sig.append((e.name, st.st_ino, st.st_mtime_ns, st.st_size))
+        return tuple(sorted(sig))
+    except OSError:
+        return None
+
+
 def _load_all_lang_jsons() -> tuple[dict, list[dict], str | None]:
+    """(languages, sources, err) – gecacht, Ergebnis nicht verändern."""
+    global _LANG_ALL_CACHE
+    sig = _lang_dir_signature()
+    hit = _LANG_ALL_CACHE
+    if sig is not None and hit is not None and hit[0] == sig:
+        return hit[1]
+    res = _load_all_lang_jsons_uncached()
+    if sig is not None:
+        _LANG_ALL_CACHE = (sig, res)
+    return res
+
+
+def _load_all_lang_jsons_uncached() -> tuple[dict, list[dict], str | None]:
     languages: dict[str, dict] = {}
     sources: list[dict] = []
 
@@ -4569,19 +5827,134 @@ def help_page():
     return resp
 
 
+def _submit_parallel(jobs: dict) -> dict:
+    """Unabhängige Lese-Jobs (ohne Request-Kontext) im Stats-Pool starten -> {key: Future}."""
+    return {k: _STATS_POOL.submit(fn) for k, fn in jobs.items()}
+
+
+def _collect_parallel(futures: dict) -> dict:
+    """Ergebnisse von _submit_parallel() einsammeln -> {key: Ergebnis|None}."""
+    res = {}
+    for k, fut in futures.items():
+        try:
+            res[k] = fut.result()
+        except Exception:
+            res[k] = None
+    return res
+
+
+def _run_parallel(jobs: dict) -> dict:
+    """Unabhängige Lese-Jobs gleichzeitig ausführen und auf alle warten -> {key: Ergebnis|None}."""
+    return _collect_parallel(_submit_parallel(jobs))
+
+
+# Werte, die index.html nur im freigeschalteten Admin-Bereich braucht (gesperrt: diese Defaults, keine Datei-/UFW-Zugriffe)
+_INDEX_ADMIN_DEFAULTS = {
+    "webpanel_check": {},
+    "webpanel_state": {},
+    "webpanel_log_tail": "",
+    "uvc_backup_info": {},
+    "extensions_state": {},
+    "extensions_last": {},
+    "extensions_log_tail": "",
+    "update_state": {},
+    "update_log_tail": "",
+    "os_update_state": {},
+    "os_update_log_tail": "",
+    "ufw_installed": False,
+    "ufw_state": {},
+    "admin_gpio_exists": False,
+    "pi_csv_tail": "",
+    "pi_csv_exists": False,
+    "pi_readme_exists": False,
+}
+
+
+def _index_admin_submit() -> dict:
+    # State-JSONs, Log-Tails und exists-Checks sind voneinander unabhängig -> gleichzeitig lesen statt nacheinander
+    return _submit_parallel({
+        "webpanel_check": load_webpanel_update_check,
+        "webpanel_state": load_webpanel_update_state,
+        "webpanel_log_tail": functools.partial(tail_file, WEBPANEL_UPDATE_LOG, n=25, max_chars=3500),
+        "extensions_state": load_extensions_update_state,
+        "extensions_last": load_extensions_update_last,
+        "extensions_log_tail": functools.partial(tail_file, EXTENSIONS_UPDATE_LOG, n=25, max_chars=3500),
+        "update_state": load_update_state,
+        "update_log_tail": functools.partial(tail_file, AUTODARTS_UPDATE_LOG, n=25, max_chars=3500),
+        "os_update_state": load_os_update_state,
+        "os_update_log_tail": functools.partial(tail_file, OS_UPDATE_LOG, n=25, max_chars=3500),
+        "pi_csv_tail": functools.partial(tail_file, PI_MONITOR_CSV, n=20),
+    })
+
+
+@_ttl_cache("index_files")
+def _index_files_present() -> dict[str, bool]:
+    """Existenz der Admin-Dateien (ändern sich selten): ein scandir je Verzeichnis statt stat je Datei.
+
+    Die Pi-Monitor-CSV fehlt hier bewusst: sie entsteht erst während des Tests (nach dem Start);
+    pi_csv_exists kommt aus dem ohnehin gelesenen Tail.
+    """
+    paths = {
+        "pi_readme_exists": PI_MONITOR_README,
+        "admin_gpio_exists": ADMIN_GPIO_IMAGE,
+    }
+    by_dir: dict[str, list[tuple[str, str]]] = {}
+    for key, path in paths.items():
+        by_dir.setdefault(os.path.dirname(path), []).append((key, os.path.basename(path)))
+    out = {}
+    for d, items in by_dir.items():
+        try:
+            with os.scandir(d) as it:
+                names = {e.name for e in it}
+        except OSError:
+            names = set()
+        for key, name in items:
+            out[key] = name in names
+    return out
+
+
+def _index_admin_context(pending: dict | None = None) -> dict:
+    """Admin-Werte für index.html; pending = bereits gestartete Lese-Jobs aus _index_admin_submit()."""
+    files = _collect_parallel(pending if pending is not None else _index_admin_submit())
+    ctx = dict(_INDEX_ADMIN_DEFAULTS)
+    ctx.update({k: v for k, v in files.items() if v})  # None/leer -> Default
+    ctx.update(_index_files_present())
+    ctx["pi_csv_exists"] = bool(ctx["pi_csv_tail"])
+    ctx["uvc_backup_info"] = get_uvc_backup_info()
+
+    ufw_state = load_ufw_state()
+    ufw_installed = ufw_is_installed()
+    if ufw_state.get("status") == "installing":
+        ufw_state = ufw_refresh_state(quick=True)
+        ufw_installed = bool(ufw_state.get("installed"))
+    ctx["ufw_state"] = ufw_state
+    ctx["ufw_installed"] = ufw_installed
+    return ctx
+
+
 @app.route("/", methods=["GET"])
 def index():
     # Auto-Update soll standardmäßig AUS sein (einmalige Umstellung)
     ensure_msg = ensure_autoupdate_default_once()
+    # Unit-Zustände für die Seite mit einer Abfrage holen – läuft parallel zu den Statuswerten
+    index_units = [AUTOUPDATE_SERVICE, DARTS_WLED_SERVICE]
+    units_fut = _STATS_POOL.submit(systemctl_show_many, index_units)
+    # Admin-Dateien (State-JSONs, Log-Tails) schon jetzt lesen lassen – überlappt mit Statuswerten/Kamera/LED
+    admin_unlocked = bool(session.get('admin_unlocked', False))
+    admin_pending = _index_admin_submit() if admin_unlocked else None
 
     (
         ssid, ip, lan_ip,
         autodarts_active, autodarts_version,
-        cpu_pct, mem_used, mem_total, temp_c,
         wifi_ok, lan_ok, dongle_ok,
         net_ok, ping_uplink_label,
         current_ap_ssid,
     ) = get_index_stats_cached()
+    try:
+        unit_states = units_fut.result(timeout=SYSTEMCTL_CHECK_TIMEOUT)
+    except Exception:
+        unit_states = None
+    _systemd_states_prefetch(index_units, states=unit_states)
     wifi_signal = None  # Signalstärke wird nur auf Knopfdruck geladen
     ad_restarted = request.args.get("ad_restarted") == "1"
     wifi_conn_name, wifi_autoconnect_enabled = get_active_wifi_autoconnect_state()
@@ -4646,11 +6019,8 @@ def index():
     caller_installed = os.path.exists(DARTS_CALLER_DIR)
     wled_installed = os.path.exists(DARTS_WLED_DIR)
     # WLED / LED-Bänder (User-UI: nur Ein/Aus)
-    wled_cfg = load_wled_config()
+    wled_master_enabled, wled_bands, wled_hosts = wled_index_view()
 
-    wled_master_enabled = bool(wled_cfg.get("master_enabled", True))
-
-    admin_unlocked = bool(session.get('admin_unlocked', False))
     adminerr = request.args.get('adminerr')
     adminmsg = (request.args.get('adminmsg') or '').strip()
     adminok = (request.args.get('adminok') == '1')
@@ -4658,42 +6028,15 @@ def index():
     msg = request.args.get('msg', '') or (ensure_msg or '')
     open_adver = (request.args.get('open_adver') == '1')
 
+    admin_ctx = _index_admin_context(admin_pending) if admin_unlocked else _INDEX_ADMIN_DEFAULTS
+
     autoupdate_enabled = autodarts_autoupdate_is_enabled()
     update_check = load_update_check()
     webpanel_version = get_webpanel_version()
-    webpanel_check = load_webpanel_update_check() if admin_unlocked else {}
+    webpanel_check = admin_ctx["webpanel_check"]
     webpanel_update_available = bool(webpanel_check.get('installed') and webpanel_check.get('latest') and webpanel_check.get('installed') != webpanel_check.get('latest'))
-    webpanel_state = load_webpanel_update_state() if admin_unlocked else {}
-    webpanel_log_tail = tail_file(WEBPANEL_UPDATE_LOG, n=25, max_chars=3500) if admin_unlocked else ""
-    uvc_backup_info = get_uvc_backup_info() if admin_unlocked else {}
-
-    extensions_state = load_extensions_update_state() if admin_unlocked else {}
-    extensions_last = load_extensions_update_last() if admin_unlocked else {}
-    extensions_log_tail = tail_file(EXTENSIONS_UPDATE_LOG, n=25, max_chars=3500) if admin_unlocked else ""
     update_available = bool(update_check.get('installed') and update_check.get('latest') and update_check.get('installed') != update_check.get('latest'))
 
-    update_state = load_update_state() if admin_unlocked else {}
-    update_log_tail = tail_file(AUTODARTS_UPDATE_LOG, n=25, max_chars=3500) if admin_unlocked else ""
-
-    os_update_state = load_os_update_state() if admin_unlocked else {}
-    os_update_log_tail = tail_file(OS_UPDATE_LOG, n=25, max_chars=3500) if admin_unlocked else ""
-
-    ufw_installed = ufw_is_installed()
-    ufw_state = load_ufw_state() if admin_unlocked else {}
-    if admin_unlocked and ufw_state.get("status") == "installing":
-        ufw_state = ufw_refresh_state()
-        ufw_installed = bool(ufw_state.get("installed"))
-
-    wled_targets = wled_cfg.get("targets", []) or []
-    while len(wled_targets) < 3:
-        wled_targets.append({"label": f"Dart LED{len(wled_targets)+1}", "host": "", "enabled": False})
-    wled_targets = wled_targets[:3]
-
-    wled_bands = []
-    wled_hosts = []
-    for i, t in enumerate(wled_targets, start=1):
-        wled_bands.append({"slot": i, "enabled": bool(t.get("enabled", False))})
-        wled_hosts.append(str(t.get("host", "")).strip())
     wled_service_exists = service_exists(DARTS_WLED_SERVICE)
     wled_service_active = service_is_active(DARTS_WLED_SERVICE) if wled_service_exists else False
 
@@ -4707,13 +6050,9 @@ def index():
     can_check = caller_installed and caller_exists and bool(caller_email and caller_board_id)
 
     # Admin / Doku
-    admin_gpio_exists = os.path.exists(ADMIN_GPIO_IMAGE)
-    pi_csv_tail = tail_file(PI_MONITOR_CSV, n=20)
-    pi_csv_exists = os.path.exists(PI_MONITOR_CSV)
     pi_mon_status = get_pi_monitor_status()
-    pi_readme_exists = os.path.exists(PI_MONITOR_README)
 
-    return render_template(
+    html = render_template(
         "index.html",
         darts_url=darts_url,
         max_cams=MAX_CAMERAS,
@@ -4723,10 +6062,6 @@ def index():
         cam_count_found=cam_count_found,
         cam_info_message=cam_info_message,
         base_port=STREAM_BASE_PORT,
-        cpu_pct=cpu_pct,
-        mem_used=mem_used,
-        mem_total=mem_total,
-        temp_c=temp_c,
         cam_indices=cam_indices,
         caller_email=caller_email,
         caller_board_id=caller_board_id,
@@ -4741,22 +6076,12 @@ def index():
         wled_hosts=wled_hosts,
         wled_master_enabled=wled_master_enabled,
         admin_unlocked=admin_unlocked,
-        os_update_state=os_update_state,
-        os_update_log_tail=os_update_log_tail,
-        ufw_installed=ufw_installed,
-        ufw_state=ufw_state,
         adminerr=adminerr,
         adminmsg=adminmsg,
         adminok=adminok,
-        update_state=update_state,
-        update_log_tail=update_log_tail,
         wled_service_exists=wled_service_exists,
         wled_service_active=wled_service_active,
-        admin_gpio_exists=admin_gpio_exists,
-        pi_csv_tail=pi_csv_tail,
         pi_mon_status=pi_mon_status,
-        pi_csv_exists=pi_csv_exists,
-        pi_readme_exists=pi_readme_exists,
         pi_monitor_script=PI_MONITOR_SCRIPT,
         pi_monitor_csv=PI_MONITOR_CSV,
         pi_monitor_readme=PI_MONITOR_README,
@@ -4784,22 +6109,23 @@ def index():
         update_available=update_available,
         wifi_interface=WIFI_INTERFACE,
         webpanel_version=webpanel_version,
-        webpanel_check=webpanel_check,
         webpanel_update_available=webpanel_update_available,
-        webpanel_state=webpanel_state,
-        webpanel_log_tail=webpanel_log_tail,
-        uvc_backup_info=uvc_backup_info,
         autodarts_versions_choices=get_autodarts_versions_choices(),
         autodarts_stable_version=autodarts_stable_from_menu(),
         autodarts_latest_online=autodarts_latest_cached(),
         autodarts_last_version=autodarts_last_version(),
         settings_path=SETTINGS_PATH,
-        extensions_state=extensions_state,
-        extensions_last=extensions_last,
-        extensions_log_tail=extensions_log_tail,
         lan_ok=lan_ok,
         lan_ip=lan_ip,
+        **admin_ctx,
     )
+    # ETag über das HTML: Reload/Zurück mit unveränderter Seite -> 304 ohne Body (spart die Übertragung).
+    # Schwach (W/): _gzip_response komprimiert danach, Identity- und gzip-Body sind nicht byte-gleich.
+    # private + no-cache statt max-age: nach Aktionen leitet vieles auf "/" um, das muss immer frisch sein.
+    resp = make_response(html)
+    resp.headers["Cache-Control"] = "private, no-cache"
+    resp.add_etag(weak=True)
+    return resp.make_conditional(request)
 
 
 @app.route("/led/save", methods=["POST"])
@@ -4821,7 +6147,11 @@ def led_save():
         ad_board = cur_board
 
     try:
-        write_darts_caller_credentials(ad_email, ad_password, ad_board)
+        # gleiche (gelesene, nicht leere) Werte wie in der Datei -> weder zweites Lesen noch Schreiben;
+        # fehlende Zeilen meldet weiterhin der Writer
+        cur = (cur_email, cur_pw, cur_board)
+        if err or not all(cur) or (ad_email, ad_password, ad_board) != cur:
+            write_darts_caller_credentials(ad_email, ad_password, ad_board)
         return redirect(url_for("index", ledcheck="ok", ledmsg=t("caller.saved", "Gespeichert (start-custom.sh aktualisiert).")))
     except Exception as e:
         return redirect(url_for("index", ledcheck="bad", ledmsg=t("generic.save_failed", "Speichern fehlgeschlagen: {error}", error=e)))
@@ -4847,11 +6177,11 @@ def wled_presets():
 
 
 def _wled_json_get(ip_or_host: str, path: str = "/json/state", timeout_s: float = 1.2):
-    url = f"http://{ip_or_host}{path}"
-    req = urllib.request.Request(url, headers={"User-Agent": "AutodartsPanel"})
-    with urllib.request.urlopen(req, timeout=timeout_s) as r:
-        raw = r.read().decode("utf-8", errors="ignore") or "{}"
-        return json.loads(raw)
+    status, body = _wled_http_get(ip_or_host, path, timeout_s=timeout_s)
+    if status >= 400:
+        raise urllib.error.HTTPError(f"http://{ip_or_host}{path}", status, f"HTTP {status}", None, None)
+    raw = body.decode("utf-8", errors="ignore") or "{}"
+    return json.loads(raw)
 
 
 def _wled_json_post(ip_or_host: str, payload: dict, path: str = "/json/state", timeout_s: float = 1.2):
@@ -5138,9 +6468,7 @@ def wled_save_targets():
         targets = []
 
     # Ensure 3 targets
-    while len(targets) < 3:
-        targets.append({"label": f"Dart LED{len(targets)+1}", "host": f"Dart-Led{len(targets)+1}.local", "enabled": False})
-    targets = targets[:3]
+    targets = _wled_pad_targets(targets, "Dart-Led{}.local")
 
     for i in range(1, 4):
         label = request.form.get(f"wled_label_{i}", f"Dart LED{i}").strip()[:40]
@@ -5233,9 +6561,7 @@ def wled_set_enabled(slot: int):
     cfg["master_enabled"] = True  # User-UI hat keinen Master-Schalter
 
     targets = cfg.get("targets", []) or []
-    while len(targets) < 3:
-        targets.append({"label": f"Dart LED{len(targets)+1}", "host": "", "enabled": False})
-    targets = targets[:3]
+    targets = _wled_pad_targets(targets)
 
     targets[slot - 1]["enabled"] = bool(enabled)
     cfg["targets"] = targets
@@ -5250,7 +6576,7 @@ def wled_set_enabled(slot: int):
         else:
             service_disable_now(DARTS_WLED_SERVICE)
 
-    return jsonify({"ok": True})
+    return _jsonify_fast({"ok": True})
 
 
 @app.route("/wled/save-enabled", methods=["POST"])
@@ -5259,9 +6585,7 @@ def wled_save_enabled():
     cfg["master_enabled"] = True  # User-UI hat keinen Master-Schalter
 
     targets = cfg.get("targets", []) or []
-    while len(targets) < 3:
-        targets.append({"label": f"Dart LED{len(targets)+1}", "host": "", "enabled": False})
-    targets = targets[:3]
+    targets = _wled_pad_targets(targets)
 
     for i in range(1, 4):
         enabled = request.form.get(f"wled_enabled_{i}") == "1"
@@ -5291,9 +6615,7 @@ def wled_save_hosts():
     cfg["master_enabled"] = True  # User-UI hat keinen Master-Schalter
 
     targets = cfg.get("targets", []) or []
-    while len(targets) < 3:
-        targets.append({"label": f"Dart LED{len(targets)+1}", "host": "", "enabled": False})
-    targets = targets[:3]
+    targets = _wled_pad_targets(targets)
 
     for i in range(1, 4):
         host = (request.form.get(f"wled_host_{i}", "") or "").strip()
@@ -5339,12 +6661,8 @@ def _wled_check_one(host: str) -> tuple[bool, str | None]:
 
     ok = False
     try:
-        url = f"http://{ip}/json/info"
-        req = urllib.request.Request(url, headers={"User-Agent": "AutodartsPanel"})
-        with urllib.request.urlopen(req, timeout=0.6) as r:
-            status = getattr(r, "status", 200)
-            data = r.read(32)
-            ok = (200 <= status < 300) and bool(data)
+        status, data = _wled_http_get(ip, "/json/info", timeout_s=0.6)
+        ok = (200 <= status < 300) and bool(data)
     except Exception:
         ok = False
 
@@ -5352,35 +6670,85 @@ def _wled_check_one(host: str) -> tuple[bool, str | None]:
     return ok, ip
 
 
+# Laufende Checks je Host: gleichzeitige Anfragen (mehrere Tabs/Schalter) warten auf denselben Future
+_WLED_INFLIGHT: dict[str, object] = {}
+_WLED_INFLIGHT_LOCK = threading.Lock()
+
+
+def _wled_check_submit(host: str):
+    with _WLED_INFLIGHT_LOCK:
+        fut = _WLED_INFLIGHT.get(host)
+        if fut is not None:
+            return fut
+        fut = _NET_POOL.submit(_wled_check_one, host)
+        _WLED_INFLIGHT[host] = fut
+    # außerhalb des Locks: bei bereits fertigem Future läuft der Callback sofort
+    fut.add_done_callback(lambda f, h=host: _wled_inflight_done(h, f))
+    return fut
+
+
+def _wled_inflight_done(host: str, fut) -> None:
+    with _WLED_INFLIGHT_LOCK:
+        if _WLED_INFLIGHT.get(host) is fut:
+            del _WLED_INFLIGHT[host]
+
+
+def check_wled_targets(hosts: list[str], timeout_s: float = 1.2) -> dict[str, tuple[bool, str | None]]:
+    """_wled_check_one für alle Hosts parallel (_NET_POOL); Gesamtdauer max. timeout_s.
+
+    Hosts ohne Antwort bis zur Deadline gelten als offline.
+    """
+    hosts = list(dict.fromkeys(h for h in hosts if h))
+    out: dict[str, tuple[bool, str | None]] = {h: (False, None) for h in hosts}
+    if not hosts:
+        return out
+    futures = {_wled_check_submit(h): h for h in hosts}
+    try:
+        for fut in as_completed(futures, timeout=timeout_s):
+            try:
+                out[futures[fut]] = fut.result()
+            except Exception:
+                pass
+    except FutureTimeoutError:
+        pass
+    return out
+
+
 
 @app.route("/api/wifi/signal", methods=["GET"])
 def api_wifi_signal():
     """Signalstärke (0..100) des aktuellen WLANs – nur auf Knopfdruck."""
     now = time.time()
     try:
-        if (now - float(WIFI_SIGNAL_CACHE.get('ts', 0.0))) < WIFI_SIGNAL_CACHE_TTL_SEC:
-            return jsonify({"signal": WIFI_SIGNAL_CACHE.get('v')})
+        with _STATUS_CACHE_LOCK:
+            if (now - float(WIFI_SIGNAL_CACHE.get('ts', 0.0))) < WIFI_SIGNAL_CACHE_TTL_SEC:
+                return _jsonify_fast({"signal": WIFI_SIGNAL_CACHE.get('v')})
     except Exception:
         pass
 
     sig = get_wifi_signal_percent()
     try:
-        WIFI_SIGNAL_CACHE['ts'] = now
-        WIFI_SIGNAL_CACHE['v'] = sig
+        with _STATUS_CACHE_LOCK:
+            WIFI_SIGNAL_CACHE['ts'] = now
+            WIFI_SIGNAL_CACHE['v'] = sig
     except Exception:
         pass
     iface = _get_default_route_interface() or _get_connected_wifi_interface(prefer=WIFI_INTERFACE if WIFI_INTERFACE else None) or WIFI_INTERFACE
     if iface == AP_INTERFACE:
         iface = WIFI_INTERFACE
-    return jsonify({"signal": sig, "iface": iface})
+    return _jsonify_fast({"signal": sig, "iface": iface})
+
+@app.route("/api/sysinfo", methods=["GET"])
+def api_sysinfo():
+    """CPU/RAM/Temperatur für den Mini-PC-Kasten – lädt main.js nach, damit die Startseite nicht darauf wartet."""
+    cpu_pct, mem_used, mem_total, temp_c = get_system_stats()
+    return _jsonify_fast({"cpu_pct": cpu_pct, "mem_used": mem_used, "mem_total": mem_total, "temp_c": temp_c})
 
 @app.route("/api/wled/status", methods=["GET"])
 def api_wled_status():
     cfg = load_wled_config()
     targets = cfg.get("targets", []) or []
-    while len(targets) < 3:
-        targets.append({"label": f"Dart LED{len(targets)+1}", "host": "", "enabled": False})
-    targets = targets[:3]
+    targets = _wled_pad_targets(targets)
 
     bands = []
     work = []
@@ -5391,20 +6759,21 @@ def api_wled_status():
         if enabled and host:
             work.append((i, host))
 
-    # Parallel (3 Stück max) -> schneller
+    # Parallel -> Antwort nach max. 1.2s, egal wie viele Hosts hängen
     if work:
-        with ThreadPoolExecutor(max_workers=min(3, len(work))) as ex:
-            futures = {ex.submit(_wled_check_one, host): slot for slot, host in work}
-            for fut, slot in futures.items():
-                try:
-                    ok, ip = fut.result(timeout=1.2)
-                except Exception:
-                    ok, ip = (False, None)
-                bands[slot - 1]["online"] = bool(ok)
-                bands[slot - 1]["ip"] = ip
+        results = check_wled_targets([host for _, host in work], timeout_s=1.2)
+        for slot, host in work:
+            ok, ip = results.get(host, (False, None))
+            bands[slot - 1]["online"] = bool(ok)
+            bands[slot - 1]["ip"] = ip
 
         # enabled, aber kein host -> online bleibt None (wird als "Prüfe…" angezeigt)
-    return jsonify({"bands": bands})
+    # ETag über den Inhalt: unveränderter Status -> 304 ohne Body (Browser revalidiert mit cache: 'no-cache');
+    # schwach (W/), weil _gzip_response den Body danach evtl. noch komprimiert
+    resp = _jsonify_fast({"bands": bands})
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.add_etag(weak=True)
+    return resp.make_conditional(request)
 
 
 # === Pi Monitor Test API (Admin) ===
@@ -5414,7 +6783,40 @@ def api_pi_monitor_status():
         return jsonify({"ok": False, "msg": t("admin.locked", "Admin gesperrt.")}), 403
     st = get_pi_monitor_status()
     st["ok"] = True
-    return jsonify(st)
+    return _jsonify_fast(st)
+
+
+@app.route("/api/pi_monitor/stream", methods=["GET"])
+def api_pi_monitor_stream():
+    """Server-Sent Events: Status nur bei Änderung senden; endet, sobald der Test nicht (mehr) läuft."""
+    if not bool(session.get("admin_unlocked", False)):
+        return jsonify({"ok": False, "msg": t("admin.locked", "Admin gesperrt.")}), 403
+
+    def generate():
+        last = None
+        now = time.monotonic()
+        until = now + PI_MONITOR_STREAM_MAX_SEC
+        beat = now + PI_MONITOR_STREAM_HEARTBEAT_SEC
+        while True:
+            st = get_pi_monitor_status()
+            st["ok"] = True
+            now = time.monotonic()
+            if st != last:
+                yield f"data: {json.dumps(st)}\n\n"
+                last = st
+                beat = now + PI_MONITOR_STREAM_HEARTBEAT_SEC
+            elif now >= beat:
+                yield ": \n\n"  # Kommentar-Frame: EventSource ignoriert ihn, toter Client fällt auf
+                beat = now + PI_MONITOR_STREAM_HEARTBEAT_SEC
+            if not st.get("running") or now >= until:
+                return
+            with _PI_MON_CHANGED:
+                _PI_MON_CHANGED.wait(PI_MONITOR_STREAM_TICK_SEC)
+
+    resp = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
 
 
 @app.route("/api/pi_monitor/start", methods=["POST"])
@@ -5652,6 +7054,7 @@ def admin_autodarts_check():
     if not bool(session.get("admin_unlocked", False)):
         return _forbidden_response()
 
+    _invalidate("autodarts_paths")  # manueller Check: updater.sh/CHANNEL frisch lesen
     installed = get_autodarts_version()
     latest = fetch_latest_autodarts_version()
     channel = _get_updater_channel()
@@ -5811,7 +7214,8 @@ def set_cams():
         save_cam_config(cfg)
         return redirect(url_for("index"))
 
-    cameras = detect_camera_inventory(MAX_CAMERAS)
+    # "Kameras suchen" ist ein ausdrücklicher Neuscan: immer frisch proben (Cache nur für implizite Aufrufe)
+    cameras = detect_camera_inventory(MAX_CAMERAS, fresh=True)
     slots = _normalize_camera_slots(cameras, cfg.get("camera_slots"))
     cfg["camera_inventory"] = cameras
     cfg["camera_slots"] = slots
@@ -5883,6 +7287,7 @@ def camera_mode_start():
         return redirect(url_for("index", msg=t("camera.none_connected", "Keine Kamera erkannt. Bitte Kamera anschließen und erneut versuchen.")))
 
     subprocess.run(["systemctl", "stop", AUTODARTS_SERVICE], capture_output=True, text=True)
+    _invalidate("autodarts_active")
     subprocess.run(["pkill", "-f", "mjpg_streamer"], capture_output=True, text=True)
 
     _set_camera_mode_state(cfg, True)
@@ -5896,6 +7301,7 @@ def camera_mode_end():
     """Kamera-Einstellung beenden: Streams stoppen, Autodarts neu starten, Flag zurücksetzen."""
     subprocess.run(["pkill", "-f", "mjpg_streamer"], capture_output=True, text=True)
     subprocess.run(["systemctl", "restart", AUTODARTS_SERVICE], capture_output=True, text=True)
+    _invalidate("autodarts_active")
 
     cfg = load_cam_config()
     _set_camera_mode_state(cfg, False)
@@ -6009,118 +7415,116 @@ def wifi():
 
         if not ssid:
             message = t("wifi.enter_ssid", "Bitte WLAN-Namen (SSID) eingeben.")
+        elif not _NM_MUTATE_LOCK.acquire(blocking=False):
+            message = t("wifi.busy", "Das WLAN ist gerade beschäftigt (Verbindung wird auf-/abgebaut). Bitte kurz warten und erneut versuchen.")
         else:
-            # 1) Nur den WLAN-USB-Dongle weich zurücksetzen
-            soft_reset_wifi_dongle()
-
-            # 2) Alte Verbindung löschen (wenn vorhanden) – Fehler ignorieren
-            subprocess.run(
-                ["nmcli", "connection", "delete", WIFI_CONNECTION_NAME],
-                capture_output=True,
-                text=True,
-            )
-
-            # 3) Neue Verbindung anlegen (mit unserem WLAN-Stick als Interface)
-            add = subprocess.run(
-                [
-                    "nmcli",
-                    "connection",
-                    "add",
-                    "type",
-                    "wifi",
-                    "ifname",
-                    WIFI_INTERFACE,
-                    "con-name",
-                    WIFI_CONNECTION_NAME,
-                    "ssid",
-                    ssid,
-                ],
-                capture_output=True,
-                text=True,
-            )
+            try:
+                # 1) Nur den WLAN-USB-Dongle weich zurücksetzen
+                soft_reset_wifi_dongle()
 
-            if add.returncode != 0:
-                message = t("wifi.create_connection_failed", "Fehler beim Anlegen der WLAN-Verbindung: {error}", error=interpret_nmcli_error(add.stdout, add.stderr))
-            else:
-                # 4) Passwort + IP-Konfiguration setzen
+                # 2) Alte Verbindung löschen (wenn vorhanden) – Fehler ignorieren
                 subprocess.run(
-                    [
-                        "nmcli",
-                        "connection",
-                        "modify",
-                        WIFI_CONNECTION_NAME,
-                        "wifi-sec.key-mgmt",
-                        "wpa-psk",
-                        "wifi-sec.psk",
-                        password,
-                    ],
+                    ["nmcli", "connection", "delete", WIFI_CONNECTION_NAME],
                     capture_output=True,
                     text=True,
                 )
-                subprocess.run(
+
+                # 3) Neue Verbindung anlegen (mit unserem WLAN-Stick als Interface)
+                add = subprocess.run(
                     [
                         "nmcli",
                         "connection",
-                        "modify",
+                        "add",
+                        "type",
+                        "wifi",
+                        "ifname",
+                        WIFI_INTERFACE,
+                        "con-name",
                         WIFI_CONNECTION_NAME,
-                        "ipv4.method",
-                        "auto",
-                        "ipv6.method",
-                        "ignore",
+                        "ssid",
+                        ssid,
                     ],
                     capture_output=True,
                     text=True,
                 )
 
-                # 5) Erster Verbindungsversuch
-                up = subprocess.run(
-                    ["nmcli", "connection", "up", WIFI_CONNECTION_NAME],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if up.returncode == 0:
-                    message = t("wifi.connected_successfully", "Erfolgreich mit WLAN verbunden.")
-                    success = True
+                if add.returncode != 0:
+                    message = t("wifi.create_connection_failed", "Fehler beim Anlegen der WLAN-Verbindung: {error}", error=interpret_nmcli_error(add.stdout, add.stderr))
                 else:
-                    err_text_full = (up.stderr or up.stdout or "")
-                    err_lower = err_text_full.lower()
-
-                    device_error = (
-                        "no suitable device" in err_lower
-                        or "no wifi device" in err_lower
-                        or "no device" in err_lower
-                        or "device not available because profile is not compatible" in err_lower
-                        or "profile is not compatible with device" in err_lower
-                        or "mismatching interface name" in err_lower
+                    # 4) Passwort + IP-Konfiguration setzen
+                    subprocess.run(
+                        [
+                            "nmcli",
+                            "connection",
+                            "modify",
+                            WIFI_CONNECTION_NAME,
+                            "wifi-sec.key-mgmt",
+                            "wpa-psk",
+                            "wifi-sec.psk",
+                            password,
+                        ],
+                        capture_output=True,
+                        text=True,
+                    )
+                    subprocess.run(
+                        [
+                            "nmcli",
+                            "connection",
+                            "modify",
+                            WIFI_CONNECTION_NAME,
+                            "ipv4.method",
+                            "auto",
+                            "ipv6.method",
+                            "ignore",
+                        ],
+                        capture_output=True,
+                        text=True,
                     )
 
-                    if device_error:
-                        soft_reset_wifi_dongle()
-                        up2 = subprocess.run(
-                            ["nmcli", "connection", "up", WIFI_CONNECTION_NAME],
-                            capture_output=True,
-                            text=True,
-                        )
-
-                        if up2.returncode == 0:
-                            message = t(
-                                "wifi.retry_success_after_reset",
-                                "Verbindung fehlgeschlagen, wird erneut versucht ...\nDer zweite Versuch war erfolgreich. (Hinweis: WLAN-USB-Stick wurde kurz neu initialisiert.)"
+                    # 5) Erster Verbindungsversuch
+                    up = subprocess.run(
+                        ["nmcli", "connection", "up", WIFI_CONNECTION_NAME],
+                        capture_output=True,
+                        text=True,
+                    )
+
+                    if up.returncode == 0:
+                        message = t("wifi.connected_successfully", "Erfolgreich mit WLAN verbunden.")
+                        success = True
+                    else:
+                        err_text_full = (up.stderr or up.stdout or "")
+
+                        if _NMCLI_DEVICE_ERROR_RE.search(err_text_full):
+                            soft_reset_wifi_dongle()
+                            up2 = subprocess.run(
+                                ["nmcli", "connection", "up", WIFI_CONNECTION_NAME],
+                                capture_output=True,
+                                text=True,
                             )
-                            success = True
+
+                            if up2.returncode == 0:
+                                message = t(
+                                    "wifi.retry_success_after_reset",
+                                    "Verbindung fehlgeschlagen, wird erneut versucht ...\nDer zweite Versuch war erfolgreich. (Hinweis: WLAN-USB-Stick wurde kurz neu initialisiert.)"
+                                )
+                                success = True
+                            else:
+                                message = t(
+                                    "wifi.retry_failed_after_reset",
+                                    "Verbindung fehlgeschlagen, wird erneut versucht ...\nAuch der zweite Versuch ist fehlgeschlagen: {error}",
+                                    error=interpret_nmcli_error(up2.stdout, up2.stderr),
+                                )
                         else:
-                            message = t(
-                                "wifi.retry_failed_after_reset",
-                                "Verbindung fehlgeschlagen, wird erneut versucht ...\nAuch der zweite Versuch ist fehlgeschlagen: {error}",
-                                error=interpret_nmcli_error(up2.stdout, up2.stderr),
-                            )
-                    else:
-                        message = t("wifi.connect_failed", "Verbindung konnte nicht hergestellt werden: {error}", error=interpret_nmcli_error(up.stdout, up.stderr))
+                            message = t("wifi.connect_failed", "Verbindung konnte nicht hergestellt werden: {error}", error=interpret_nmcli_error(up.stdout, up.stderr))
+            finally:
+                _NM_MUTATE_LOCK.release()
+
+        _invalidate("wifi_status", "wifi_active_conn", "default_route")
 
     # Aktuellen Status des WLAN-Dongles anzeigen
     ssid_cur, ip_cur = get_wifi_status()
-    wifi_signal = get_wifi_signal_percent()
+    # Signal nur abfragen, wenn überhaupt ein WLAN verbunden ist
+    wifi_signal = get_wifi_signal_percent() if ssid_cur else None
     if ssid_cur and ip_cur:
         current_info = t("wifi.current_info_connected", "Aktuell verbunden mit <strong>{ssid}</strong> (IP {ip})", ssid=ssid_cur, ip=ip_cur) + (t("wifi.current_info_signal", " · Signal: <strong>{signal}%</strong>.", signal=wifi_signal) if wifi_signal is not None else ".")
     elif ssid_cur and not ip_cur:
@@ -6145,10 +7549,15 @@ def wifi():
 
 # ---------------- WLAN Tools (Autoconnect / gespeicherte WLANs löschen) ----------------
 
+@_ttl_cache("wifi_active_conn")
 def _active_wifi_connection_name(iface: str) -> str | None:
     """
     Gibt den aktuell aktiven Connection-Namen auf dem Interface zurück (z.B. für Autoconnect Toggle).
     """
+    res = _nm_query(lambda client: _nm_active_connection_name(client, iface))
+    if res is not _NM_UNAVAILABLE:
+        return res
+
     try:
         r = subprocess.run(
             ["nmcli", "-t", "-f", "GENERAL.CONNECTION", "dev", "show", iface],
@@ -6173,6 +7582,16 @@ def get_active_wifi_autoconnect_state() -> tuple[str | None, bool | None]:
     conn = _active_wifi_connection_name(WIFI_INTERFACE)
     if not conn:
         return None, None
+
+    def _nm_autoconnect(client) -> bool | None:
+        c = client.get_connection_by_id(conn)
+        s_con = c.get_setting_connection() if c is not None else None
+        return bool(s_con.get_autoconnect()) if s_con is not None else None
+
+    res = _nm_query(_nm_autoconnect)
+    if res is not _NM_UNAVAILABLE:
+        return conn, res
+
     try:
         r = subprocess.run(
             ["nmcli", "-g", "connection.autoconnect", "connection", "show", conn],
@@ -6204,11 +7623,16 @@ def wifi_autoconnect(mode: str):
         flash(t("wifi.no_active_profile_on_uplink", "Kein aktives WLAN-Profil auf dem Internet-WLAN-Interface gefunden."), "warning")
         return redirect(url_for("wifi"))
 
+    if is_wifi_busy():
+        flash(t("wifi.busy", "Das WLAN ist gerade beschäftigt (Verbindung wird auf-/abgebaut). Bitte kurz warten und erneut versuchen."), "warning")
+        return redirect(url_for("wifi"))
+
     try:
         cmd = ["nmcli", "connection", "modify", conn, "connection.autoconnect", ("yes" if enable else "no")]
         if os.geteuid() != 0:
             cmd = ["sudo", "-n"] + cmd
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=6.0)
+        with _NM_MUTATE_LOCK:
+            r = subprocess.run(cmd, capture_output=True, text=True, timeout=6.0)
         if r.returncode == 0:
             flash(t("wifi.autoconnect_set", "Autoconnect {state} für: {conn}", state=(t("generic.enabled", "aktiviert") if enable else t("generic.disabled", "deaktiviert")), conn=conn), "success")
         else:
@@ -6255,8 +7679,10 @@ def wifi_forget_saved():
             cmd = ["nmcli", "connection", "delete", name]
             if os.geteuid() != 0:
                 cmd = ["sudo", "-n"] + cmd
-            subprocess.run(cmd, capture_output=True, text=True, timeout=6.0)
+            with _NM_MUTATE_LOCK:
+                subprocess.run(cmd, capture_output=True, text=True, timeout=6.0)
             deleted.append(name)
+        _invalidate("wifi_status", "wifi_active_conn", "default_route")
 
         if deleted:
             flash(t("wifi.saved_connections_deleted", "Gespeicherte WLAN-Verbindungen gelöscht: {names}", names=", ".join(deleted)), "success")
@@ -6304,7 +7730,7 @@ def autoupdate_set(mode: str):
     # Service fehlt -> via Installer (re)erstellen
     ver = get_autodarts_version() or ""
     ver = (ver or "").strip().lstrip("v")
-    if ver and not re.match(r"^\d+\.\d+\.\d+(?:-(?:beta|alpha)\.\d+)?$", ver):
+    if ver and not _SEMVER_RE.match(ver):
         ver = ""  # lieber nichts erzwingen
 
     if ver:
@@ -6431,6 +7857,23 @@ def wifi_ping_start():
     return jsonify({"ok": bool(ok), "msg": msg, "job_id": job_id, "iface_label": iface_label})
 
 
+def _ping_status_payload(job: dict) -> dict:
+    return {
+        "ok": True,
+        "target": job.get("target"),
+        "iface": job.get("iface"),
+        "iface_label": job.get("iface_label"),
+        "count": job.get("count", 30),
+        "progress": job.get("progress", 0),
+        "received": job.get("received", 0),
+        "done": bool(job.get("done", False)),
+        "min_ms": job.get("min_ms"),
+        "max_ms": job.get("max_ms"),
+        "avg_ms": job.get("avg_ms"),
+        "error": job.get("error"),
+    }
+
+
 @app.route("/wifi/ping/status/<job_id>", methods=["GET"])
 def wifi_ping_status(job_id: str):
     job = PING_JOBS.get(job_id)
@@ -6440,24 +7883,42 @@ def wifi_ping_status(job_id: str):
     # Auto-cleanup nach 15min
     try:
         if time.time() - float(job.get("started", 0)) > 900:
+            job["cancel"] = True
             PING_JOBS.pop(job_id, None)
     except Exception:
         pass
 
-    return jsonify({
-        "ok": True,
-        "target": job.get("target"),
-        "iface": job.get("iface"),
-        "iface_label": job.get("iface_label"),
-        "count": job.get("count", 30),
-        "progress": job.get("progress", 0),
-        "received": job.get("received", 0),
-        "done": bool(job.get("done", False)),
-        "min_ms": job.get("min_ms"),
-        "max_ms": job.get("max_ms"),
-        "avg_ms": job.get("avg_ms"),
-        "error": job.get("error"),
-    })
+    return _jsonify_fast(_ping_status_payload(job))
+
+
+@app.route("/wifi/ping/stream/<job_id>", methods=["GET"])
+def wifi_ping_stream(job_id: str):
+    """Server-Sent Events: ein Frame je Fortschritt (Paket gesendet/empfangen), Ende nach done."""
+    job = PING_JOBS.get(job_id)
+    if not job:
+        return jsonify({"ok": False, "msg": t("jobs.not_found", "Job nicht gefunden.")}), 404
+    cond = job.get("changed") or threading.Condition()
+
+    def generate():
+        last = None
+        until = time.monotonic() + PING_STREAM_MAX_SEC
+        while True:
+            with cond:
+                st = _ping_status_payload(job)
+                if st == last and not st["done"]:
+                    if time.monotonic() >= until:
+                        return
+                    cond.wait(1.0)
+                    continue
+            yield f"data: {json.dumps(st)}\n\n"
+            last = st
+            if st["done"] or time.monotonic() >= until:
+                return
+
+    resp = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
 
 @app.route("/wifi/ping/ui", methods=["GET"])
 def wifi_ping_ui():
@@ -6471,14 +7932,14 @@ def ap_config():
     success = False
     current_ssid = get_ap_ssid()
     ap_choices = AP_SSID_CHOICES
-    selected_ssid = current_ssid if (current_ssid in ap_choices) else (ap_choices[0] if ap_choices else "")
+    selected_ssid = current_ssid if (current_ssid in AP_SSID_CHOICES_SET) else (ap_choices[0] if ap_choices else "")
 
     if request.method == "POST":
         new_ssid = (request.form.get("ap_ssid_select") or "").strip()
 
         if not new_ssid:
             message = t("ap.select_name", "Bitte einen Access-Point-Namen auswählen.")
-        elif new_ssid not in ap_choices:
+        elif new_ssid not in AP_SSID_CHOICES_SET:
             message = t("generic.invalid_selection", "Ungültige Auswahl. Bitte einen Namen aus der Liste wählen.")
         elif len(new_ssid) > 32:
             message = t("ap.name_too_long", "Der Access-Point-Name ist zu lang (max. 32 Zeichen).")
@@ -6491,10 +7952,16 @@ def ap_config():
             if res.returncode != 0:
                 message = t("ap.rename_failed", "Fehler beim Ändern des Access-Point-Namens: {error}", error=interpret_nmcli_error(res.stdout, res.stderr))
             else:
-                subprocess.run(["nmcli", "connection", "down", AP_CONNECTION_NAME], capture_output=True, text=True)
-                subprocess.run(["nmcli", "connection", "up", AP_CONNECTION_NAME], capture_output=True, text=True)
+                # "up" auf eine aktive Verbindung baut sie neu auf (NM trennt die alte Aktivierung selbst):
+                # ein nmcli-Prozess statt down + up, kein Zwischenzustand, in dem der AP ohne "up" bleibt
+                subprocess.run(
+                    ["nmcli", "connection", "up", AP_CONNECTION_NAME],
+                    capture_output=True,
+                    text=True,
+                )
                 success = True
                 current_ssid = new_ssid
+                _invalidate("ap_ssid")
                 message = t("ap.renamed", "Access-Point-Name wurde geändert auf „{ssid}“.", ssid=new_ssid)
 
     return render_template(
@@ -6603,8 +8070,12 @@ def cam_view(cam_id: int):
                     "-o",
                     f"output_http.so -p {port}",
                 ],
+                # eigene Session + keine geerbten FDs (z.B. Listening-Socket des Webpanels)
+                stdin=subprocess.DEVNULL,
                 stdout=logf,
                 stderr=logf,
+                close_fds=True,
+                start_new_session=True,
             )
 
         time.sleep(0.3)
@@ -6713,5 +8184,33 @@ def admin_journal_stream():
     resp.headers["X-Accel-Buffering"] = "no"
     return resp
 
+try:
+    WEB_THREADS = max(1, int(os.environ.get("AUTODARTS_WEB_THREADS", "8") or 8))
+except ValueError:
+    print(f"[autodarts-web] Warnung: AUTODARTS_WEB_THREADS ungültig ({os.environ.get('AUTODARTS_WEB_THREADS')!r}), nutze 8")
+    WEB_THREADS = 8
+
+
+def _warm_templates() -> None:
+    """Alle Templates einmal kompilieren, damit der erste Seitenaufruf nicht Jinja parsen muss (index.html ~58 KB)."""
+    try:
+        names = app.jinja_env.list_templates(extensions=["html"])
+    except Exception:
+        return
+    for name in names:
+        try:
+            app.jinja_env.get_template(name)
+        except Exception:
+            pass
+
+
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=80)
+    threading.Thread(target=_warm_templates, name="tmpl-warm", daemon=True).start()
+    # Produktiv-WSGI-Server (mehrere Threads, damit lange nmcli/systemctl-Requests die UI nicht blockieren).
+    # Fallback auf den Werkzeug-Server, falls waitress (python3-waitress) nicht installiert ist.
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host="0.0.0.0", port=80, threaded=True)
+    else:
+        serve(app, host="0.0.0.0", port=80, threads=WEB_THREADS)
@@ -104,9 +104,17 @@ function initWledUi(appUrls) {
     } catch (e) {}
   }
 
+  let refreshTimer = null;
+  let refreshCtrl = null;
+
   async function refresh() {
+    // Nur die neueste Abfrage zählt: eine noch laufende wird abgebrochen
+    if (refreshCtrl) refreshCtrl.abort();
+    const ctrl = new AbortController();
+    refreshCtrl = ctrl;
     try {
-      const r = await fetch(statusUrl, { cache: 'no-store' });
+      // no-cache: Browser schickt If-None-Match, bei 304 kommt die gespeicherte Antwort zurück
+      const r = await fetch(statusUrl, { cache: 'no-cache', signal: ctrl.signal });
       const data = await r.json();
 
       (data.bands || []).forEach((b) => {
@@ -117,7 +125,19 @@ function initWledUi(appUrls) {
       });
 
       storeReachableTargets(data);
-    } catch (e) {}
+    } catch (e) {
+    } finally {
+      if (refreshCtrl === ctrl) refreshCtrl = null;
+    }
+  }
+
+  // Mehrere Schalter kurz hintereinander -> eine Abfrage 300ms nach dem letzten
+  function scheduleRefresh() {
+    if (refreshTimer) clearTimeout(refreshTimer);
+    refreshTimer = setTimeout(() => {
+      refreshTimer = null;
+      refresh();
+    }, 300);
   }
 
   refresh();
@@ -202,7 +222,7 @@ function initWledUi(appUrls) {
         }
       } finally {
         cb.disabled = false;
-        setTimeout(refresh, 250);
+        scheduleRefresh();
       }
     });
   });
@@ -223,7 +243,7 @@ function initPiMonitorUi(appData) {
     return;
   }
 
-  let pollTimer = null;
+  let es = null;
 
   function fmtSeconds(s) {
     s = Math.max(0, Number(s || 0));
@@ -279,16 +299,32 @@ function initPiMonitorUi(appData) {
     }
   }
 
-  function startPolling() {
-    if (pollTimer) return;
+  function closeStream() {
+    if (es) {
+      try { es.close(); } catch (e) {}
+      es = null;
+    }
+  }
 
-    pollTimer = setInterval(async () => {
-      const st = await fetchStatus();
-      if (!st || !st.running) {
-        clearInterval(pollTimer);
-        pollTimer = null;
-      }
-    }, 5000);
+  // Server schickt den Status nur bei Änderung und beendet den Stream, wenn der Test nicht mehr läuft
+  function startStream() {
+    if (es) return;
+
+    es = new EventSource('/api/pi_monitor/stream');
+    es.onmessage = (ev) => {
+      let st = null;
+      try { st = JSON.parse(ev.data); } catch (e) { return; }
+      setRunningUI(st);
+      if (!st || !st.running) closeStream();
+    };
+    es.onerror = () => {
+      // Verbindung weg / Stream-Laufzeit abgelaufen: einmal per fetch prüfen, bei laufendem Test neu verbinden
+      closeStream();
+      setTimeout(async () => {
+        const st = await fetchStatus();
+        if (st && st.running) startStream();
+      }, 2000);
+    };
   }
 
   startBtn.addEventListener('click', async () => {
@@ -319,7 +355,7 @@ function initPiMonitorUi(appData) {
       }
 
       setRunningUI(st);
-      startPolling();
+      startStream();
     } catch (e) {
       setRunningUI({
         running: false,
@@ -350,7 +386,7 @@ function initPiMonitorUi(appData) {
 
   const initial = appData.pi_mon_status || null;
   setRunningUI(initial);
-  if (initial && initial.running) startPolling();
+  if (initial && initial.running) startStream();
 }
 
 
@@ -372,6 +408,7 @@ function initPingUi() {
   }
 
   let pingTimer = null;
+  let pingEs = null;
   let pingRunning = false;
   let pollTries = 0;
 
@@ -418,6 +455,10 @@ function initPingUi() {
       clearInterval(pingTimer);
       pingTimer = null;
     }
+    if (pingEs) {
+      try { pingEs.close(); } catch (e) {}
+      pingEs = null;
+    }
   }
 
   function classifyPingQuality(s, total, recv) {
@@ -453,6 +494,98 @@ function initPingUi() {
     return { level: 'nicht_spielbar', label: tr('ping.quality_bad', 'Nicht mehr spielbar'), loss };
   }
 
+  // Status verarbeiten (Stream oder Polling)
+  function handleStatus(s, total) {
+    if (!s.ok) {
+      stopPolling();
+      titleEl.textContent = tr('ping.failed_title', 'Verbindungstest fehlgeschlagen');
+      txt.textContent = s.msg || tr('ping.status_error', 'Fehler beim Status.');
+      out.textContent = s.msg || tr('common.error', 'Fehler');
+      setBusy(false);
+      return;
+    }
+
+    const prog = Number(s.progress || 0);
+    const recv = Number(s.received || 0);
+
+    txt.textContent = tr('ping.progress', '{prog} von {total} Paketen… (empfangen: {recv})', {
+      prog: prog,
+      total: total,
+      recv: recv
+    });
+
+    setProgress(prog, total);
+
+    if (s.done) {
+      stopPolling();
+
+      const sent = Number(s.count || total);
+      const q = classifyPingQuality(s, total, recv);
+
+      let result = tr('ping.result_received', '{recv} von {sent} Paketen wurden erfolgreich empfangen.', {
+        recv: recv,
+        sent: sent
+      });
+
+      if (q.loss != null) {
+        result += '\n' + tr('ping.packet_loss', 'Paketverlust: {loss}%', {
+          loss: q.loss
+        });
+      }
+
+      if (s.min_ms != null && s.max_ms != null && s.avg_ms != null) {
+        result += '\n' + tr('ping.stats', 'Schnellstes: {min} ms · Langsamstes: {max} ms · Durchschnitt: {avg} ms', {
+          min: s.min_ms,
+          max: s.max_ms,
+          avg: s.avg_ms
+        });
+      }
+
+      if (s.error) {
+        result += '\n' + tr('ping.note', 'Hinweis: {error}', {
+          error: s.error
+        });
+      }
+
+      const via = (s && s.iface_label) ? (String(s.iface_label) + '\n') : '';
+
+      out.textContent = q && q.label
+        ? via + tr('ping.quality_result', 'Verbindungsqualität: {label}', { label: q.label }) + '\n' + result
+        : via + result;
+
+      titleEl.textContent = tr('ping.completed_title', 'Verbindungstest abgeschlossen');
+      txt.textContent = tr('ping.completed_text', 'TEST erfolgreich durchgeführt. Ergebnis: {label}', {
+        label: q && q.label ? q.label : tr('common.unknown', 'Unbekannt')
+      });
+
+      setProgress(total, total);
+      setBusy(false);
+    }
+  }
+
+  function pollStatus(jobId, total) {
+    pingTimer = setInterval(async () => {
+      pollTries += 1;
+
+      try {
+        const rs = await fetch('/wifi/ping/status/' + jobId, { cache: 'no-store' });
+        const s = await rs.json().catch(() => ({
+          ok: false,
+          msg: tr('ping.invalid_response', 'Ungültige Antwort')
+        }));
+        handleStatus(s, total);
+      } catch (e) {
+        if (pollTries > 120) {
+          stopPolling();
+          titleEl.textContent = tr('ping.aborted_title', 'Verbindungstest abgebrochen');
+          txt.textContent = tr('ping.timeout', 'Timeout.');
+          out.textContent = tr('ping.timeout_result', 'Verbindungstest abgebrochen (Timeout).');
+          setBusy(false);
+        }
+      }
+    }, 600);
+  }
+
   async function startPing() {
     if (pingRunning) return;
 
@@ -483,91 +616,22 @@ function initPingUi() {
       const jobId = j.job_id;
       const total = 30;
 
-      pingTimer = setInterval(async () => {
-        pollTries += 1;
-
-        try {
-          const rs = await fetch('/wifi/ping/status/' + jobId, { cache: 'no-store' });
-          const s = await rs.json().catch(() => ({
-            ok: false,
-            msg: tr('ping.invalid_response', 'Ungültige Antwort')
-          }));
-
-          if (!s.ok) {
-            stopPolling();
-            titleEl.textContent = tr('ping.failed_title', 'Verbindungstest fehlgeschlagen');
-            txt.textContent = s.msg || tr('ping.status_error', 'Fehler beim Status.');
-            out.textContent = s.msg || tr('common.error', 'Fehler');
-            setBusy(false);
-            return;
-          }
-
-          const prog = Number(s.progress || 0);
-          const recv = Number(s.received || 0);
-
-          txt.textContent = tr('ping.progress', '{prog} von {total} Paketen… (empfangen: {recv})', {
-            prog: prog,
-            total: total,
-            recv: recv
-          });
-
-          setProgress(prog, total);
-
-          if (s.done) {
-            stopPolling();
-
-            const sent = Number(s.count || total);
-            const q = classifyPingQuality(s, total, recv);
-
-            let result = tr('ping.result_received', '{recv} von {sent} Paketen wurden erfolgreich empfangen.', {
-              recv: recv,
-              sent: sent
-            });
-
-            if (q.loss != null) {
-              result += '\n' + tr('ping.packet_loss', 'Paketverlust: {loss}%', {
-                loss: q.loss
-              });
-            }
-
-            if (s.min_ms != null && s.max_ms != null && s.avg_ms != null) {
-              result += '\n' + tr('ping.stats', 'Schnellstes: {min} ms · Langsamstes: {max} ms · Durchschnitt: {avg} ms', {
-                min: s.min_ms,
-                max: s.max_ms,
-                avg: s.avg_ms
-              });
-            }
-
-            if (s.error) {
-              result += '\n' + tr('ping.note', 'Hinweis: {error}', {
-                error: s.error
-              });
-            }
-
-            const via = (s && s.iface_label) ? (String(s.iface_label) + '\n') : '';
-
-            out.textContent = q && q.label
-              ? via + tr('ping.quality_result', 'Verbindungsqualität: {label}', { label: q.label }) + '\n' + result
-              : via + result;
-
-            titleEl.textContent = tr('ping.completed_title', 'Verbindungstest abgeschlossen');
-            txt.textContent = tr('ping.completed_text', 'TEST erfolgreich durchgeführt. Ergebnis: {label}', {
-              label: q && q.label ? q.label : tr('common.unknown', 'Unbekannt')
-            });
-
-            setProgress(total, total);
-            setBusy(false);
-          }
-        } catch (e) {
-          if (pollTries > 120) {
-            stopPolling();
-            titleEl.textContent = tr('ping.aborted_title', 'Verbindungstest abgebrochen');
-            txt.textContent = tr('ping.timeout', 'Timeout.');
-            out.textContent = tr('ping.timeout_result', 'Verbindungstest abgebrochen (Timeout).');
-            setBusy(false);
-          }
-        }
-      }, 600);
+      // Fortschritt per Server-Sent Events (ein Frame je Paket); bei Fehler auf Polling zurückfallen
+      if (window.EventSource) {
+        pingEs = new EventSource('/wifi/ping/stream/' + encodeURIComponent(jobId));
+        pingEs.onmessage = (ev) => {
+          let s = null;
+          try { s = JSON.parse(ev.data); } catch (e) { return; }
+          handleStatus(s, total);
+        };
+        pingEs.onerror = () => {
+          if (!pingRunning) return;
+          stopPolling();
+          pollStatus(jobId, total);
+        };
+      } else {
+        pollStatus(jobId, total);
+      }
     } catch (e) {
       stopPolling();
       titleEl.textContent = tr('ping.failed_title', 'Verbindungstest fehlgeschlagen');
@@ -634,3 +698,38 @@ async function fetchWifiSignal() {
 }
 
 window.fetchWifiSignal = fetchWifiSignal;
+
+
+/* =========================================================
+   7) Mini-PC Werte (CPU/RAM/Temp) nachladen
+   ========================================================= */
+async function fetchSysinfo() {
+  const appUrls = window.app_urls || {};
+  if (!appUrls.api_sysinfo) return;
+
+  const show = (rowId, outId, text) => {
+    const row = document.getElementById(rowId);
+    const out = document.getElementById(outId);
+    if (!row || !out) return;
+    out.textContent = text;
+    row.hidden = false;
+  };
+
+  try {
+    const r = await fetch(appUrls.api_sysinfo, { cache: 'no-store' });
+    const j = await r.json();
+    if (j.cpu_pct !== null && j.cpu_pct !== undefined) {
+      show('sysinfoCpuRow', 'sysinfoCpu', String(j.cpu_pct));
+    }
+    if (j.mem_used !== null && j.mem_used !== undefined && j.mem_total !== null && j.mem_total !== undefined) {
+      show('sysinfoRamRow', 'sysinfoRam', String(j.mem_used) + ' / ' + String(j.mem_total));
+    }
+    if (j.temp_c !== null && j.temp_c !== undefined) {
+      show('sysinfoTempRow', 'sysinfoTemp', Number(j.temp_c).toFixed(1));
+    }
+  } catch (e) {
+    // Werte bleiben ausgeblendet
+  }
+}
+
+document.addEventListener('DOMContentLoaded', fetchSysinfo);